@@ -5,8 +5,10 @@ Authentication service module for Dispatcher.
 Handles JWT tokens, password hashing, and multi-source authentication (local, OS, LDAP).
 """
 
+import hashlib
 import os
 import sys
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, Tuple
 from passlib.context import CryptContext
@@ -19,6 +21,7 @@ import secrets
 import pam
 import pwd
 from ldap3 import Server, Connection, ALL, NTLM
+from cachetools import TTLCache, cached
 from output import output
 
 # Import models
@@ -35,6 +38,23 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # Security scheme
 security = HTTPBearer()
 
+# Short-TTL cache of verified tokens so repeated requests skip the JWT
+# decode and two session/user queries. Keyed by a truncated token digest;
+# entries expire after 30s so revocations still take effect promptly.
+_token_cache = TTLCache(maxsize=10000, ttl=30)
+_token_cache_lock = threading.Lock()
+
+
+def invalidate_token_cache(user_id: Optional[int] = None):
+    """Drop cached token verifications, optionally only for one user"""
+    with _token_cache_lock:
+        if user_id is None:
+            _token_cache.clear()
+        else:
+            stale = [key for key, user in _token_cache.items() if user.id == user_id]
+            for key in stale:
+                _token_cache.pop(key, None)
+
 
 class LoginRequest(BaseModel):
     """Login request model"""
@@ -111,6 +131,8 @@ class AuthService:
             'operator_group': os.getenv('LDAP_OPERATOR_GROUP', 'operators'),
         }
     
+    # NSS lookups can go to SSSD/LDAP over the network; cache for a minute
+    @cached(cache=TTLCache(maxsize=512, ttl=60), lock=threading.Lock())
     def validate_os_user(self, username: str) -> Optional[dict]:
         """Validate OS user exists and get user information"""
         try:
@@ -468,20 +490,30 @@ def get_current_user(
         )
     
     token = credentials.credentials
-    
+    token_hash = hashlib.sha256(token.encode()).digest()[:16]
+
+    # Serve recently verified tokens from the cache
+    with _token_cache_lock:
+        cached_user = _token_cache.get(token_hash)
+    if cached_user is not None:
+        return cached_user
+
     with db.get_session() as session:
         user = auth.get_current_user(session, token)
-        
+
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid authentication credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        
+
         # Detach from session to avoid issues
         session.expunge(user)
-        
+
+    with _token_cache_lock:
+        _token_cache[token_hash] = user
+
     return user
 
 
@@ -32,6 +32,16 @@ class DatabaseConfigUpdateRequest(BaseModel):
     USE_MANAGED_IDENTITY: Optional[str] = Field(None, pattern=r'^(true|false)$')
     PG_MANAGED_IDENTITY_USER: Optional[str] = None
 
+# Connection pool sizing for the server databases. pre_ping drops dead
+# connections before handing them out; recycle stays under common
+# firewall/server idle timeouts.
+POOL_OPTIONS = {
+    'pool_size': 20,
+    'max_overflow': 40,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+}
+
 class Database:
     def __init__(self):
         self.opened = False
@@ -206,7 +216,7 @@ class Database:
             else:
                 DATABASE_URL = f"mysql+pymysql://{host}:{port}/{db}"
                 
-            self.engine = create_engine(DATABASE_URL)
+            self.engine = create_engine(DATABASE_URL, **POOL_OPTIONS)
             os.environ['DB_TYPE'] = 'mysql'
             output.info(f"Connected to MySQL at {host}:{port}/{db}")
             
@@ -256,7 +266,7 @@ class Database:
                 DATABASE_URL = f"postgresql://{pg_host}:{pg_port}/{pg_db}?sslmode={sslmode}&options=-csearch_path%3D{pg_schema}"
                 output.warning("No PostgreSQL credentials provided - connection may fail")
             
-            self.engine = create_engine(DATABASE_URL)
+            self.engine = create_engine(DATABASE_URL, **POOL_OPTIONS)
             os.environ['DB_TYPE'] = 'postgresql'
             output.info(f"Connected to PostgreSQL at {pg_host}:{pg_port}/{pg_db}")
 
@@ -0,0 +1,215 @@
+
+import asyncio
+from threading import Lock
+
+
+class ChangeBus:
+    """Cross-thread change notifications for the SSE streams.
+
+    Mutation paths (job/queue create, update, status change) call notify()
+    after their commit; the SSE generators await the matching event instead
+    of re-querying the database on a fixed poll interval.
+
+    asyncio.Event is not thread-safe and binds to a loop, so the bus lazily
+    captures the server's event loop the first time a stream subscribes and
+    marshals set() onto it with call_soon_threadsafe - mutations routinely
+    happen off-loop (dispatcher thread, logger consumer, request threadpool).
+    """
+
+    JOBS = 'jobs'
+    QUEUES = 'queues'
+
+    def __init__(self):
+        self._lock = Lock()
+        self._loop = None
+        self._events = {}
+
+    def event(self, name: str) -> asyncio.Event:
+        """Get the change event for a resource type.
+
+        Must be called from the event loop - binds the bus to that loop the
+        first time so notify() can wake waiters from any thread.
+        """
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.get_running_loop()
+            event = self._events.get(name)
+            if event is None:
+                event = self._events[name] = asyncio.Event()
+            return event
+
+    def notify(self, name: str):
+        """Signal that a resource type changed - safe to call from any thread"""
+        with self._lock:
+            loop = self._loop
+            event = self._events.get(name)
+        if loop is None or event is None:
+            # No stream has subscribed yet - nothing to wake
+            return
+        loop.call_soon_threadsafe(event.set)
+
+
+class EventWaiter:
+    """Wait on a change event with a heartbeat timeout.
+
+    asyncio.wait_for(event.wait(), timeout) raises TimeoutError on every
+    heartbeat tick, which at hundreds of idle SSE clients is constant
+    exception allocation and traceback capture. This waits on an
+    event-wait task and a heartbeat-sleep task with FIRST_COMPLETED so
+    neither path raises, and keeps both tasks alive across iterations,
+    recreating only the one that fired.
+    """
+
+    def __init__(self, event: asyncio.Event, heartbeat: float = 30):
+        self._event = event
+        self._heartbeat = heartbeat
+        self._wait_task = None
+        self._hb_task = None
+
+    async def wait(self) -> bool:
+        """Block until the event fires or the heartbeat interval elapses.
+
+        Returns True on a pure heartbeat timeout, False when the event
+        fired (the event is cleared before returning).
+        """
+        if self._wait_task is None:
+            self._wait_task = asyncio.ensure_future(self._event.wait())
+        if self._hb_task is None:
+            self._hb_task = asyncio.ensure_future(asyncio.sleep(self._heartbeat))
+
+        done, _ = await asyncio.wait(
+            {self._wait_task, self._hb_task},
+            return_when=asyncio.FIRST_COMPLETED
+        )
+
+        if self._wait_task in done:
+            self._event.clear()
+            self._wait_task = None
+        if self._hb_task in done:
+            self._hb_task = None
+        # A change beats a simultaneous heartbeat
+        return self._wait_task is not None
+
+    def close(self):
+        """Cancel outstanding tasks when the stream ends"""
+        for task in (self._wait_task, self._hb_task):
+            if task is not None:
+                task.cancel()
+        self._wait_task = None
+        self._hb_task = None
+
+
+class Broadcaster:
+    """Share one producer loop across every SSE client on the same stream.
+
+    K clients watching the same filter tuple otherwise run K identical
+    query loops against the database. The first subscriber starts the
+    owner-supplied run(broadcaster) task, which queries once per wakeup
+    and publishes each frame to every subscriber queue; the task is
+    cancelled when the last subscriber disconnects. Slow clients get
+    drop-oldest treatment instead of unbounded buffering.
+    """
+
+    queue_size = 16
+    # A client this far behind is not coming back - close it instead of
+    # shovelling frames into a queue it never drains
+    max_consecutive_drops = 8
+
+    def __init__(self, run, on_stop=None):
+        self._run = run
+        self._on_stop = on_stop
+        self._subscribers = []
+        self._drop_counts = {}
+        self._task = None
+        self._stopped = False
+        self.last_frame = None
+
+    def _stop(self):
+        if self._stopped:
+            return
+        self._stopped = True
+        if self._on_stop is not None:
+            self._on_stop()
+
+    def publish(self, frame):
+        """Queue a frame to every subscriber, dropping their oldest
+        pending frame when they can't keep up.
+
+        Frames are encoded to bytes here, once - every subscriber then
+        yields the same bytes object and the response layer writes it
+        straight to the socket instead of re-encoding per client.
+
+        A subscriber that keeps dropping gets a close frame and is
+        unsubscribed, bounding memory regardless of client speed.
+        """
+        if isinstance(frame, str):
+            frame = frame.encode()
+        self.last_frame = frame
+        for q in list(self._subscribers):
+            try:
+                q.put_nowait(frame)
+            except asyncio.QueueFull:
+                drops = self._drop_counts.get(q, 0) + 1
+                if drops >= self.max_consecutive_drops:
+                    # Persistent backpressure - cut the client loose
+                    while not q.empty():
+                        q.get_nowait()
+                    q.put_nowait(b"event: close\ndata: backpressure\n\n")
+                    q.put_nowait(None)
+                    self._subscribers.remove(q)
+                    self._drop_counts.pop(q, None)
+                    continue
+                self._drop_counts[q] = drops
+                try:
+                    q.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                q.put_nowait(frame)
+            else:
+                self._drop_counts.pop(q, None)
+
+    def close(self):
+        """Producer is done - end every subscriber stream"""
+        self._stop()
+        for q in list(self._subscribers):
+            if q.full():
+                try:
+                    q.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            q.put_nowait(None)
+
+    async def subscribe(self):
+        """Async generator yielding published frames for one client"""
+        if self._stopped:
+            # Producer already closed (e.g. idle timeout raced our lookup)
+            if self.last_frame is not None:
+                yield self.last_frame
+            return
+
+        q = asyncio.Queue(maxsize=self.queue_size)
+        if self.last_frame is not None:
+            # Late joiners get the current state immediately
+            q.put_nowait(self.last_frame)
+        self._subscribers.append(q)
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run(self))
+        try:
+            while True:
+                frame = await q.get()
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            if q in self._subscribers:
+                self._subscribers.remove(q)
+            self._drop_counts.pop(q, None)
+            if not self._subscribers and not self._stopped:
+                # Last client gone - stop the producer
+                self._task.cancel()
+                self._task = None
+                self._stop()
+
+
+# Create singleton instance
+bus = ChangeBus()
@@ -3,17 +3,57 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from threading import Lock
 from contextlib import contextmanager
+import base64
 import json
 import os
-from sqlalchemy import desc, func
+import aiofiles
+import xxhash
+from cachetools import LRUCache
+from sqlalchemy import desc, func, and_, or_, update, bindparam, case
 from sqlalchemy.orm import Session
 from info import info
 from output import output
 from db import db
+from events import bus
 from models import Job as JobModel
 from states import states
 import pytz
 
+# to_dict output cache for list endpoints - most jobs on a page don't
+# change between requests, and formatting four datetimes plus building a
+# 20-key dict per row per request adds up under the SSE streams
+_dict_cache = LRUCache(maxsize=4096)
+_dict_cache_lock = Lock()
+
+# Built once at import time - the progress tick is the hottest write in
+# the system, and the old read-modify-write path cost a SELECT, an
+# UPDATE and a refresh per tick. One UPDATE with bound parameters does
+# it in a single round trip; the CASEs fold in the Pending->Running
+# promotion and the started_at stamp that update_status applied from
+# Python after reading the row
+_PROGRESS_UPDATE = (
+    update(JobModel)
+    .where(JobModel.id == bindparam("jid"))
+    .values(
+        progress=bindparam("pg"),
+        status=case(
+            (JobModel.status == states.PENDING, states.RUNNING),
+            else_=JobModel.status,
+        ),
+        started_at=case(
+            (
+                and_(
+                    JobModel.status.in_((states.PENDING, states.RUNNING)),
+                    JobModel.started_at.is_(None),
+                ),
+                bindparam("now"),
+            ),
+            else_=JobModel.started_at,
+        ),
+    )
+)
+
+
 class Job:
     def __init__(self):
         self._lock = Lock()
@@ -75,14 +115,15 @@ class Job:
                     log_file_path=None  # Will be set after we get the job ID
                 )
                 
+                # Flush to get the job ID without ending the transaction -
+                # the row and its log_file_path land in a single commit
                 session.add(job)
-                session.commit()
-                session.refresh(job)
-                
+                session.flush()
+
                 # Create log file with job ID
                 self._ensure_log_directory()
                 log_file_path = self.log_path(job.id)
-                
+
                 # Initialize detailed log file header
                 with open(log_file_path, 'w') as f:
                     f.write(f"=== Job {job.id} Log ===\n")
@@ -94,17 +135,52 @@ class Job:
                     f.write(f"Queue: {target_queue}\n")
                     f.write("Job created and awaiting queue assignment...\n\n")
                     f.write("=" * 50 + "\n\n")
-                
+
                 # Update job with log file path
                 job.log_file_path = str(log_file_path)
                 session.commit()
-                
+
                 output.info(f"Created job {job.id} for user {created_by}")
+                bus.notify(bus.JOBS)
                 return job
     
     def get_by_id(self, db_session: Session, job_id: int) -> Optional[JobModel]:
         """Get job by database ID"""
         return db_session.query(JobModel).filter(JobModel.id == job_id).first()
+
+    def to_dict_cached(self, job_record: JobModel) -> Dict[str, Any]:
+        """to_dict through a bounded value-keyed cache.
+
+        The model has no updated_at, so the key covers every mutable
+        scalar column plus a digest of result - any visible change
+        misses. The log consumer can land a RESULT= alone, with no
+        status or timestamp movement, so result can't just ride along.
+        Most jobs have no result and pay nothing for the digest;
+        parameters are fixed at create time and stay out of the key.
+        Returns a shallow copy since callers patch the dict in place.
+        """
+        result = job_record.result
+        key = (
+            job_record.id,
+            job_record.status,
+            job_record.progress,
+            job_record.started_at,
+            job_record.completed_at,
+            job_record.worker_name,
+            job_record.queue_name,
+            job_record.assigned_worker_name,
+            job_record.retries,
+            job_record.error_message,
+            None if result is None
+            else xxhash.xxh3_64_intdigest(json.dumps(result, sort_keys=True, default=str).encode()),
+        )
+        with _dict_cache_lock:
+            cached = _dict_cache.get(key)
+        if cached is None:
+            cached = job_record.to_dict()
+            with _dict_cache_lock:
+                _dict_cache[key] = cached
+        return dict(cached)
     
     def list(
         self,
@@ -126,6 +202,117 @@ class Job:
         
         return query.order_by(desc(JobModel.created_at)).offset(offset).limit(limit).all()
     
+    def _apply_filters(
+        self,
+        query,
+        status_filter: Optional[str] = None,
+        exclude_statuses: Optional[List[str]] = None,
+        user_filter: Optional[str] = None,
+        name_filter: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        timezone: str = 'UTC',
+        runtime_args_filter: Optional[str] = None
+    ):
+        """Apply the shared job list filters to a query.
+
+        Used by list_with_count and list_page_digest so both see the
+        same rows for the same parameters.
+        """
+        if status_filter:
+            query = query.filter(JobModel.status == status_filter)
+
+        if exclude_statuses:
+            query = query.filter(~JobModel.status.in_(exclude_statuses))
+
+        if user_filter:
+            query = query.filter(JobModel.created_by == user_filter)
+
+        if name_filter:
+            query = query.filter(JobModel.name.ilike(f'%{name_filter}%'))
+
+        # Runtime args filtering - query JSON fields
+        if runtime_args_filter:
+            try:
+                for filter_item in runtime_args_filter.split(','):
+                    if ':' in filter_item:
+                        key, value = filter_item.split(':', 1)
+                        key = key.strip()
+                        value = value.strip()
+                        # Dialect-aware JSON path comparison - compiles to
+                        # ->> on postgres/mysql and JSON_EXTRACT on sqlite;
+                        # key and value are bound, never spliced into SQL
+                        query = query.filter(
+                            JobModel.parameters['runtime_args'][key].as_string() == value
+                        )
+                        output.info(f"Runtime args filter: {key}={value}")
+                    else:
+                        output.error(f"Invalid runtime_args_filter format: {filter_item}. Expected 'key:value'")
+            except Exception as e:
+                output.error(f"Error parsing runtime_args_filter: {e}")
+
+        # Date range filtering
+        if start_date or end_date:
+            try:
+                tz = pytz.timezone(timezone)
+
+                # Parse and convert start date
+                if start_date:
+                    start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+                    if start_dt.tzinfo is None:
+                        start_dt = tz.localize(start_dt)
+                    start_dt_utc = start_dt.astimezone(pytz.UTC).replace(tzinfo=None)
+                    query = query.filter(JobModel.created_at >= start_dt_utc)
+                    output.info(f"Date filter: start={start_date} ({timezone}) -> {start_dt_utc} (UTC)")
+
+                # Parse and convert end date
+                if end_date:
+                    end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+                    if end_dt.tzinfo is None:
+                        end_dt = tz.localize(end_dt)
+                    end_dt_utc = end_dt.astimezone(pytz.UTC).replace(tzinfo=None)
+                    query = query.filter(JobModel.created_at <= end_dt_utc)
+                    output.info(f"Date filter: end={end_date} ({timezone}) -> {end_dt_utc} (UTC)")
+            except Exception as e:
+                output.error(f"Error parsing date filters: {e}")
+
+        return query
+
+    def encode_cursor(self, last: JobModel) -> str:
+        """Opaque keyset cursor pointing just past the given job.
+
+        Callers hand the cursor for a page's last row back on the next
+        request instead of a page number.
+        """
+        created = last.created_at.isoformat() if last.created_at else None
+        raw = json.dumps([created, last.id]).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    def _decode_cursor(self, cursor: str) -> tuple[Optional[datetime], int]:
+        """Decode an opaque cursor into its (created_at, id) keyset"""
+        try:
+            created, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            created_dt = datetime.fromisoformat(created) if created else None
+            return created_dt, int(job_id)
+        except Exception:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+    def _apply_cursor(self, query, cursor: str):
+        """Continue a listing after the row a cursor points at.
+
+        Keyset continuation costs the same at any depth, unlike OFFSET
+        which scans and discards all preceding rows. Written as an
+        explicit OR rather than a row-value comparison so it compiles on
+        all three supported dialects.
+        """
+        created_dt, last_id = self._decode_cursor(cursor)
+        if created_dt is not None:
+            return query.filter(or_(
+                JobModel.created_at < created_dt,
+                and_(JobModel.created_at == created_dt, JobModel.id < last_id)
+            ))
+        return query.filter(JobModel.id < last_id)
+
     def list_with_count(
         self,
         limit: int = 100,
@@ -137,7 +324,8 @@ class Job:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         timezone: str = 'UTC',
-        runtime_args_filter: Optional[str] = None
+        runtime_args_filter: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> tuple[List[JobModel], int]:
         """Get all jobs with filtering and total count for pagination
 
@@ -147,79 +335,120 @@ class Job:
 
         runtime_args_filter format: 'key1:value1,key2:value2' for filtering on runtime_args JSON fields.
         Example: 'asset_control_id:24,technology_type:Windows'
+
+        cursor (from encode_cursor) continues after a previous page's last
+        row and takes precedence over offset.
         """
         with db.get_session() as session:
-            query = session.query(JobModel)
-
-            if status_filter:
-                query = query.filter(JobModel.status == status_filter)
-
-            if exclude_statuses:
-                query = query.filter(~JobModel.status.in_(exclude_statuses))
+            query = self._apply_filters(
+                session.query(JobModel),
+                status_filter=status_filter,
+                exclude_statuses=exclude_statuses,
+                user_filter=user_filter,
+                name_filter=name_filter,
+                start_date=start_date,
+                end_date=end_date,
+                timezone=timezone,
+                runtime_args_filter=runtime_args_filter
+            )
 
+            if cursor:
+                query = self._apply_cursor(query, cursor)
+                offset = 0
+
+            # Fetch the page and the total in a single roundtrip - the
+            # window count is computed while the page streams. The id
+            # tiebreak keeps keyset pages deterministic when several jobs
+            # share a created_at
+            rows = (
+                query.add_columns(func.count().over().label('total'))
+                .order_by(desc(JobModel.created_at), desc(JobModel.id))
+                .offset(offset)
+                .limit(limit)
+                .all()
+            )
 
-            if user_filter:
-                query = query.filter(JobModel.created_by == user_filter)
+            if rows:
+                jobs = [row[0] for row in rows]
+                total = rows[0][1]
+            else:
+                # Page past the end (or no matches) - need the count query
+                jobs = []
+                total = query.count()
 
-            if name_filter:
-                query = query.filter(JobModel.name.ilike(f'%{name_filter}%'))
+            return jobs, total
 
-            # Runtime args filtering - query JSON fields
-            if runtime_args_filter:
-                try:
-                    from sqlalchemy import text
-                    filters = runtime_args_filter.split(',')
-                    for idx, filter_item in enumerate(filters):
-                        if ':' in filter_item:
-                            key, value = filter_item.split(':', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            # Query the nested JSON field using text SQL fragment
-                            # parameters->'runtime_args'->>'key' = value
-                            # Use unique bind param name for each filter to avoid conflicts
-                            param_name = f"value_{idx}"
-                            query = query.filter(
-                                text(f"parameters->'runtime_args'->>'{key}' = :{param_name}").bindparams(**{param_name: value})
-                            )
-                            output.info(f"Runtime args filter: {key}={value}")
-                        else:
-                            output.error(f"Invalid runtime_args_filter format: {filter_item}. Expected 'key:value'")
-                except Exception as e:
-                    output.error(f"Error parsing runtime_args_filter: {e}")
+    def list_page_digest(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        status_filter: Optional[str] = None,
+        exclude_statuses: Optional[List[str]] = None,
+        user_filter: Optional[str] = None,
+        name_filter: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        timezone: str = 'UTC',
+        runtime_args_filter: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> tuple[int, int, bool]:
+        """Digest of the change-relevant fields for one page of jobs.
+
+        Lets the SSE streams detect "nothing changed" from a narrow column
+        scan - no full-row transfer, no ORM hydration - and only fall back
+        to list_with_count when the digest moves. Same filters and ordering
+        as list_with_count, so digests line up with its pages. Returns
+        (digest, total, has_active); the total is folded into the digest
+        so a job appearing on another page still registers as a change,
+        and has_active flags any PENDING/RUNNING job on the page so idle
+        detection never needs the full rows.
+        """
+        with db.get_session() as session:
+            query = self._apply_filters(
+                session.query(
+                    JobModel.id,
+                    JobModel.status,
+                    JobModel.progress,
+                    JobModel.started_at,
+                    JobModel.completed_at,
+                ),
+                status_filter=status_filter,
+                exclude_statuses=exclude_statuses,
+                user_filter=user_filter,
+                name_filter=name_filter,
+                start_date=start_date,
+                end_date=end_date,
+                timezone=timezone,
+                runtime_args_filter=runtime_args_filter
+            )
 
-            # Date range filtering
-            if start_date or end_date:
-                try:
-                    tz = pytz.timezone(timezone)
-
-                    # Parse and convert start date
-                    if start_date:
-                        start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-                        if start_dt.tzinfo is None:
-                            start_dt = tz.localize(start_dt)
-                        start_dt_utc = start_dt.astimezone(pytz.UTC).replace(tzinfo=None)
-                        query = query.filter(JobModel.created_at >= start_dt_utc)
-                        output.info(f"Date filter: start={start_date} ({timezone}) -> {start_dt_utc} (UTC)")
-
-                    # Parse and convert end date
-                    if end_date:
-                        end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                        if end_dt.tzinfo is None:
-                            end_dt = tz.localize(end_dt)
-                        end_dt_utc = end_dt.astimezone(pytz.UTC).replace(tzinfo=None)
-                        query = query.filter(JobModel.created_at <= end_dt_utc)
-                        output.info(f"Date filter: end={end_date} ({timezone}) -> {end_dt_utc} (UTC)")
-                except Exception as e:
-                    output.error(f"Error parsing date filters: {e}")
+            if cursor:
+                query = self._apply_cursor(query, cursor)
+                offset = 0
 
-            # Get total count
-            total = query.count()
+            rows = (
+                query.add_columns(func.count().over().label('total'))
+                .order_by(desc(JobModel.created_at), desc(JobModel.id))
+                .offset(offset)
+                .limit(limit)
+                .all()
+            )
 
-            # Get paginated results
-            jobs = query.order_by(desc(JobModel.created_at)).offset(offset).limit(limit).all()
+            if rows:
+                total = rows[0][5]
+            else:
+                # Page past the end (or no matches) - need the count query
+                total = query.count()
+
+            h = xxhash.xxh3_64()
+            has_active = False
+            for row in rows:
+                h.update(f"{row[0]}|{row[1]}|{row[2]}|{row[3]}|{row[4]};".encode())
+                if row[1] in ('PENDING', 'RUNNING'):
+                    has_active = True
+            h.update(f"total:{total}".encode())
+            return h.intdigest(), total, has_active
 
-            return jobs, total
-    
     def list_by_user(
         self,
         db_session: Session,
@@ -277,6 +506,7 @@ class Job:
         db_session.refresh(job)
         
         output.info(f"Updated job {job_id} status to {status}")
+        bus.notify(bus.JOBS)
         return job
     
     def cancel(self, db_session: Session, job_id: int) -> bool:
@@ -288,6 +518,7 @@ class Job:
                 job.completed_at = datetime.now()
                 db_session.commit()
                 output.info(f"Cancelled job {job_id}")
+                bus.notify(bus.JOBS)
                 return True
             return False
             
@@ -449,6 +680,7 @@ class Job:
             db_session.commit()
             
             output.info(f"Deleted job {job_id}")
+            bus.notify(bus.JOBS)
             return True
             
         except Exception as e:
@@ -483,6 +715,8 @@ class Job:
         db_session.commit()
         
         output.info(f"Cleaned up {count} jobs with statuses {statuses} older than {days_old} days")
+        if count:
+            bus.notify(bus.JOBS)
         return count
     
     def cleanup_old(self, db_session: Session, days_old: int = 30) -> int:
@@ -542,19 +776,59 @@ class Job:
             output.error(f"Failed to read log for job {job_id}: {e}")
             return None
     
+    async def stream_log_content(self, job_id: int):
+        """Yield a job's log file in 64 KiB chunks for streaming responses.
+
+        Keeps per-request memory constant regardless of log size; error
+        conditions are yielded as plain text so the client always gets a body.
+        """
+        try:
+            with db.get_session() as session:
+                job_record = session.query(JobModel).filter(JobModel.id == job_id).first()
+                if not job_record:
+                    yield f"Error: Job {job_id} not found in database"
+                    return
+
+                if not job_record.log_file_path:
+                    yield f"Error: No log file path configured for job {job_id}"
+                    return
+
+            log_file_path = self.log_path(job_id)
+
+            # Create the log file if it doesn't exist
+            if not log_file_path.exists():
+                log_file_path.parent.mkdir(parents=True, exist_ok=True)
+                log_file_path.touch()
+
+            # Empty string breaks frontend LogViewer - always return something
+            if log_file_path.stat().st_size == 0:
+                yield "(no logs yet)"
+                return
+
+            async with aiofiles.open(log_file_path, 'rb') as f:
+                while True:
+                    chunk = await f.read(65536)
+                    if not chunk:
+                        break
+                    yield chunk
+
+        except Exception as e:
+            output.error(f"Failed to read log for job {job_id}: {e}")
+            yield f"Error: Unable to retrieve logs for job {job_id}"
+
     def update_progress(self, job_id: int, progress: int):
         """Update job progress percentage"""
         try:
             with db.get_session() as db_session:
-                job_record = db_session.query(JobModel).filter(JobModel.id == job_id).first()
-                if job_record:
-                    # Set status to Running if it's still Pending
-                    status = job_record.status
-                    if status == 'Pending':
-                        status = 'Running'
-                    self.update_status(db_session, job_id, status, progress=progress)
-                    db_session.commit()
+                result = db_session.execute(
+                    _PROGRESS_UPDATE,
+                    {"jid": job_id, "pg": progress, "now": datetime.utcnow()},
+                    execution_options={"synchronize_session": False},
+                )
+                db_session.commit()
+                if result.rowcount:
                     output.info(f"Updated progress for job {job_id} to {progress}%")
+                    bus.notify(bus.JOBS)
         except Exception as e:
             output.error(f"Failed to update progress for job {job_id}: {e}")
     
@@ -590,6 +864,7 @@ class Job:
                     job_record.status = 'Failed'
                     db_session.commit()
                     output.info(f"Updated job {job_id} to Failed with error: {error_message}")
+                    bus.notify(bus.JOBS)
                     
                     # Also append error message to log file
                     self.append_to_log(job_id, f"Job failed with error: {error_message}")
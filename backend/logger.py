@@ -1,4 +1,5 @@
 import asyncio
+import sys
 import threading
 import time
 import base64
@@ -13,6 +14,22 @@ import json
 import redis
 from info import info
 from output import output
+from events import bus
+
+# Prefer orjson's C decoder for the hot RESULT=/ERROR= parse path
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Fused keyword scanner: one alternation means a single pass over the line
+# instead of three independent re.search calls. Dispatch on m.lastgroup.
+_KEYWORD_SCANNER = re.compile(
+    rb"PROGRESS=(?P<prog>\d+)"
+    rb"|RESULT=(?:'(?P<r1>[^']*)'|(?P<r2>\{.*\}))"
+    rb"|ERROR=(?:'(?P<e1>[^']*)'|(?P<e2>\{.*\}))"
+)
 
 class Logger:
     """
@@ -23,17 +40,25 @@ class Logger:
     def __init__(self):
         self._running = False
         self._thread = None
-        self._log_file_handles = {}  # execution_id -> open file handle
+        self._log_file_handles = {}  # execution_id -> (raw O_APPEND fd, job_id)
+        self._closed_fds = set()  # fds closed via close_log - stale cache entries are reopened
         self._file_locks = {}  # execution_id -> asyncio.Lock
+        self._progress_throttle = {}  # job_id -> (monotonic time, progress) of last write
         self._lock = threading.Lock()
         self._redis_consumer_thread = None  # Thread for consuming Redis logs
+        self._status_consumer_thread = None  # Thread for consuming job status events
         self._redis_client = None  # Redis client instance
+        self._stop_event = threading.Event()  # Set on stop() to wake backoff waits
+        # Durability policy: fdatasync each write only when explicitly requested.
+        # O_APPEND already guarantees atomic, ordered appends without it.
+        self._fsync_enabled = os.getenv('LOG_FSYNC', 'false').lower() == 'true'
         
     def start(self):
         """Start the system logger"""
         with self._lock:
             if not self._running:
                 self._running = True
+                self._stop_event.clear()
                 # Ensure log directory exists
                 self._ensure_log_directory()
                 # Start Redis server with network binding
@@ -46,17 +71,31 @@ class Logger:
             self._redis_consumer_thread = threading.Thread(target=self._consume_redis_logs, daemon=True)
             self._redis_consumer_thread.start()
             output.info("Redis log consumer thread started")
-    
+
+    def start_status_consumer(self, handler):
+        """Start the job status stream consumer thread.
+
+        handler is called from the consumer thread with each batch of
+        decoded status-event dicts (execution_id, status, exit_code,
+        error); applying them is the caller's business, the logger only
+        owns the Redis plumbing.
+        """
+        if self._running and not self._status_consumer_thread:
+            self._status_consumer_thread = threading.Thread(
+                target=self._consume_status_stream, args=(handler,), daemon=True)
+            self._status_consumer_thread.start()
+            output.info("Redis status consumer thread started")
+
     def stop(self):
         """Stop the system logger and close all log files"""
         with self._lock:
             if self._running:
                 self._running = False
-                
+
                 # Stop Redis consumer thread
                 if self._redis_consumer_thread:
-                    # Thread will stop when self._running = False
-                    pass
+                    # Wake any backoff wait so the thread exits promptly
+                    self._stop_event.set()
                     
                 # Disconnect from Redis
                 if self._redis_client:
@@ -66,14 +105,14 @@ class Logger:
                         pass
                     self._redis_client = None
                 
-                # Close all open log files
-                for execution_id, file_handle in self._log_file_handles.items():
+                # Close all open log file descriptors
+                for execution_id, (fd, _job_id) in self._log_file_handles.items():
                     try:
-                        if hasattr(file_handle, 'close'):
-                            file_handle.close()
+                        os.close(fd)
+                        self._closed_fds.add(fd)
                     except Exception as e:
                         output.error(f"Error closing log file for execution {execution_id}: {e}")
-                
+
                 self._log_file_handles.clear()
                 self._file_locks.clear()
                 output.info("System logger stopped")
@@ -83,6 +122,18 @@ class Logger:
         log_dir = Path(info.prefix) / 'logs' / 'jobs'
         log_dir.mkdir(parents=True, exist_ok=True)
         return log_dir
+
+    def _open_log_fd(self, log_file_path: Path) -> int:
+        """Open a raw append-only file descriptor for a log file.
+
+        A raw fd written with os.write is much lighter than Python's buffered
+        IO stack, and O_APPEND makes each write an atomic append so no
+        user-side position handling is needed.
+        """
+        fd = os.open(str(log_file_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        # The OS may reuse fd numbers - a fresh open is never "closed"
+        self._closed_fds.discard(fd)
+        return fd
     
     def _get_redis_password(self):
         """Read Redis password from config file"""
@@ -234,14 +285,14 @@ class Logger:
             # Parse keywords before writing to log file
             await self._parse_keywords(job_id, log_content)
             
-            # Get or open cached file handle
+            # Get or open cached file descriptor
             async with self._file_locks[execution_id]:
-                file_handle = await self._get_cached_file_handle(execution_id, job_id)
-                if file_handle:
+                fd = await self._get_cached_file_handle(execution_id, job_id)
+                if fd is not None:
                     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
                     log_line = f"[{timestamp}] {log_content}"
-                    file_handle.write(log_line.encode('utf-8'))
-                    # Remove blocking fsync - let OS buffer writes for better performance
+                    os.write(fd, log_line.encode('utf-8'))
+                    # No fsync - let OS buffer writes for better performance
                 else:
                     output.error(f"Failed to get file handle for execution {execution_id}")
                     return False
@@ -341,12 +392,13 @@ class Logger:
             return None
         
         if not follow:
-            # Read entire file once
+            # Read the file in chunks so callers can stream it to the
+            # client instead of buffering the whole log in memory
             async def read_all():
                 try:
                     async with aiofiles.open(log_file_path, 'r', encoding='utf-8', errors='replace') as f:
-                        content = await f.read()
-                        yield content
+                        while chunk := await f.read(65536):
+                            yield chunk
                 except Exception as e:
                     output.error(f"Failed to read worker log file for {worker_name}: {e}")
                     yield f"Error reading log file: {e}\n"
@@ -413,7 +465,9 @@ class Logger:
             cache_key = f"worker:{worker_name}"
             if cache_key in self._log_file_handles:
                 try:
-                    self._log_file_handles[cache_key].close()
+                    fd, _ = self._log_file_handles[cache_key]
+                    os.close(fd)
+                    self._closed_fds.add(fd)
                     del self._log_file_handles[cache_key]
                 except:
                     pass
@@ -442,37 +496,38 @@ class Logger:
         output.info(f"Closed log resources for job {job_id}")
     
     async def close_log(self, execution_id: str):
-        """Close and clean up cached file handle for an execution_id"""
+        """Close and clean up cached file descriptor for an execution_id"""
         try:
             if execution_id in self._log_file_handles:
-                file_handle = self._log_file_handles[execution_id]
-                
+                fd, job_id = self._log_file_handles[execution_id]
+                self._progress_throttle.pop(job_id, None)
+
                 # Get lock for this execution if it exists
                 if execution_id in self._file_locks:
                     async with self._file_locks[execution_id]:
                         try:
-                            file_handle.flush()  # Ensure all data is written
-                            file_handle.close()
+                            os.close(fd)  # Raw fd - O_APPEND writes are already on their way to disk
+                            self._closed_fds.add(fd)
                         except Exception as e:
                             output.error(f"Error closing log file for execution {execution_id}: {e}")
-                        
+
                         # Remove from cache
                         del self._log_file_handles[execution_id]
                 else:
                     # No lock exists, close directly
                     try:
-                        file_handle.flush()
-                        file_handle.close()
+                        os.close(fd)
+                        self._closed_fds.add(fd)
                     except Exception as e:
                         output.error(f"Error closing log file for execution {execution_id}: {e}")
-                    
+
                     # Remove from cache
                     del self._log_file_handles[execution_id]
-                
+
                 # Clean up the lock as well
                 if execution_id in self._file_locks:
                     del self._file_locks[execution_id]
-                
+
                 output.info(f"Closed and cleaned up log resources for execution {execution_id}")
             else:
                 output.warning(f"No cached log file handle found for execution {execution_id}")
@@ -482,6 +537,13 @@ class Logger:
     
     async def _parse_keywords(self, job_id: int, log_content: str):
         """Parse log content for PROGRESS=, ERROR=, and RESULT= keywords and update job accordingly"""
+        # Cheap C-level substring check so ordinary output never hits the regex engine
+        if len(log_content) < 6 or (
+            'PROGRESS=' not in log_content
+            and 'RESULT=' not in log_content
+            and 'ERROR=' not in log_content
+        ):
+            return
         try:
             # Import job here to avoid circular imports
             from job import job
@@ -502,7 +564,7 @@ class Logger:
                 try:
                     # Get whichever group matched (quoted or unquoted)
                     result_str = result_match.group(1) or result_match.group(2)
-                    result_json = json.loads(result_str)
+                    result_json = _json_loads(result_str)
                     output.debug(f"📋 Found RESULT in job {job_id} log")
                     await self._update_job_result(job_id, result_json)
                 except json.JSONDecodeError:
@@ -514,7 +576,7 @@ class Logger:
                 try:
                     # Get whichever group matched (quoted or unquoted)
                     error_str = error_match.group(1) or error_match.group(2)
-                    error_json = json.loads(error_str)
+                    error_json = _json_loads(error_str)
                     output.debug(f"❌ Found ERROR in job {job_id} log")
                     
                     # Extract message field if it exists, otherwise use the full JSON as string
@@ -533,11 +595,29 @@ class Logger:
         except Exception as e:
             output.error(f"Error parsing keywords for job {job_id}: {e}")
     
+    def _throttled_progress_update(self, job_id: int, progress: int):
+        """Write a progress value through the per-job throttle.
+
+        Chatty jobs can emit PROGRESS= many times per second and each
+        write is a full UPDATE; skip repeats of the same value and
+        bound the write rate per job. Terminal statuses don't pass
+        through here, so completion is never throttled.
+        """
+        now = time.monotonic()
+        last = self._progress_throttle.get(job_id)
+        if last is not None:
+            last_time, last_value = last
+            if progress == last_value or now - last_time < 0.25:
+                return
+        self._progress_throttle[job_id] = (now, progress)
+
+        from job import job
+        job.update_progress(job_id, progress)
+
     async def _update_job_progress(self, job_id: int, progress: int):
         """Update job progress in database"""
         try:
-            from job import job
-            job.update_progress(job_id, progress)
+            self._throttled_progress_update(job_id, progress)
         except Exception as e:
             output.error(f"Failed to update progress for job {job_id}: {e}")
     
@@ -581,47 +661,58 @@ class Logger:
             return log_dir / f"{job_id}.log"
     
     async def _get_cached_file_handle(self, execution_id: str, job_id: int):
-        """Get cached file handle for execution_id, open if not cached"""
+        """Get cached file descriptor for execution_id, open if not cached"""
         # Check if already cached
-        if execution_id in self._log_file_handles:
-            return self._log_file_handles[execution_id]
-        
+        cached = self._log_file_handles.get(execution_id)
+        if cached is not None and cached[0] not in self._closed_fds:
+            return cached[0]
+
         try:
             # Not cached, need to open the file
             log_file_path = await self._get_job_log_path(job_id)
-            
-            # Open file in append mode with no buffering for real-time output
-            file_handle = open(log_file_path, 'ab', buffering=0)  # Binary mode for unbuffered
-            
-            # Cache the handle
-            self._log_file_handles[execution_id] = file_handle
-            
+
+            # Open raw append-only descriptor for real-time output
+            fd = self._open_log_fd(log_file_path)
+
+            # Cache the descriptor along with the job_id
+            self._log_file_handles[execution_id] = (fd, job_id)
+
             output.info(f"Opened log file for execution {execution_id}: {log_file_path}")
-            return file_handle
-            
+            return fd
+
         except Exception as e:
             output.error(f"Failed to open log file for execution {execution_id}: {e}")
             return None
     
+    def _create_redis_client(self) -> redis.Redis:
+        """Build a Redis client with the logger's connection settings"""
+        # Use network IP for Redis connection to allow remote workers to connect
+        return redis.Redis(
+            host=info.get_local_ip(),
+            port=6378,
+            db=0,
+            password=self._get_redis_password(),
+            decode_responses=False,
+            socket_connect_timeout=5,
+            socket_timeout=10
+        )
+
     def _initialize_redis(self) -> bool:
         """Initialize Redis connection with authentication"""
         try:
-            # Use network IP for Redis connection to allow remote workers to connect
             redis_host = info.get_local_ip()
-            redis_password = self._get_redis_password()
-
-            self._redis_client = redis.Redis(
-                host=redis_host,
-                port=6378,
-                db=0,
-                password=redis_password,
-                decode_responses=False,
-                socket_connect_timeout=5,
-                socket_timeout=10
-            )
+            self._redis_client = self._create_redis_client()
 
             # Test connection
             self._redis_client.ping()
+
+            # Ensure the logs stream and consumer group exist (idempotent)
+            try:
+                self._redis_client.xgroup_create('logs', 'backend', id='$', mkstream=True)
+            except redis.ResponseError as e:
+                if 'BUSYGROUP' not in str(e):
+                    raise
+
             output.info(f"Redis connection established for logger at {redis_host}:6378")
             return True
 
@@ -631,8 +722,8 @@ class Logger:
     
     def _consume_redis_logs(self):
         """
-        Background thread to consume logs from single Redis logs queue.
-        Pulls logs from Redis and writes to files.
+        Background thread to consume logs from the shared Redis logs stream.
+        Reads batches via a consumer group and writes them to files.
         """
         output.info("Redis log consumer thread running")
         
@@ -648,48 +739,66 @@ class Logger:
         
         consecutive_errors = 0
         max_consecutive_errors = 10
-        
+        consumer_name = f"logger-{os.getpid()}"
+
         while self._running:
             try:
-                # BRPOP from single logs queue - block forever (daemon thread dies with parent)
-                result = self._redis_client.brpop(['logs'], timeout=0)
-                
-                if result:
-                    queue_key, encoded_message = result
-                    
-                    # Decode base64 message
-                    try:
-                        message_json = base64.b64decode(encoded_message).decode('utf-8')
-                        message_data = json.loads(message_json)
-                        
-                        # Check for either execution_id (job logs) or worker_name (worker logs)
-                        execution_id = message_data.get('execution_id')
-                        worker_name = message_data.get('worker_name')
-                        timestamp = message_data.get('timestamp')
-                        log_data = message_data.get('message')
-                        
-                        if execution_id and log_data:
-                            # Process job log message synchronously
-                            self._append_log_sync(execution_id, log_data)
-                            
-                            # Reset error counter on success
-                            consecutive_errors = 0
-                        elif worker_name and log_data:
-                            # Process worker log message synchronously
-                            self._append_worker_log_sync(worker_name, log_data)
-                            
-                            # Reset error counter on success
-                            consecutive_errors = 0
-                        else:
-                            output.warning("Invalid message format: missing execution_id/worker_name or message")
-                            
-                    except (json.JSONDecodeError, ValueError) as e:
-                        output.error(f"Failed to decode log message: {e}")
-                        
+                # XREADGROUP delivers log entries in batches instead of one
+                # BRPOP round-trip per message; block up to 5s when idle
+                entries = self._redis_client.xreadgroup(
+                    'backend', consumer_name, {'logs': '>'}, count=512, block=5000
+                )
+
+                if entries:
+                    ack_ids = []
+                    for _stream_key, messages in entries:
+                        for entry_id, fields in messages:
+                            ack_ids.append(entry_id)
+                            encoded_message = fields.get(b'message')
+                            if encoded_message is None:
+                                output.warning("Invalid stream entry: missing message field")
+                                continue
+
+                            # Decode base64 message - feed the decoded bytes straight to
+                            # json.loads, skipping the intermediate str construction
+                            try:
+                                message_data = json.loads(base64.b64decode(encoded_message))
+
+                                # Check for either execution_id (job logs) or worker_name (worker logs)
+                                execution_id = message_data.get('execution_id')
+                                worker_name = message_data.get('worker_name')
+                                timestamp = message_data.get('timestamp')
+                                log_data = message_data.get('message')
+
+                                if execution_id and log_data:
+                                    # Intern the execution_id so the per-line cache
+                                    # lookups below are pointer comparisons - the same
+                                    # handful of ids repeat for the life of a job
+                                    execution_id = sys.intern(execution_id)
+
+                                    # Process job log message synchronously - encode once
+                                    # here, the sync path works on bytes end-to-end
+                                    self._append_log_sync(execution_id, log_data.encode('utf-8'))
+                                elif worker_name and log_data:
+                                    # Process worker log message synchronously
+                                    self._append_worker_log_sync(worker_name, log_data.encode('utf-8'))
+                                else:
+                                    output.warning("Invalid message format: missing execution_id/worker_name or message")
+
+                            except (json.JSONDecodeError, ValueError) as e:
+                                output.error(f"Failed to decode log message: {e}")
+
+                    # Acknowledge the whole batch once it has been written out;
+                    # unacked entries are redelivered if the backend dies mid-batch
+                    if ack_ids:
+                        self._redis_client.xack('logs', 'backend', *ack_ids)
+
+                    # Reset error counter on success
+                    consecutive_errors = 0
                 else:
-                    # No data available (timeout), this is normal
+                    # No data available (block timeout), this is normal
                     consecutive_errors = 0
-                    
+
             except redis.ConnectionError as e:
                 consecutive_errors += 1
                 output.error(f"Redis connection error ({consecutive_errors}/{max_consecutive_errors}): {e}")
@@ -701,10 +810,12 @@ class Logger:
                         break
                     consecutive_errors = 0
                 else:
-                    time.sleep(2 ** min(consecutive_errors, 4))  # Exponential backoff
+                    # Exponential backoff - interruptible so stop() isn't blocked
+                    if self._stop_event.wait(min(2 ** consecutive_errors, 16)):
+                        break
                     
             except redis.TimeoutError:
-                # BRPOP timeout is normal, don't count as error
+                # Blocking read timeout is normal, don't count as error
                 consecutive_errors = 0
                     
             except Exception as e:
@@ -714,25 +825,115 @@ class Logger:
                 if consecutive_errors >= max_consecutive_errors:
                     output.error("Too many consecutive errors in Redis consumer, stopping...")
                     break
-                
-                # Wait before retrying
-                time.sleep(1)
+
+                # Wait before retrying - interruptible by stop()
+                if self._stop_event.wait(1):
+                    break
         
         output.info("Redis log consumer stopped")
-    
+
+    def _consume_status_stream(self, handler):
+        """
+        Background thread to consume job status events from the Redis
+        'jobstatus' stream.
+
+        Workers XADD one flat entry per state change; reading them in
+        batches through a consumer group lets the backend apply many
+        callbacks on one database session instead of one HTTP request
+        and session each. Entries are acked only after the handler
+        returns, so a crash mid-batch redelivers them.
+        """
+        # Wait a bit before trying to connect
+        time.sleep(1)
+
+        client = None
+        while self._running and client is None:
+            try:
+                client = self._create_redis_client()
+                client.ping()
+                # Ensure the stream and consumer group exist (idempotent)
+                try:
+                    client.xgroup_create('jobstatus', 'backend', id='$', mkstream=True)
+                except redis.ResponseError as e:
+                    if 'BUSYGROUP' not in str(e):
+                        raise
+            except Exception as e:
+                output.error(f"Failed to connect to Redis for status consumption: {e}")
+                client = None
+                if self._stop_event.wait(5):
+                    return
+
+        if client is None:
+            return
+
+        output.info("Redis status consumer thread running")
+        consumer_name = f"status-{os.getpid()}"
+
+        while self._running:
+            try:
+                entries = client.xreadgroup(
+                    'backend', consumer_name, {'jobstatus': '>'}, count=100, block=5000
+                )
+                if not entries:
+                    continue
+
+                ack_ids = []
+                events = []
+                for _stream_key, messages in entries:
+                    for entry_id, fields in messages:
+                        ack_ids.append(entry_id)
+                        try:
+                            event = {
+                                'execution_id': fields[b'execution_id'].decode(),
+                                'status': fields[b'status'].decode(),
+                            }
+                            if b'exit_code' in fields:
+                                event['exit_code'] = int(fields[b'exit_code'])
+                            if b'error' in fields:
+                                event['error'] = fields[b'error'].decode('utf-8', errors='replace')
+                        except (KeyError, ValueError) as e:
+                            output.warning(f"Invalid status stream entry {entry_id!r}: {e}")
+                            continue
+                        events.append(event)
+
+                if events:
+                    try:
+                        handler(events)
+                    except Exception as e:
+                        output.error(f"Status event handler failed: {e}")
+
+                if ack_ids:
+                    client.xack('jobstatus', 'backend', *ack_ids)
+
+            except redis.TimeoutError:
+                continue
+            except redis.ConnectionError as e:
+                output.error(f"Redis connection error in status consumer: {e}")
+                if self._stop_event.wait(5):
+                    break
+            except Exception as e:
+                output.error(f"Error consuming status stream: {e}")
+                if self._stop_event.wait(1):
+                    break
+
+        output.info("Redis status consumer stopped")
+
     def _get_log_file_handle(self, execution_id: str):
-        """Get or create file handle for execution_id"""
+        """Get or create (fd, job_id) entry for execution_id"""
+        # Intern the cache key - repeated lookups then hit the dict with an
+        # identity comparison instead of a character-by-character one
+        execution_id = sys.intern(execution_id)
         if execution_id in self._log_file_handles:
             return self._log_file_handles[execution_id]
-        
+
         try:
             # Parse job_id from execution_id
             job_id = self._parse_execution_id(execution_id)
-            
+
             # Get log file path
             from db import db
             from job import job
-            
+
             with db.get_session() as session:
                 job_record = job.get_by_id(session, job_id)
                 if job_record and job_record.log_file_path:
@@ -741,119 +942,122 @@ class Logger:
                     # Fallback to generated path
                     log_dir = self._ensure_log_directory()
                     log_file_path = log_dir / f"{job_id}.log"
-            
+
             # Ensure directory exists
             log_file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Open file in append mode, unbuffered
-            file_handle = open(log_file_path, 'ab', buffering=0)
-            
-            # Cache the handle
-            self._log_file_handles[execution_id] = file_handle
-            
+
+            # Open raw append-only descriptor
+            fd = self._open_log_fd(log_file_path)
+
+            # Cache the descriptor along with the parsed job_id so the
+            # per-line append path never re-parses the execution_id
+            entry = (fd, job_id)
+            self._log_file_handles[execution_id] = entry
+
             output.info(f"Opened log file for execution {execution_id}: {log_file_path}")
-            return file_handle
-            
+            return entry
+
         except Exception as e:
             output.error(f"Failed to open log file for execution {execution_id}: {e}")
             return None
     
-    def _append_log_sync(self, execution_id: str, log_data: str):
+    def _append_log_sync(self, execution_id: str, log_data: bytes):
         """
         Synchronous version of append_log for use by Redis consumer thread.
         This is a simplified version that writes directly to files without async operations.
         """
         try:
-            # Get or create file handle
-            file_handle = self._log_file_handles.get(execution_id)
+            # Get or create (fd, job_id) entry in one lookup
+            entry = self._log_file_handles.get(execution_id)
 
-            # Check if handle exists but is closed (can happen if close_log was called)
-            if file_handle and file_handle.closed:
-                # Remove stale handle from cache and get a fresh one
+            # Check if fd exists but was closed (can happen if close_log was called)
+            if entry is not None and entry[0] in self._closed_fds:
+                # Remove stale fd from cache and get a fresh one
                 del self._log_file_handles[execution_id]
-                file_handle = None
+                entry = None
 
-            if not file_handle:
-                file_handle = self._get_log_file_handle(execution_id)
-                if not file_handle:
+            if entry is None:
+                entry = self._get_log_file_handle(execution_id)
+                if entry is None:
                     return False
 
+            fd, job_id = entry
+
             # Write log data (timestamp already included from worker)
-            log_line = f"{log_data}\n"
-            
-            # Write to file (using sync I/O in thread is fine)
-            file_handle.write(log_line.encode('utf-8'))
-            file_handle.flush()  # Ensure real-time viewing
-            os.fsync(file_handle.fileno())  # Force to disk (safe in separate thread)
-            
-            # Parse keywords for progress/result updates
-            job_id = self._parse_execution_id(execution_id)
-            self._parse_keywords_sync(job_id, log_data)
-            
+            # Bytes in, bytes out - one gathered syscall, atomic under O_APPEND
+            os.writev(fd, [log_data, b'\n'])
+            if self._fsync_enabled:
+                os.fdatasync(fd)  # Force to disk (safe in separate thread)
+
+            # Parse keywords for progress/result updates (job_id cached at open time)
+            if job_id >= 0:
+                self._parse_keywords_sync(job_id, log_data)
+
             return True
-            
+
         except Exception as e:
             output.error(f"Error in sync log append for {execution_id}: {e}")
             return False
     
-    def _append_worker_log_sync(self, worker_name: str, log_data: str):
+    def _append_worker_log_sync(self, worker_name: str, log_data: bytes):
         """
         Synchronous version of append_log for worker logs.
         Writes to logs/workers/{worker_name}.log files.
         """
         try:
-            # Get or create file handle for worker
+            # Get or create file descriptor for worker
             cache_key = f"worker:{worker_name}"
-            file_handle = self._log_file_handles.get(cache_key)
+            entry = self._log_file_handles.get(cache_key)
 
-            # Check if handle exists but is closed
-            if file_handle and file_handle.closed:
+            # Check if fd exists but was closed
+            if entry is not None and entry[0] in self._closed_fds:
                 del self._log_file_handles[cache_key]
-                file_handle = None
+                entry = None
 
-            if not file_handle:
-                file_handle = self._get_worker_log_file_handle(worker_name)
-                if not file_handle:
+            if entry is None:
+                entry = self._get_worker_log_file_handle(worker_name)
+                if entry is None:
                     return False
 
-            # Add timestamp and write log data
-            timestamp = datetime.now().strftime('[%Y-%m-%d %H:%M:%S]')
-            log_line = f"{timestamp} {log_data}\n"
-            
-            # Write to file (using sync I/O in thread is fine)
-            file_handle.write(log_line.encode('utf-8'))
-            file_handle.flush()
-            os.fsync(file_handle.fileno())  # Force to disk
-            
+            fd = entry[0]
+
+            # Add timestamp and write log data as one atomic append -
+            # timestamp encoded once, payload already bytes, one writev syscall
+            timestamp = datetime.now().strftime('[%Y-%m-%d %H:%M:%S] ')
+            os.writev(fd, [timestamp.encode('utf-8'), log_data, b'\n'])
+            if self._fsync_enabled:
+                os.fdatasync(fd)  # Force to disk
+
             return True
-            
+
         except Exception as e:
             output.error(f"Error in worker log append for {worker_name}: {e}")
             return False
     
     def _get_worker_log_file_handle(self, worker_name: str):
-        """Get or create file handle for worker logs"""
+        """Get or create (fd, job_id) entry for worker logs"""
         cache_key = f"worker:{worker_name}"
-        
+
         if cache_key in self._log_file_handles:
             return self._log_file_handles[cache_key]
-        
+
         try:
             # Get worker log file path
             log_file_path = self._get_worker_log_path(worker_name)
-            
+
             # Ensure directory exists
             log_file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Open file in append mode, unbuffered
-            file_handle = open(log_file_path, 'ab', buffering=0)
-            
-            # Cache the handle
-            self._log_file_handles[cache_key] = file_handle
-            
+
+            # Open raw append-only descriptor
+            fd = self._open_log_fd(log_file_path)
+
+            # job_id = -1 is the sentinel for "not a job log, skip keyword parsing"
+            entry = (fd, -1)
+            self._log_file_handles[cache_key] = entry
+
             output.info(f"Opened worker log file for {worker_name}: {log_file_path}")
-            return file_handle
-            
+            return entry
+
         except Exception as e:
             output.error(f"Failed to open worker log file for {worker_name}: {e}")
             return None
@@ -864,72 +1068,96 @@ class Logger:
         log_dir.mkdir(parents=True, exist_ok=True)
         return log_dir / f"{worker_name.lower()}.log"
     
-    def _parse_keywords_sync(self, job_id: int, log_content: str):
-        """Synchronous version of keyword parsing for Redis consumer thread"""
+    def _parse_keywords_sync(self, job_id: int, log_content: bytes):
+        """Synchronous version of keyword parsing for Redis consumer thread.
+
+        Works on bytes end-to-end - the consumer hands over the encoded line,
+        so no decode pass is needed for lines without keywords.
+        """
+        # Cheap C-level substring check so ordinary output never hits the regex engine
+        if len(log_content) < 6 or (
+            b'PROGRESS=' not in log_content
+            and b'RESULT=' not in log_content
+            and b'ERROR=' not in log_content
+        ):
+            return
         try:
             from db import db
             from job import job
-            
-            # Check for PROGRESS= patterns
-            progress_match = re.search(r'PROGRESS=(\d+)', log_content)
-            if progress_match:
-                progress_val = int(progress_match.group(1))
-                output.debug(f"📊 Found PROGRESS={progress_val} in job {job_id} log")
-                if 0 <= progress_val <= 100:
-                    # Update job progress in database
-                    with db.get_session() as session:
-                        job_record = job.get_by_id(session, job_id)
-                        if job_record:
-                            job_record.progress = progress_val
-                            session.commit()
-                            output.debug(f"Updated job {job_id} progress to {progress_val}%")
-                else:
-                    output.warning(f"Invalid progress value {progress_val} for job {job_id}")
-            
-            # Check for RESULT= patterns
-            result_match = re.search(r"RESULT=(?:'([^']*)'|({.*}))", log_content)
-            if result_match:
-                try:
-                    result_str = result_match.group(1) or result_match.group(2)
-                    result_data = json.loads(result_str) if result_str.startswith('{') else result_str
-                    
-                    # Update job result in database
+
+            # Single fused pass; only the first occurrence of each keyword is
+            # applied, matching the old per-keyword re.search behavior
+            handled = set()
+            for match in _KEYWORD_SCANNER.finditer(log_content):
+                group = match.lastgroup
+
+                if group == 'prog':
+                    if 'progress' in handled:
+                        continue
+                    handled.add('progress')
+                    progress_val = int(match.group('prog'))
+                    output.debug(f"📊 Found PROGRESS={progress_val} in job {job_id} log")
+                    if 0 <= progress_val <= 100:
+                        # Throttled single prepared UPDATE (which also
+                        # notifies the jobs stream) instead of a
+                        # read-modify-write per line
+                        self._throttled_progress_update(job_id, progress_val)
+                    else:
+                        output.warning(f"Invalid progress value {progress_val} for job {job_id}")
+
+                elif group in ('r1', 'r2'):
+                    if 'result' in handled:
+                        continue
+                    handled.add('result')
+                    try:
+                        result_str = match.group(group)
+                        if result_str.startswith(b'{'):
+                            result_data = _json_loads(result_str)
+                        else:
+                            result_data = result_str.decode('utf-8', errors='replace')
+
+                        # Update job result in database
+                        with db.get_session() as session:
+                            job_record = job.get_by_id(session, job_id)
+                            if job_record:
+                                job_record.result = result_data if isinstance(result_data, dict) else {"value": result_data}
+                                session.commit()
+                                output.debug(f"Updated job {job_id} result")
+                                # Stream clients only re-query on notify
+                                # now that the 0.5s poll is gone
+                                bus.notify(bus.JOBS)
+                    except json.JSONDecodeError:
+                        output.warning(f"Invalid RESULT JSON in log: {match.group(0)}")
+
+                elif group in ('e1', 'e2'):
+                    # Handles both ERROR={...} and ERROR='...' formats
+                    if 'error' in handled:
+                        continue
+                    handled.add('error')
+                    try:
+                        error_str = match.group(group)
+                        error_json = _json_loads(error_str)
+
+                        # Extract message field if it exists, otherwise use the full JSON as string
+                        if isinstance(error_json, dict) and 'message' in error_json:
+                            error_message = error_json['message']
+                        else:
+                            # If no message field, convert the whole JSON to string
+                            error_message = json.dumps(error_json)
+
+                    except json.JSONDecodeError:
+                        # If not valid JSON, use the raw string as error message
+                        error_message = error_str.decode('utf-8', errors='replace')
+
                     with db.get_session() as session:
                         job_record = job.get_by_id(session, job_id)
                         if job_record:
-                            job_record.result = result_data if isinstance(result_data, dict) else {"value": result_data}
+                            job_record.error_message = error_message
+                            job_record.status = "Failed"
                             session.commit()
-                            output.debug(f"Updated job {job_id} result")
-                except json.JSONDecodeError:
-                    output.warning(f"Invalid RESULT JSON in log: {result_match.group(0)}")
-            
-            # Check for ERROR= patterns (handles both ERROR={...} and ERROR='...' formats)
-            error_match = re.search(r"ERROR=(?:'([^']*)'|({.*}))", log_content)
-            if error_match:
-                try:
-                    # Get whichever group matched (quoted or unquoted)
-                    error_str = error_match.group(1) or error_match.group(2)
-                    error_json = json.loads(error_str)
-                    
-                    # Extract message field if it exists, otherwise use the full JSON as string
-                    if isinstance(error_json, dict) and 'message' in error_json:
-                        error_message = error_json['message']
-                    else:
-                        # If no message field, convert the whole JSON to string
-                        error_message = json.dumps(error_json)
-                        
-                except json.JSONDecodeError:
-                    # If not valid JSON, use the raw string as error message
-                    error_message = error_str
-                
-                with db.get_session() as session:
-                    job_record = job.get_by_id(session, job_id)
-                    if job_record:
-                        job_record.error_message = error_message
-                        job_record.status = "Failed"
-                        session.commit()
-                        output.warning(f"Job {job_id} reported error: {error_message}")
-                        
+                            output.warning(f"Job {job_id} reported error: {error_message}")
+                            bus.notify(bus.JOBS)
+
         except Exception as e:
             output.error(f"Error parsing keywords for job {job_id}: {e}")
 
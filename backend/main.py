@@ -4,53 +4,67 @@ import sys
 import os
 import uvicorn
 from fastapi import FastAPI, HTTPException, WebSocket, Query, Depends, Request
-from fastapi.responses import StreamingResponse, PlainTextResponse, JSONResponse
+from fastapi.responses import StreamingResponse, PlainTextResponse, JSONResponse, ORJSONResponse, FileResponse
+from fastapi.sse import EventSourceResponse, ServerSentEvent
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from fastapi.exceptions import RequestValidationError
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from sqlalchemy import func
+from cachetools import TTLCache
 from typing import Optional, Dict, Any, List
 import json
+import orjson
+import xxhash
 import asyncio
+import aiofiles
+import functools
+import random
+import threading
 import time
 from contextlib import asynccontextmanager
+from pathlib import Path
+from watchfiles import awatch, Change
 from info import info
-from output import output, log_config
+from output import output, log_config, start_queue_logging, stop_queue_logging
 from db import db, DatabaseConfigUpdateRequest
+from events import bus, Broadcaster, EventWaiter
 from job import job
 from logger import logger
-from specs import specs, SpecCreateRequest, SpecUpdateRequest
-from queues import queue, QueueCreateRequest, QueueUpdateRequest
+from specs import specs, SpecCreateRequest, SpecUpdateRequest, SpecsPage
+from queues import queue, QueueCreateRequest, QueueUpdateRequest, QueueOut, QueuesPage
 from worker import worker, WorkerCreateRequest, WorkerUpdateRequest
-from auth import auth, LoginRequest, TokenResponse, UserCreateRequest, UserUpdateRequest, get_current_user, require_role, require_permission
+from auth import auth, LoginRequest, TokenResponse, UserCreateRequest, UserUpdateRequest, get_current_user, require_role, require_permission, invalidate_token_cache
 from models import User, UserRole, UserSession
 
+# Ignore unknown keys and skip re-validating defaults - keeps request
+# parsing on pydantic v2's rust fast path
+_request_model_config = ConfigDict(extra='ignore', validate_default=False)
+
+
 class JobRunRequest(BaseModel):
+    model_config = _request_model_config
+
     spec_name: Optional[str] = Field(None, description="Job specification name")
     name: Optional[str] = Field(None, description="Job specification name (alternative to spec_name)")
     runtime_args: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Runtime arguments for the job")
     args: Optional[Dict[str, Any]] = Field(None, description="Runtime arguments for the job (alternative to runtime_args)")
     created_by: Optional[str] = Field(default="system", description="User who is running the job")
     queue: Optional[str] = Field(default=None, description="Target queue name (optional)")
-    
-    def get_spec_name(self) -> str:
-        """Get the specification name, preferring spec_name over name."""
-        if self.spec_name:
-            return self.spec_name
-        elif self.name:
-            return self.name
-        else:
+
+    @model_validator(mode='after')
+    def _resolve_aliases(self):
+        """Resolve the spec_name/name and runtime_args/args aliases once at
+        parse time so handlers read plain fields."""
+        self.spec_name = self.spec_name or self.name
+        self.runtime_args = self.runtime_args or self.args or {}
+        if not self.spec_name:
             raise ValueError("Either 'spec_name' or 'name' must be provided")
-            
-    def get_runtime_args(self) -> Dict[str, Any]:
-        """Get the runtime arguments, preferring runtime_args over args."""
-        if self.runtime_args:
-            return self.runtime_args
-        elif self.args:
-            return self.args
-        else:
-            return {}
+        return self
 
 class JobStatusRequest(BaseModel):
+    model_config = _request_model_config
+
     execution_id: str = Field(..., description="Execution ID in format 'queue_name:job_id'")
     status: str = Field(..., description="Job status: started, completed, failed")
     exit_code: Optional[int] = Field(None, description="Process exit code (for completed/failed)")
@@ -63,7 +77,11 @@ async def lifespan(app: FastAPI):
 	"""Handle application startup and shutdown."""
 
 	info.set_prefix()
-	
+
+	# Move log writes off the calling thread/event loop onto a
+	# QueueListener thread; uvicorn has applied log_config by now
+	start_queue_logging()
+
 	# Always start logger first (non-database dependent)
 	logger.start()
 	logger.start_redis_consumer()  # Start Redis consumer thread
@@ -74,6 +92,11 @@ async def lifespan(app: FastAPI):
 		# Initialize database tables for authentication
 		from models import Base
 		Base.metadata.create_all(bind=db.engine)
+
+		# Remember the schema is in place so /api/db/initialize can
+		# short-circuit instead of re-running create_all
+		app.state.db_initialized = True
+		app.state.known_tables = list(Base.metadata.tables.keys())
 		
 		# Initialize default admin user
 		with db.get_session() as session:
@@ -82,6 +105,12 @@ async def lifespan(app: FastAPI):
 		job.initialize()
 		queue.initialize()
 		worker.initialize()
+
+		# Batch-apply worker status events arriving via the Redis
+		# jobstatus stream; the HTTP endpoint stays for workers
+		# without Redis connectivity
+		loop = asyncio.get_running_loop()
+		logger.start_status_consumer(functools.partial(_handle_status_events, loop))
 		# specs doesn't need explicit initialization, it uses db sessions on demand
 		output.info("Database initialized successfully")
 	except Exception as e:
@@ -96,41 +125,77 @@ async def lifespan(app: FastAPI):
 	queue.shutdown()
 	logger.stop()
 	db.close()
+	stop_queue_logging()
 	output.info("FastAPI lifespan shutdown completed")
 
 # App defined here
-app = FastAPI(title=info.name, description=info.desc, version=info.version, lifespan=lifespan)
+# orjson handles datetime/UUID natively and is much faster than stdlib json
+app = FastAPI(title=info.name, description=info.desc, version=info.version, lifespan=lifespan,
+              default_response_class=ORJSONResponse)
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     output.error(f"Validation error for {request.method} {request.url}: {exc.errors()}")
-    
-    # Clean error details to ensure JSON serializability
-    cleaned_errors = []
-    for error in exc.errors():
-        cleaned_error = {
-            "type": error.get("type"),
-            "loc": error.get("loc"),
-            "msg": error.get("msg"),
-            "input": error.get("input")
-        }
-        # Don't include 'ctx' as it may contain non-serializable objects
-        cleaned_errors.append(cleaned_error)
-    
-    return JSONResponse(
+
+    # Keep only the serializable keys ('ctx' may hold arbitrary objects);
+    # orjson handles loc tuples and nested values natively
+    cleaned_errors = [
+        {key: error.get(key) for key in ("type", "loc", "msg", "input")}
+        for error in exc.errors()
+    ]
+
+    return ORJSONResponse(
         status_code=422,
         content={"detail": cleaned_errors}
     )
 
-# Add CORS middleware
+# Compress sizeable JSON payloads (job/user lists) when the client
+# accepts gzip; level 4 trades a little ratio for low CPU cost
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
+# Add CORS middleware. Origins can be pinned with CORS_ALLOW_ORIGINS
+# (comma-separated); a concrete list lets starlette emit a static header
+# instead of echoing every origin. '*' stays the default because the UI
+# is normally served same-origin behind nginx. The explicit method/header
+# lists plus max_age let browsers cache preflights for a day.
+_cors_origins = [o.strip() for o in os.getenv('CORS_ALLOW_ORIGINS', '*').split(',') if o.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Accept requests from any origin
+    allow_origins=_cors_origins,
     allow_credentials=False,  # Required when using wildcard origins
-    allow_methods=["*"],  # Allow all methods
-    allow_headers=["*"],  # Allow all headers
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,
 )
 
+# Admission control for the SSE endpoints. Every stream pins a
+# generator (and often a file handle) for minutes, so past a ceiling
+# new connections get a fast 503 instead of degrading every existing
+# stream. Per-client buffering is already bounded by the Broadcaster's
+# drop-oldest queues; this caps the connection count itself.
+_SSE_MAX_CONNECTIONS = int(os.getenv('SSE_MAX_CONNECTIONS', '200'))
+_sse_connections = 0
+
+async def _sse_slot():
+    """Reserve an SSE connection slot for the lifetime of the response.
+
+    Async dependency, so check/increment run on the event loop and
+    need no lock; the teardown releases the slot when the stream ends
+    or the client disconnects.
+    """
+    global _sse_connections
+    if _sse_connections >= _SSE_MAX_CONNECTIONS:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many active streams, try again later",
+            headers={"Retry-After": "5"}
+        )
+    _sse_connections += 1
+    try:
+        yield
+    finally:
+        _sse_connections -= 1
+
 # Root endpoints
 @app.get("/")
 def get_root():
@@ -152,7 +217,7 @@ def get_root():
 
 # Authentication endpoints
 @app.post("/api/auth/login", response_model=TokenResponse, tags=["authentication"])
-async def login(request: LoginRequest):
+def login(request: LoginRequest):
     """Authenticate user and return JWT token."""
     try:
         with db.get_session() as session:
@@ -191,7 +256,7 @@ async def login(request: LoginRequest):
         raise HTTPException(status_code=500, detail="Authentication failed")
 
 @app.post("/api/auth/logout", tags=["authentication"])
-async def logout(current_user: User = Depends(get_current_user)):
+def logout(current_user: User = Depends(get_current_user)):
     """Logout and invalidate token."""
     try:
         with db.get_session() as session:
@@ -207,9 +272,12 @@ async def logout(current_user: User = Depends(get_current_user)):
             
             for user_session in sessions:
                 session.delete(user_session)
-            
+
             session.commit()
-            
+
+            # Drop any cached verifications so the token dies immediately
+            invalidate_token_cache(current_user.id)
+
             return {"message": "Successfully logged out"}
             
     except Exception as e:
@@ -223,7 +291,7 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 
 # User management endpoints
 @app.post("/api/users", tags=["users"])
-async def create_user(
+def create_user(
     request: UserCreateRequest,
     current_user: User = Depends(require_role(['admin']))
 ):
@@ -288,7 +356,7 @@ async def create_user(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/users", tags=["users"])
-async def get_users(
+def get_users(
     page: int = 1,
     per_page: int = 20,
     current_user: User = Depends(get_current_user)
@@ -297,13 +365,23 @@ async def get_users(
     try:
         with db.get_session() as session:
             offset = (page - 1) * per_page
-            
-            # Get total count
-            total = session.query(User).count()
-            
-            # Get users
-            users = session.query(User).offset(offset).limit(per_page).all()
-            
+
+            # One roundtrip: window count alongside the page itself
+            rows = (
+                session.query(User, func.count().over().label('total'))
+                .order_by(User.id)
+                .offset(offset)
+                .limit(per_page)
+                .all()
+            )
+
+            if rows:
+                users = [row[0] for row in rows]
+                total = rows[0][1]
+            else:
+                users = []
+                total = session.query(User).count()
+
             total_pages = (total + per_page - 1) // per_page
             
             return {
@@ -319,7 +397,7 @@ async def get_users(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/users/{user_id}", tags=["users"])
-async def get_user(
+def get_user(
     user_id: int,
     current_user: User = Depends(get_current_user)
 ):
@@ -340,7 +418,7 @@ async def get_user(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/users/{user_id}", tags=["users"])
-async def update_user(
+def update_user(
     user_id: int,
     request: UserUpdateRequest,
     current_user: User = Depends(require_role(['admin']))
@@ -387,9 +465,12 @@ async def update_user(
             # Update password if provided (for local auth)
             if request.password and user.auth_source == 'local':
                 user.password_hash = auth.hash_password(request.password)
-            
+
             session.commit()
-            
+
+            # Cached verifications may carry the old role/active flag
+            invalidate_token_cache(user_id)
+
             return {"user": user.to_dict()}
             
     except HTTPException:
@@ -399,34 +480,42 @@ async def update_user(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/users/{user_id}", tags=["users"])
-async def delete_user(
+def delete_user(
     user_id: int,
     current_user: User = Depends(require_role(['admin']))
 ):
     """Delete a user (admin only)."""
     try:
         with db.get_session() as session:
-            user = session.query(User).filter(User.id == user_id).first()
-            
-            if not user:
+            # Only the role is needed for the guard - skip loading the row
+            user_role = session.query(User.role).filter(User.id == user_id).scalar()
+
+            if user_role is None:
                 raise HTTPException(status_code=404, detail="User not found")
-            
-            # Don't allow deleting the last admin
-            if user.role == 'admin':
-                admin_count = session.query(User).filter(User.role == 'admin').count()
-                if admin_count <= 1:
+
+            # Don't allow deleting the last admin - EXISTS short-circuits on
+            # the first other admin instead of counting all of them
+            if user_role == 'admin':
+                has_another_admin = session.query(
+                    session.query(User)
+                    .filter(User.role == 'admin', User.id != user_id)
+                    .exists()
+                ).scalar()
+                if not has_another_admin:
                     raise HTTPException(
                         status_code=400,
                         detail="Cannot delete the last admin user"
                     )
-            
-            # Delete user sessions
-            session.query(UserSession).filter(UserSession.user_id == user_id).delete()
-            
-            # Delete user
-            session.delete(user)
+
+            # Bulk-delete sessions and the user in the same transaction -
+            # no ORM identity-map bookkeeping, both rows go in one commit
+            session.query(UserSession).filter(UserSession.user_id == user_id).delete(synchronize_session=False)
+            session.query(User).filter(User.id == user_id).delete(synchronize_session=False)
             session.commit()
-            
+
+            # Drop any cached verifications for the deleted user's tokens
+            invalidate_token_cache(user_id)
+
             return {"success": True, "message": "User deleted successfully"}
             
     except HTTPException:
@@ -436,7 +525,7 @@ async def delete_user(
         raise HTTPException(status_code=500, detail=str(e)) 
 
 @app.get("/api/db", tags=["database"])
-async def get_db_config():
+def get_db_config():
     """Get database configuration."""
     try:
         config_data = db.get_config()
@@ -446,7 +535,7 @@ async def get_db_config():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/db", tags=["database"])
-async def put_db_config(request: DatabaseConfigUpdateRequest):
+def put_db_config(request: DatabaseConfigUpdateRequest):
     """Update database configuration."""
     try:
         # Get only non-None values from the request
@@ -458,7 +547,11 @@ async def put_db_config(request: DatabaseConfigUpdateRequest):
         success = db.put_config(updates)
         if not success:
             raise HTTPException(status_code=500, detail="Failed to write database configuration")
-            
+
+        # A config change may point at a fresh database - let the next
+        # /api/db/initialize run create_all for real
+        app.state.db_initialized = False
+
         return {"success": True, "message": "Database configuration updated successfully"}
         
     except Exception as e:
@@ -466,57 +559,56 @@ async def put_db_config(request: DatabaseConfigUpdateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/db/initialize", tags=["database"])
-async def initialize_database():
+def initialize_database():
     """Initialize database tables based on configured database type."""
     try:
         # Get database configuration
         db_config = db.get_config().get('database', {})
         db_type = db_config.get('DB_TYPE', {}).get('value', 'postgresql')
-        
+
+        # Schema was already created (at startup or by an earlier call) -
+        # skip the dozens of information_schema queries create_all issues
+        if getattr(app.state, 'db_initialized', False):
+            return {
+                "success": True,
+                "message": f"Database tables already initialized for {db_type}",
+                "tables": list(app.state.known_tables),
+                "database_type": db_type
+            }
+
         output.info(f"Initializing database tables for {db_type}")
-        
-        # Import models to ensure they're registered with SQLAlchemy
-        from models import Job, Worker, Queue
-        from sqlalchemy import inspect
-        
+
         # Check if database is open, if not open it
         if not db.opened:
             db.open()
-        
+
         # Get the engine
         engine = db.engine
         if not engine:
             raise HTTPException(status_code=500, detail="Database connection not established")
-        
-        # Create tables if they don't exist
-        from sqlalchemy.ext.declarative import declarative_base
-        Base = declarative_base()
-        
-        # Import all models to register them
-        from models import Base as ModelBase
-        
+
         # Create all tables defined in the models
+        from models import Base as ModelBase
         ModelBase.metadata.create_all(bind=engine)
-        
+
         output.info("Database tables initialized successfully")
-        
-        # Get list of created tables for confirmation
-        inspector = inspect(engine)
-        tables = inspector.get_table_names()
-        
+
+        app.state.db_initialized = True
+        app.state.known_tables = list(ModelBase.metadata.tables.keys())
+
         return {
-            "success": True, 
+            "success": True,
             "message": f"Database tables initialized successfully for {db_type}",
-            "tables": tables,
+            "tables": list(app.state.known_tables),
             "database_type": db_type
         }
-        
+
     except Exception as e:
         output.error(f"Error initializing database: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/jobs", tags=["jobs"])
-async def get_jobs(
+def get_jobs(
     page: int = 1,
     per_page: int = 20,
     exclude_status: Optional[str] = None,
@@ -526,13 +618,15 @@ async def get_jobs(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     timezone: str = 'UTC',
-    runtime_args_filter: Optional[str] = None
+    runtime_args_filter: Optional[str] = None,
+    cursor: Optional[str] = None
 ):
     """Get all jobs from database - fast, simple query.
 
     Date filters (start_date, end_date) are ISO format strings (e.g., '2025-01-01T00:00:00').
     Timezone specifies how to interpret the dates (default: UTC, server local time).
     runtime_args_filter format: 'key1:value1,key2:value2' (e.g., 'asset_control_id:24,technology_type:Windows')
+    cursor continues after the previous page (from next_cursor in the response) and overrides page.
     """
     try:
         # Parse exclude_status if provided
@@ -551,21 +645,21 @@ async def get_jobs(
             start_date=start_date,
             end_date=end_date,
             timezone=timezone,
-            runtime_args_filter=runtime_args_filter
+            runtime_args_filter=runtime_args_filter,
+            cursor=cursor
         )
-        
+
         total_pages = (total + per_page - 1) // per_page
         
-        # Simple conversion - queue_name and assigned_worker_name are now in the database
-        # Add result_summary field (JSON string version of result) for UI compatibility
-        # Also rename error_message to error_summary for UI compatibility
+        # Single pass per row: to_dict once, then patch in the two UI
+        # compatibility fields (result as JSON string, error under
+        # error_summary) without touching the ORM row again
         jobs_data = []
         for job_record in jobs_list:
-            job_dict = job_record.to_dict()
-            job_dict['result_summary'] = json.dumps(job_record.result) if job_record.result else None
-            # Rename error_message to error_summary for UI
-            if 'error_message' in job_dict:
-                job_dict['error_summary'] = job_dict.pop('error_message')
+            job_dict = job.to_dict_cached(job_record)
+            result = job_dict['result']
+            job_dict['result_summary'] = orjson.dumps(result).decode() if result else None
+            job_dict['error_summary'] = job_dict.pop('error_message', None)
             jobs_data.append(job_dict)
         
         return {
@@ -573,24 +667,22 @@ async def get_jobs(
             "total": total,
             "page": page,
             "per_page": per_page,
-            "total_pages": total_pages
+            "total_pages": total_pages,
+            "next_cursor": job.encode_cursor(jobs_list[-1]) if len(jobs_list) == per_page else None
         }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         output.error(f"Error getting jobs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/jobs/run", tags=["jobs"])
-async def run_job(request: JobRunRequest):
+def run_job(request: JobRunRequest):
     """Run a job from specification - creates job and queues it for execution."""
     try:
-        # DEBUG: Log job creation details
-        # Get the actual spec name (from either spec_name or name field)
-        try:
-            actual_spec_name = request.get_spec_name()
-        except ValueError as e:
-            raise HTTPException(status_code=422, detail=str(e))
-            
-        actual_runtime_args = request.get_runtime_args()
+        # Aliases were already resolved by the model validator at parse time
+        actual_spec_name = request.spec_name
+        actual_runtime_args = request.runtime_args
         output.info(f"🚨 DEBUG: /api/jobs/run called with spec_name={actual_spec_name}, created_by={request.created_by}, queue={getattr(request, 'queue', None)}, runtime_args={actual_runtime_args}")
         # TODO: Validate spec exists before creating job
         # spec = specs.get_by_name(request.name)
@@ -635,7 +727,8 @@ async def run_job(request: JobRunRequest):
         
         # Add job to queue using the queue service (should not fail since queue was validated)
         try:
-            queue.add_job(target_queue, created_job.id)
+            # The job row was created two lines up - skip re-verifying it
+            queue.add_job(target_queue, created_job.id, verify_job=False)
             output.info(f"Job {created_job.id} added to queue '{target_queue}'")
         except Exception as e:
             output.error(f"Failed to add job {created_job.id} to queue '{target_queue}': {e}")
@@ -653,7 +746,7 @@ async def run_job(request: JobRunRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/jobs/{job_id}/cancel", tags=["jobs"])
-async def cancel_job(job_id: int):
+def cancel_job(job_id: int):
     """Cancel a running job."""
     try:
         with db.get_session() as session:
@@ -668,7 +761,7 @@ async def cancel_job(job_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/jobs/{job_id}", tags=["jobs"])
-async def delete_job(job_id: int):
+def delete_job(job_id: int):
     """Delete a job entry."""
     try:
         with db.get_session() as session:
@@ -683,7 +776,7 @@ async def delete_job(job_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/jobs/{job_id}/retry", tags=["jobs"])
-async def retry_job(job_id: int, user_id: str = "system"):
+def retry_job(job_id: int, user_id: str = "system"):
     """Retry a failed job."""
     try:
         with db.get_session() as session:
@@ -698,10 +791,12 @@ async def retry_job(job_id: int, user_id: str = "system"):
         raise HTTPException(status_code=500, detail=str(e))
 
 class MoveJobRequest(BaseModel):
+    model_config = _request_model_config
+
     new_queue: str = Field(..., description="Target queue name")
 
 @app.put("/api/jobs/{job_id}/move", tags=["jobs"])
-async def move_job(job_id: int, request: MoveJobRequest):
+def move_job(job_id: int, request: MoveJobRequest):
     """Move a job to a different queue."""
     try:
         # Validate that the target queue exists and is in valid state
@@ -746,7 +841,7 @@ async def move_job(job_id: int, request: MoveJobRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/jobs/statistics/summary", tags=["jobs"])
-async def get_job_statistics_summary(days: int = 7):
+def get_job_statistics_summary(days: int = 7):
     """Get job statistics summary."""
     try:
         with db.get_session() as session:
@@ -758,16 +853,12 @@ async def get_job_statistics_summary(days: int = 7):
 
 @app.get("/api/jobs/{job_id}/logs", tags=["jobs"])
 async def get_job_logs(job_id: int):
-    """Get job logs as plain text."""
+    """Get job logs as plain text, streamed in chunks."""
     try:
-        log_content = job.get_log_content(job_id)
-        if log_content is None:
-            log_content = f"Error: Unable to retrieve logs for job {job_id}"
-        
-        # Always return something, even if it's an error message
-        from fastapi.responses import PlainTextResponse
-        return PlainTextResponse(content=log_content, media_type="text/plain")
-        
+        # Stream the file instead of loading it into memory - job logs can
+        # run to megabytes and the generator holds one 64 KiB chunk at a time
+        return StreamingResponse(job.stream_log_content(job_id), media_type="text/plain")
+
     except HTTPException:
         raise
     except Exception as e:
@@ -783,7 +874,9 @@ async def stream_jobs(
     user_filter: Optional[str] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    timezone: str = 'UTC'
+    timezone: str = 'UTC',
+    cursor: Optional[str] = None,
+    _slot: None = Depends(_sse_slot)
 ):
     """Real-time job list stream using Server-Sent Events.
 
@@ -792,57 +885,72 @@ async def stream_jobs(
     """
     async def generate_job_stream():
         update_count = 0
-        while True:
-            try:
-                # Parse exclude_status if provided
-                exclude_statuses = []
-                if exclude_status:
-                    exclude_statuses = [s.strip() for s in exclude_status.split(',')]
-
-                offset = (page - 1) * per_page
-                jobs_list, total = job.list_with_count(
-                    limit=per_page,
-                    offset=offset,
-                    status_filter=status_filter,
-                    exclude_statuses=exclude_statuses if exclude_statuses else None,
-                    user_filter=user_filter,
-                    start_date=start_date,
-                    end_date=end_date,
-                    timezone=timezone
-                )
-                
-                total_pages = (total + per_page - 1) // per_page
-                
-                # Send job update event with simple job data (no expensive queue lookups)
-                paginated_jobs = [job_record.to_dict() for job_record in jobs_list]
+        loop = asyncio.get_running_loop()
+        jobs_changed = EventWaiter(bus.event(bus.JOBS))
+
+        # The filter parameters never change for the stream's lifetime -
+        # parse them once instead of on every iteration
+        exclude_statuses = [s.strip() for s in exclude_status.split(',')] if exclude_status else []
+        offset = (page - 1) * per_page
+
+        try:
+            while True:
+                try:
+                    # Sync SQLAlchemy call - run it on a worker thread so a
+                    # slow query doesn't stall everything else on the loop
+                    jobs_list, total = await loop.run_in_executor(None, functools.partial(
+                        job.list_with_count,
+                        limit=per_page,
+                        offset=offset,
+                        status_filter=status_filter,
+                        exclude_statuses=exclude_statuses if exclude_statuses else None,
+                        user_filter=user_filter,
+                        start_date=start_date,
+                        end_date=end_date,
+                        timezone=timezone,
+                        cursor=cursor
+                    ))
                 
-                update_count += 1
+                    total_pages = (total + per_page - 1) // per_page
                 
-                # Send job update event
-                data = {
-                    "jobs": paginated_jobs,
-                    "total": total,
-                    "page": page,
-                    "per_page": per_page,
-                    "total_pages": total_pages,
-                    "update_count": update_count
-                }
+                    # Send job update event with simple job data (no expensive queue lookups)
+                    paginated_jobs = [job.to_dict_cached(job_record) for job_record in jobs_list]
                 
-                yield f"event: jobs_update\n"
-                yield f"data: {json.dumps(data)}\n\n"
+                    update_count += 1
+
+                    # One clock read per tick, shared by every frame below
+                    now = int(time.time())
+
+                    # Send job update event
+                    data = {
+                        "jobs": paginated_jobs,
+                        "total": total,
+                        "page": page,
+                        "per_page": per_page,
+                        "total_pages": total_pages,
+                        "update_count": update_count,
+                        "next_cursor": job.encode_cursor(jobs_list[-1]) if len(jobs_list) == per_page else None
+                    }
                 
-                # Send heartbeat
-                heartbeat_data = {"jobs_count": total, "timestamp": time.time()}
-                yield f"event: heartbeat\n"
-                yield f"data: {json.dumps(heartbeat_data)}\n\n"
+                    yield f"event: jobs_update\n"
+                    yield f"data: {orjson.dumps(data).decode()}\n\n"
                 
-                await asyncio.sleep(0.5)  # Update every 500ms for real-time feel
+                    # Send heartbeat
+                    heartbeat_data = {"jobs_count": total, "timestamp": now}
+                    yield f"event: heartbeat\n"
+                    yield f"data: {orjson.dumps(heartbeat_data).decode()}\n\n"
                 
-            except Exception as e:
-                output.error(f"Error in job stream: {e}")
-                yield f"event: error\n"
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
-                break
+                    # Block until a job mutation signals the bus instead of
+                    # polling; the heartbeat timeout keeps the stream alive
+                    await jobs_changed.wait()
+
+                except Exception as e:
+                    output.error(f"Error in job stream: {e}")
+                    yield f"event: error\n"
+                    yield f"data: {orjson.dumps({'error': str(e)}).decode()}\n\n"
+                    break
+        finally:
+            jobs_changed.close()
     
     return StreamingResponse(
         generate_job_stream(),
@@ -853,114 +961,166 @@ async def stream_jobs(
         }
     )
 
-@app.get("/api/jobs/realtime", tags=["jobs"])
-async def stream_jobs_realtime(
-    page: int = Query(1, ge=1, description="Page number"),
-    per_page: int = Query(20, ge=1, le=100, description="Items per page"),
-    exclude_status: Optional[str] = Query(None, description="Exclude statuses (comma-separated)"),
-    start_date: Optional[str] = Query(None, description="Start date filter (ISO format)"),
-    end_date: Optional[str] = Query(None, description="End date filter (ISO format)"),
-    timezone: str = Query('UTC', description="Timezone for date interpretation"),
-    runtime_args_filter: Optional[str] = Query(None, description="Runtime args filter (key1:value1,key2:value2)")
-):
-    """Stream job list updates in real-time using Server-Sent Events with 0.5s polling.
-
-    Date filters (start_date, end_date) are ISO format strings (e.g., '2025-01-01T00:00:00').
-    Timezone specifies how to interpret the dates (default: UTC, server local time).
-    runtime_args_filter format: 'key1:value1,key2:value2' (e.g., 'asset_control_id:24,technology_type:Windows')
-    """
-    import asyncio
-    import json
-    from fastapi.responses import StreamingResponse
-
-    try:
-        async def jobs_stream_generator():
-            last_jobs_hash = ""
-            update_count = 0
-            no_change_count = 0
-            first_run = True
+# One shared producer per distinct filter tuple - database load for the
+# realtime job stream is O(distinct filter tuples), not O(clients)
+_job_broadcasters: Dict[tuple, Broadcaster] = {}
+
+
+def _get_job_broadcaster(
+    page: int,
+    per_page: int,
+    exclude_status: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    timezone: str,
+    runtime_args_filter: Optional[str],
+    cursor: Optional[str]
+) -> Broadcaster:
+    """Get (or start) the shared job stream producer for a filter tuple"""
+    key = (page, per_page, exclude_status, start_date, end_date,
+           timezone, runtime_args_filter, cursor)
+    broadcaster = _job_broadcasters.get(key)
+    if broadcaster is not None:
+        return broadcaster
+
+    async def run(bcast):
+        last_jobs_hash = None
+        update_count = 0
+        idle_timeout = 600  # close after 10 min without a data change
+        idle_deadline = time.monotonic() + idle_timeout
+        first_run = True
+        timed_out = False
+        err_sleep = 1.0  # error backoff, reset after each clean iteration
+        loop = asyncio.get_running_loop()
+        jobs_changed = EventWaiter(bus.event(bus.JOBS))
+
+        # The filter parameters never change for the producer's lifetime -
+        # parse them once instead of on every iteration
+        exclude_statuses = [s.strip() for s in exclude_status.split(',')] if exclude_status else []
+        offset = (page - 1) * per_page
 
+        try:
             while True:
                 try:
-                    # Get current jobs using the same logic as the regular jobs endpoint
-                    offset = (page - 1) * per_page
-
-                    # Handle exclude_status parameter
-                    exclude_statuses = []
-                    if exclude_status:
-                        exclude_statuses = [s.strip() for s in exclude_status.split(',')]
-
-                    # Get jobs from database
-                    jobs_list, total = job.list_with_count(
+                    # Narrow-column digest first - full rows are only
+                    # hydrated below when the page actually changed. Both
+                    # are sync SQLAlchemy calls, so they run on a worker
+                    # thread to keep the loop (and every other stream)
+                    # responsive
+                    jobs_hash, total, page_has_active = await loop.run_in_executor(None, functools.partial(
+                        job.list_page_digest,
                         limit=per_page,
                         offset=offset,
                         exclude_statuses=exclude_statuses,
                         start_date=start_date,
                         end_date=end_date,
                         timezone=timezone,
-                        runtime_args_filter=runtime_args_filter
-                    )
-                    
-                    # Convert jobs to dict format
-                    jobs_data = {
-                        "jobs": [j.to_dict() for j in jobs_list],
-                        "total": total,
-                        "page": page,
-                        "per_page": per_page,
-                        "total_pages": (total + per_page - 1) // per_page,
-                        "update_count": update_count
-                    }
-                    
-                    # Create hash of essential job data to detect changes
-                    jobs_hash = json.dumps([
-                        {
-                            "id": job_data["id"],
-                            "status": job_data["status"], 
-                            "progress": job_data["progress"],
-                            "started_at": job_data.get("started_at"),
-                            "completed_at": job_data.get("completed_at")
-                        } for job_data in jobs_data["jobs"]
-                    ], sort_keys=True)
-                    
+                        runtime_args_filter=runtime_args_filter,
+                        cursor=cursor
+                    ))
+
                     # Send initial data on first run or when data changed
                     if first_run or jobs_hash != last_jobs_hash:
+                        # Get jobs from database
+                        jobs_list, total = await loop.run_in_executor(None, functools.partial(
+                            job.list_with_count,
+                            limit=per_page,
+                            offset=offset,
+                            exclude_statuses=exclude_statuses,
+                            start_date=start_date,
+                            end_date=end_date,
+                            timezone=timezone,
+                            runtime_args_filter=runtime_args_filter,
+                            cursor=cursor
+                        ))
+
+                        # Convert jobs to dict format
+                        jobs_data = {
+                            "jobs": [job.to_dict_cached(j) for j in jobs_list],
+                            "total": total,
+                            "page": page,
+                            "per_page": per_page,
+                            "total_pages": (total + per_page - 1) // per_page,
+                            "update_count": update_count,
+                            "next_cursor": job.encode_cursor(jobs_list[-1]) if len(jobs_list) == per_page else None
+                        }
+
                         if first_run:
                             output.info(f"📡 Real-time: Sending initial SSE data for {len(jobs_data['jobs'])} jobs")
                             first_run = False
                         else:
                             output.info(f"📡 Real-time: Hash changed, sending SSE update for {len(jobs_data['jobs'])} jobs")
-                        yield f"event: jobs_update\ndata: {json.dumps(jobs_data)}\n\n"
+                        bcast.publish(b"event: jobs_update\ndata: " + orjson.dumps(jobs_data) + b"\n\n")
                         last_jobs_hash = jobs_hash
                         update_count += 1
-                        no_change_count = 0
-                    else:
-                        no_change_count += 1
-                        if no_change_count % 10 == 0:  # Log every 5 seconds (10 * 0.5s)
-                            output.debug(f"📡 Real-time: No changes detected ({no_change_count} cycles)")
-                        
+                        idle_deadline = time.monotonic() + idle_timeout
+                    elif timed_out:
                         # Send heartbeat every 30 seconds even if no changes
-                        if update_count == 1:
-                            yield f"data: Connected to job list stream\n\n"
-                        elif no_change_count % 60 == 0:  # Every 30 seconds
-                            yield f"event: heartbeat\ndata: {json.dumps({'timestamp': update_count, 'jobs_count': len(jobs_list)})}\n\n"
-                        
+                        # One clock read per tick - every subscriber gets
+                        # the same frame anyway
+                        now = int(time.time())
+                        bcast.publish(b"event: heartbeat\ndata: " + orjson.dumps({'timestamp': now, 'jobs_count': len(jobs_list)}) + b"\n\n")
+
                         # Close stream if no changes for 10 minutes and no active jobs
-                        if no_change_count > 1200:  # 10 minutes
-                            active_jobs = [job_data for job_data in jobs_data["jobs"] if job_data["status"] in ['PENDING', 'RUNNING']]
-                            if not active_jobs:
-                                yield "event: idle_timeout\ndata: No active jobs, closing stream\n\n"
-                                break
-                    
-                    # Wait before next check (0.5 second intervals for better responsiveness)
-                    await asyncio.sleep(0.5)
-                    
+                        if time.monotonic() >= idle_deadline and not page_has_active:
+                            bcast.publish("event: idle_timeout\ndata: No active jobs, closing stream\n\n")
+                            break
+                    else:
+                        # Woken by a change that didn't land on this page
+                        output.debug(f"📡 Real-time: Change did not affect this page")
+
+                    err_sleep = 1.0
+
+                    # Block until a job mutation signals the bus instead of
+                    # polling; the heartbeat timeout drives heartbeats and
+                    # idle detection
+                    timed_out = await jobs_changed.wait()
+
                 except Exception as e:
                     output.error(f"Error in jobs realtime stream: {e}")
-                    yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
-                    await asyncio.sleep(5)  # Wait longer on error
-        
+                    bcast.publish(b"event: error\ndata: " + orjson.dumps({'error': str(e)}) + b"\n\n")
+                    # Back off exponentially with jitter so a failing
+                    # database isn't hammered in lockstep on every tick
+                    await asyncio.sleep(err_sleep + random.uniform(0, err_sleep / 2))
+                    err_sleep = min(err_sleep * 2, 30)
+        finally:
+            jobs_changed.close()
+            bcast.close()
+
+    broadcaster = Broadcaster(run, on_stop=lambda: _job_broadcasters.pop(key, None))
+    _job_broadcasters[key] = broadcaster
+    return broadcaster
+
+
+@app.get("/api/jobs/realtime", tags=["jobs"])
+async def stream_jobs_realtime(
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    exclude_status: Optional[str] = Query(None, description="Exclude statuses (comma-separated)"),
+    start_date: Optional[str] = Query(None, description="Start date filter (ISO format)"),
+    end_date: Optional[str] = Query(None, description="End date filter (ISO format)"),
+    timezone: str = Query('UTC', description="Timezone for date interpretation"),
+    runtime_args_filter: Optional[str] = Query(None, description="Runtime args filter (key1:value1,key2:value2)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page (overrides page)"),
+    _slot: None = Depends(_sse_slot)
+):
+    """Stream job list updates in real-time using Server-Sent Events.
+
+    Clients on the same filter tuple share one database query loop; each
+    connection just subscribes to the broadcast frames.
+
+    Date filters (start_date, end_date) are ISO format strings (e.g., '2025-01-01T00:00:00').
+    Timezone specifies how to interpret the dates (default: UTC, server local time).
+    runtime_args_filter format: 'key1:value1,key2:value2' (e.g., 'asset_control_id:24,technology_type:Windows')
+    """
+    try:
+        broadcaster = _get_job_broadcaster(
+            page, per_page, exclude_status, start_date, end_date,
+            timezone, runtime_args_filter, cursor
+        )
+
         return StreamingResponse(
-            jobs_stream_generator(),
+            broadcaster.subscribe(),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -968,13 +1128,13 @@ async def stream_jobs_realtime(
                 "X-Accel-Buffering": "no"  # Disable nginx buffering
             }
         )
-        
+
     except Exception as e:
         output.error(f"Error starting real-time jobs stream: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/jobs/{job_id}/logs/stream", tags=["jobs"])
-async def stream_job_logs(job_id: int):
+async def stream_job_logs(job_id: int, _slot: None = Depends(_sse_slot)):
     """Real-time job log stream using Server-Sent Events."""
     try:
         # Verify job exists
@@ -995,62 +1155,71 @@ async def stream_job_logs(job_id: int):
                 yield f"data: Error: Log file not found at {log_file_path}\n\n"
                 return
             
-            # Send initial content
+            # Hold one handle for the lifetime of the stream - the old
+            # open/seek/read/close cycle every second was three syscalls
+            # plus a page-cache lookup per idle tick, and the handle's own
+            # position already tracks where we left off
             try:
-                with open(log_file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    initial_content = f.read()
+                async with aiofiles.open(log_file_path, 'r', encoding='utf-8', errors='replace') as f:
+                    initial_content = await f.read()
                     if initial_content:
                         # Send existing content line by line
                         for line in initial_content.splitlines():
                             yield f"data: {line}\n\n"
-                    
-                    # Get current position for following new content
-                    current_pos = f.tell()
-                
-                # Follow the file like tail -f
-                no_update_count = 0
-                
-                while True:
-                    # Check job status (but don't break for completed jobs)
-                    with db.get_session() as session:
-                        current_job = job.get_by_id(session, job_id)
-                        if not current_job:
-                            yield "event: error\ndata: Job no longer exists\n\n"
-                            break
-                    
-                    # Check for new content
-                    try:
-                        with open(log_file_path, 'r', encoding='utf-8', errors='replace') as f:
-                            f.seek(current_pos)
-                            new_content = f.read()
+
+                    # Follow the file like tail -f
+                    no_update_count = 0
+
+                    # The status only feeds the heartbeat message and the
+                    # timeout thresholds - refresh it every 30s instead of
+                    # hitting the database once per second per viewer
+                    status_check_interval = 30
+                    last_status_check = float('-inf')
+                    current_job = None
+
+                    while True:
+                        # Check job status (but don't break for completed jobs)
+                        now = time.monotonic()
+                        if now - last_status_check >= status_check_interval:
+                            with db.get_session() as session:
+                                current_job = job.get_by_id(session, job_id)
+                                if not current_job:
+                                    yield "event: error\ndata: Job no longer exists\n\n"
+                                    break
+                            last_status_check = now
+
+                        # Check for new content - reading at EOF returns ''
+                        # and picks up appended data on the next pass
+                        try:
+                            new_content = await f.read()
                             if new_content:
                                 for line in new_content.splitlines():
                                     yield f"data: {line}\n\n"
-                                current_pos = f.tell()
                                 no_update_count = 0
                             else:
                                 no_update_count += 1
-                    except Exception as e:
-                        output.error(f"Error reading log file for job {job_id}: {e}")
-                        yield f"data: Error reading log file\n\n"
-                        break
-                    
-                    # Different timeout behavior based on job status
-                    heartbeat_interval = 60 if current_job.status in ["Completed", "Failed", "Cancelled"] else 30
-                    timeout_limit = 300 if current_job.status in ["Completed", "Failed", "Cancelled"] else 180
-                    
-                    # If no updates for too long, send heartbeat
-                    if no_update_count >= heartbeat_interval:
-                        yield f"event: heartbeat\ndata: Job status: {current_job.status}\n\n"
-                        no_update_count = 0
-                    
-                    # Timeout after specified time with no activity
-                    if no_update_count >= timeout_limit:
-                        yield "event: timeout\ndata: Stream timeout - no activity\n\n"
-                        break
-                    
-                    await asyncio.sleep(1)
-                    
+                        except Exception as e:
+                            output.error(f"Error reading log file for job {job_id}: {e}")
+                            yield f"data: Error reading log file\n\n"
+                            break
+
+                        # Different timeout behavior based on job status
+                        heartbeat_interval = 60 if current_job.status in ["Completed", "Failed", "Cancelled"] else 30
+                        timeout_limit = 300 if current_job.status in ["Completed", "Failed", "Cancelled"] else 180
+
+                        # If no updates for too long, send heartbeat
+                        if no_update_count >= heartbeat_interval:
+                            yield f"event: heartbeat\ndata: Job status: {current_job.status}\n\n"
+                            no_update_count = 0
+
+                        # Timeout after specified time with no activity
+                        if no_update_count >= timeout_limit:
+                            yield "event: timeout\ndata: Stream timeout - no activity\n\n"
+                            break
+
+                        await asyncio.sleep(1)
+
+
             except Exception as e:
                 output.error(f"Error opening log file for job {job_id}: {e}")
                 yield f"data: Error reading log file: {str(e)}\n\n"
@@ -1073,7 +1242,7 @@ async def stream_job_logs(job_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/jobs/{job_id}", tags=["jobs"])
-async def get_job(job_id: int):
+def get_job(job_id: int):
     """Get a single job by ID."""
     try:
         with db.get_session() as session:
@@ -1086,7 +1255,7 @@ async def get_job(job_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/specs", tags=["specs"])
-async def create_spec(request: SpecCreateRequest):
+def create_spec(request: SpecCreateRequest):
     """Create a new job specification."""
     try:
         created_spec = specs.create(
@@ -1103,8 +1272,8 @@ async def create_spec(request: SpecCreateRequest):
         output.error(f"Error creating spec: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/specs", tags=["specs"])
-async def get_specs(
+@app.get("/api/specs", tags=["specs"], response_model=SpecsPage)
+def get_specs(
     page: int = 1,
     per_page: int = 20,
     name_filter: Optional[str] = None
@@ -1112,29 +1281,31 @@ async def get_specs(
     """Get all job specifications with pagination and optional filtering."""
     try:
         offset = (page - 1) * per_page
-        
+
         specs_list, total = specs.list_with_count(
             limit=per_page,
             offset=offset,
             name_filter=name_filter
         )
-        
+
         total_pages = (total + per_page - 1) // per_page
-        
+
+        # The response model reads straight off the ORM rows - no
+        # per-row to_dict() loop
         return {
-            "specs": [spec.to_dict() for spec in specs_list],
+            "specs": specs_list,
             "total": total,
             "page": page,
             "per_page": per_page,
             "total_pages": total_pages
         }
-        
+
     except Exception as e:
         output.error(f"Error getting specs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/specs/{spec_id}", tags=["specs"])
-async def get_spec(spec_id: int):
+def get_spec(spec_id: int):
     """Get a specific job specification by ID."""
     try:
         spec = specs.get_by_id(spec_id)
@@ -1151,7 +1322,7 @@ async def get_spec(spec_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/specs/{spec_id}", tags=["specs"])
-async def update_spec(spec_id: int, request: SpecUpdateRequest):
+def update_spec(spec_id: int, request: SpecUpdateRequest):
     """Update a specific job specification."""
     try:
         updated_spec = specs.update(
@@ -1175,7 +1346,7 @@ async def update_spec(spec_id: int, request: SpecUpdateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/specs/{spec_id}", tags=["specs"])
-async def delete_spec(spec_id: int):
+def delete_spec(spec_id: int):
     """Delete a specific job specification (soft delete)."""
     try:
         success = specs.delete(spec_id)
@@ -1192,7 +1363,7 @@ async def delete_spec(spec_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/specs/name/{spec_name}", tags=["specs"])
-async def get_spec_by_name(spec_name: str):
+def get_spec_by_name(spec_name: str):
     """Get a specific job specification by name."""
     try:
         spec = specs.get_by_name(spec_name)
@@ -1209,7 +1380,7 @@ async def get_spec_by_name(spec_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/queues", tags=["queues"])
-async def create_queue(request: QueueCreateRequest):
+def create_queue(request: QueueCreateRequest):
     """Create a new queue."""
     try:
         created_queue = queue.create(
@@ -1230,8 +1401,8 @@ async def create_queue(request: QueueCreateRequest):
         output.error(f"Error creating queue: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/queues", tags=["queues"])
-async def get_queues(
+@app.get("/api/queues", tags=["queues"], response_model=QueuesPage)
+def get_queues(
     page: int = 1,
     per_page: int = 20,
     name_filter: Optional[str] = None
@@ -1239,24 +1410,24 @@ async def get_queues(
     """Get all queues with pagination and optional filtering."""
     try:
         offset = (page - 1) * per_page
-        
+
         queues_list, total = queue.list_with_count(
             limit=per_page,
             offset=offset,
             name_filter=name_filter
         )
-        
+
         total_pages = (total + per_page - 1) // per_page
-        
-        # Add job counts to each queue
+
+        # Validate straight off the ORM rows, then patch in the job
+        # counts - one pass for the whole page, no to_dict() loop
+        counts = queue.counts_by_name([q.name for q in queues_list])
         queues_with_counts = []
         for q in queues_list:
-            queue_dict = q.to_dict()
-            # Get the number of jobs in this queue
-            queue_jobs = queue.get_queue_jobs(q.name)
-            queue_dict['job_count'] = len(queue_jobs)
-            queues_with_counts.append(queue_dict)
-        
+            queue_out = QueueOut.model_validate(q)
+            queue_out.job_count = counts.get(q.name, 0)
+            queues_with_counts.append(queue_out)
+
         return {
             "queues": queues_with_counts,
             "total": total,
@@ -1264,7 +1435,7 @@ async def get_queues(
             "per_page": per_page,
             "total_pages": total_pages
         }
-        
+
     except Exception as e:
         output.error(f"Error getting queues: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1272,94 +1443,115 @@ async def get_queues(
 @app.get("/api/queues/realtime", tags=["queues"])
 async def stream_queues_realtime(
     page: int = Query(1, ge=1, description="Page number"),
-    per_page: int = Query(20, ge=1, le=100, description="Items per page")
+    per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    _slot: None = Depends(_sse_slot)
 ):
-    """Stream queue list updates in real-time using Server-Sent Events with 0.5s polling."""
-    import asyncio
-    import json
-    from fastapi.responses import StreamingResponse
-    
+    """Stream queue list updates in real-time using Server-Sent Events."""
     try:
         async def queues_stream_generator():
             last_queues_hash = ""
             update_count = 0
-            no_change_count = 0
+            idle_timeout = 600  # close after 10 min without a data change
+            idle_deadline = time.monotonic() + idle_timeout
+            connected_sent = False
             first_run = True
-            
-            while True:
-                try:
-                    # Get current queues using the same logic as the regular queues endpoint
-                    offset = (page - 1) * per_page
-                    
-                    queues_list, total = queue.list_with_count(
-                        limit=per_page,
-                        offset=offset
-                    )
-                    
-                    # Add job counts and worker assignments to each queue
-                    queues_with_data = []
-                    for q in queues_list:
-                        queue_dict = q.to_dict()
-                        # Get the number of jobs in this queue
-                        queue_jobs = queue.get_queue_jobs(q.name)
-                        queue_dict['job_count'] = len(queue_jobs)
-                        queues_with_data.append(queue_dict)
+            timed_out = False
+            err_sleep = 1.0  # error backoff, reset after each clean iteration
+            loop = asyncio.get_running_loop()
+            queues_changed = EventWaiter(bus.event(bus.QUEUES))
+
+            try:
+                while True:
+                    try:
+                        # Get current queues using the same logic as the regular queues endpoint
+                        offset = (page - 1) * per_page
+
+                        def fetch_queues():
+                            """Query + per-queue job counts, off the event loop"""
+                            queues_list, total = queue.list_with_count(
+                                limit=per_page,
+                                offset=offset
+                            )
+
+                            # Add job counts to each queue - one pass for
+                            # the whole page
+                            counts = queue.counts_by_name([q.name for q in queues_list])
+                            queues_with_data = []
+                            for q in queues_list:
+                                queue_dict = q.to_dict()
+                                queue_dict['job_count'] = counts.get(q.name, 0)
+                                queues_with_data.append(queue_dict)
+                            return queues_list, total, queues_with_data
+
+                        queues_list, total, queues_with_data = await loop.run_in_executor(None, fetch_queues)
                     
-                    # Convert queues to response format
-                    queues_data = {
-                        "queues": queues_with_data,
-                        "total": total,
-                        "page": page,
-                        "per_page": per_page,
-                        "total_pages": (total + per_page - 1) // per_page,
-                        "update_count": update_count
-                    }
+                        # Convert queues to response format
+                        queues_data = {
+                            "queues": queues_with_data,
+                            "total": total,
+                            "page": page,
+                            "per_page": per_page,
+                            "total_pages": (total + per_page - 1) // per_page,
+                            "update_count": update_count
+                        }
                     
-                    # Create hash of essential queue data to detect changes
-                    queues_hash = json.dumps([
-                        {
-                            "id": queue_data["id"],
-                            "name": queue_data["name"],
-                            "state": queue_data["state"],
-                            "job_count": queue_data["job_count"]
-                        } for queue_data in queues_data["queues"]
-                    ], sort_keys=True)
+                        # Create hash of essential queue data to detect changes
+                        queues_hash = json.dumps([
+                            {
+                                "id": queue_data["id"],
+                                "name": queue_data["name"],
+                                "state": queue_data["state"],
+                                "job_count": queue_data["job_count"]
+                            } for queue_data in queues_data["queues"]
+                        ], sort_keys=True)
                     
-                    # Send initial data on first run or when data changed
-                    if first_run or queues_hash != last_queues_hash:
-                        if first_run:
-                            output.info(f"📡 Real-time: Sending initial SSE data for {len(queues_data['queues'])} queues")
-                            first_run = False
+                        # Send initial data on first run or when data changed
+                        if first_run or queues_hash != last_queues_hash:
+                            if first_run:
+                                output.info(f"📡 Real-time: Sending initial SSE data for {len(queues_data['queues'])} queues")
+                                first_run = False
+                            else:
+                                output.info(f"📡 Real-time: Queue data changed, sending SSE update")
+                            yield f"event: queues_update\ndata: {orjson.dumps(queues_data).decode()}\n\n"
+                            last_queues_hash = queues_hash
+                            update_count += 1
+                            idle_deadline = time.monotonic() + idle_timeout
+                        elif timed_out:
+                            # Send connected message only once after initial update
+                            if not connected_sent:
+                                connected_sent = True
+                                yield f"data: Connected to queue list stream\n\n"
+                            # Send heartbeat every 30 seconds
+                            else:
+                                now = int(time.time())
+                                yield f"event: heartbeat\ndata: {orjson.dumps({'timestamp': now, 'queues_count': len(queues_list)}).decode()}\n\n"
+
+                            # Close stream if no changes for 10 minutes
+                            if time.monotonic() >= idle_deadline:
+                                output.info("📡 Real-time: Closing inactive queue stream")
+                                yield f"event: close\ndata: Stream closed due to inactivity\n\n"
+                                break
                         else:
-                            output.info(f"📡 Real-time: Queue data changed, sending SSE update")
-                        yield f"event: queues_update\ndata: {json.dumps(queues_data)}\n\n"
-                        last_queues_hash = queues_hash
-                        update_count += 1
-                        no_change_count = 0
-                    else:
-                        no_change_count += 1
-                        if no_change_count % 10 == 0:  # Log every 5 seconds
-                            output.debug(f"📡 Real-time queues: No changes detected ({no_change_count} cycles)")
-                        
-                        # Send connected message only once after initial update
-                        if no_change_count == 1 and update_count == 1:
-                            yield f"data: Connected to queue list stream\n\n"
-                        # Send heartbeat every 30 seconds
-                        elif no_change_count % 60 == 0:  # Every 30 seconds
-                            yield f"event: heartbeat\ndata: {json.dumps({'timestamp': update_count, 'queues_count': len(queues_list)})}\n\n"
-                        
-                        # Close stream if no changes for 10 minutes
-                        if no_change_count > 1200:  # 10 minutes
-                            output.info("📡 Real-time: Closing inactive queue stream")
-                            yield f"event: close\ndata: Stream closed due to inactivity\n\n"
-                            break
-                    
-                    await asyncio.sleep(0.5)  # Poll every 500ms
-                    
-                except Exception as e:
-                    output.error(f"Error in queue stream: {e}")
-                    yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
-                    await asyncio.sleep(5)  # Wait longer on error
+                            # Woken by a change that didn't land on this page
+                            output.debug(f"📡 Real-time queues: Change did not affect this page")
+
+                        err_sleep = 1.0
+
+                        # Block until a queue mutation signals the bus instead of
+                        # polling; the heartbeat timeout drives heartbeats and
+                        # idle detection
+                        timed_out = await queues_changed.wait()
+
+
+                    except Exception as e:
+                        output.error(f"Error in queue stream: {e}")
+                        yield f"event: error\ndata: {orjson.dumps({'error': str(e)}).decode()}\n\n"
+                        # Back off exponentially with jitter so a failing
+                        # database isn't hammered in lockstep on every tick
+                        await asyncio.sleep(err_sleep + random.uniform(0, err_sleep / 2))
+                        err_sleep = min(err_sleep * 2, 30)
+            finally:
+                queues_changed.close()
         
         return StreamingResponse(
             queues_stream_generator(),
@@ -1376,7 +1568,7 @@ async def stream_queues_realtime(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/queues/{queue_id}", tags=["queues"])
-async def get_queue(queue_id: int):
+def get_queue(queue_id: int):
     """Get a specific queue by ID."""
     try:
         q = queue.get_by_id(queue_id)
@@ -1393,7 +1585,7 @@ async def get_queue(queue_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/queues/{queue_id}", tags=["queues"])
-async def update_queue(queue_id: int, request: QueueUpdateRequest):
+def update_queue(queue_id: int, request: QueueUpdateRequest):
     """Update a specific queue."""
     try:
         updated_queue = queue.update(
@@ -1421,7 +1613,7 @@ async def update_queue(queue_id: int, request: QueueUpdateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/queues/{queue_id}", tags=["queues"])
-async def delete_queue(queue_id: int):
+def delete_queue(queue_id: int):
     """Delete a specific queue."""
     try:
         success = queue.delete(queue_id)
@@ -1440,7 +1632,7 @@ async def delete_queue(queue_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/queues/name/{queue_name}", tags=["queues"])
-async def get_queue_by_name(queue_name: str):
+def get_queue_by_name(queue_name: str):
     """Get a specific queue by name."""
     try:
         q = queue.get_by_name(queue_name)
@@ -1468,7 +1660,7 @@ async def get_available_strategies():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/queues/{queue_id}/start", tags=["queues"])
-async def start_queue(queue_id: int):
+def start_queue(queue_id: int):
     """Start a queue (set state to 'started')."""
     try:
         q = queue.start_queue(queue_id)
@@ -1485,7 +1677,7 @@ async def start_queue(queue_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/queues/{queue_id}/stop", tags=["queues"])
-async def stop_queue(queue_id: int):
+def stop_queue(queue_id: int):
     """Stop a queue (set state to 'stopped')."""
     try:
         q = queue.stop_queue(queue_id)
@@ -1502,7 +1694,7 @@ async def stop_queue(queue_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/queues/{queue_id}/pause", tags=["queues"])
-async def pause_queue(queue_id: int):
+def pause_queue(queue_id: int):
     """Pause a queue (set state to 'paused')."""
     try:
         q = queue.pause_queue(queue_id)
@@ -1519,7 +1711,7 @@ async def pause_queue(queue_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/queues/{queue_id}/workers", tags=["queues"])
-async def get_queue_workers(queue_id: int):
+def get_queue_workers(queue_id: int):
     """Get all workers assigned to a specific queue."""
     try:
         workers = queue.get_queue_workers(queue_id)
@@ -1535,7 +1727,7 @@ async def get_queue_workers(queue_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/queues/{queue_id}/available-workers", tags=["queues"])
-async def get_available_workers_for_queue(queue_id: int):
+def get_available_workers_for_queue(queue_id: int):
     """Get all workers not assigned to a specific queue."""
     try:
         workers = queue.get_available_workers_for_queue(queue_id)
@@ -1554,7 +1746,7 @@ class WorkerAssignmentRequest(BaseModel):
     worker_ids: List[int] = Field(..., description="List of worker IDs to assign")
 
 @app.post("/api/queues/{queue_id}/workers/bulk", tags=["queues"])
-async def assign_multiple_workers_to_queue(queue_id: int, request: WorkerAssignmentRequest):
+def assign_multiple_workers_to_queue(queue_id: int, request: WorkerAssignmentRequest):
     """Assign multiple workers to a queue at once."""
     try:
         success = queue.assign_multiple_workers_to_queue(request.worker_ids, queue_id)
@@ -1571,7 +1763,7 @@ async def assign_multiple_workers_to_queue(queue_id: int, request: WorkerAssignm
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/queues/{queue_id}/workers/{worker_id}", tags=["queues"])
-async def assign_worker_to_queue(queue_id: int, worker_id: int):
+def assign_worker_to_queue(queue_id: int, worker_id: int):
     """Assign a worker to a queue."""
     try:
         success = queue.assign_worker_to_queue(worker_id, queue_id)
@@ -1588,7 +1780,7 @@ async def assign_worker_to_queue(queue_id: int, worker_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/queues/{queue_id}/workers/{worker_id}", tags=["queues"])
-async def unassign_worker_from_queue(queue_id: int, worker_id: int):
+def unassign_worker_from_queue(queue_id: int, worker_id: int):
     """Unassign a worker from a queue."""
     try:
         success = queue.unassign_worker_from_queue(worker_id, queue_id)
@@ -1605,17 +1797,26 @@ async def unassign_worker_from_queue(queue_id: int, worker_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/queues/{queue_id}/logs", tags=["queues"])
-async def get_queue_logs(queue_id: int):
+def get_queue_logs(queue_id: int):
     """Get queue logs as plain text."""
     try:
-        log_content = queue.get_log_content(queue_id)
-        if log_content is None:
-            log_content = f"Error: Unable to retrieve logs for queue {queue_id}"
-        
-        # Always return something, even if it's an error message
-        from fastapi.responses import PlainTextResponse
-        return PlainTextResponse(content=log_content, media_type="text/plain")
-        
+        log_file_path = queue.get_log_file_path(queue_id)
+        if not log_file_path:
+            return PlainTextResponse(content=f"No log file path configured for queue {queue_id}", media_type="text/plain")
+
+        if not os.path.exists(log_file_path) or os.path.getsize(log_file_path) == 0:
+            # Always return something - empty string breaks frontend LogViewer
+            return PlainTextResponse(content="(no logs yet)", media_type="text/plain")
+
+        # Whole-file download: FileResponse lets uvicorn use sendfile(2),
+        # pushing the file kernel-to-socket without copying it through
+        # Python at all (queue logs grow without bound between clears)
+        return FileResponse(
+            path=log_file_path,
+            media_type="text/plain",
+            filename=f"queue-{queue_id}.log"
+        )
+
     except HTTPException:
         raise
     except Exception as e:
@@ -1623,14 +1824,13 @@ async def get_queue_logs(queue_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/queues/{queue_id}/logs/clear", tags=["queues"])
-async def clear_queue_logs(queue_id: int):
+def clear_queue_logs(queue_id: int):
     """Clear queue logs (truncate log file)."""
     try:
-        # Verify queue exists
-        queue_record = queue.get_by_id(queue_id)
-        if not queue_record:
+        # One-column existence check instead of hydrating the full queue row
+        if queue.get_log_file_path(queue_id) is None:
             raise HTTPException(status_code=404, detail="Queue not found")
-        
+
         success = queue.clear_log_content(queue_id)
         if not success:
             raise HTTPException(status_code=500, detail="Failed to clear queue logs")
@@ -1644,87 +1844,120 @@ async def clear_queue_logs(queue_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/queues/{queue_id}/logs/stream", tags=["queues"])
-async def stream_queue_logs(queue_id: int):
-    """Stream queue logs in real-time using Server-Sent Events."""
-    import asyncio
-    from fastapi.responses import StreamingResponse
-    from pathlib import Path
-    
-    try:
-        # Verify queue exists
-        queue_record = queue.get_by_id(queue_id)
-        if not queue_record:
-            raise HTTPException(status_code=404, detail="Queue not found")
-        
-        log_file_path = queue_record.log_file_path
-        if not log_file_path or not Path(log_file_path).exists():
-            raise HTTPException(status_code=404, detail="Queue log file not found")
-        
-        async def log_stream_generator():
+def _queue_log_path_or_404(queue_id: int) -> str:
+    """Resolve a queue id to its log file path.
+
+    Runs as a dependency so the 404 goes out before the SSE response
+    starts - an HTTPException raised inside a streaming generator can't
+    become a status code anymore.
+    """
+    log_file_path = queue.get_log_file_path(queue_id)
+    if not log_file_path:
+        raise HTTPException(status_code=404, detail="Queue not found")
+
+    if not Path(log_file_path).exists():
+        raise HTTPException(status_code=404, detail="Queue log file not found")
+    return log_file_path
+
+
+@app.get("/api/queues/{queue_id}/logs/stream", tags=["queues"], response_class=EventSourceResponse)
+async def stream_queue_logs(
+    queue_id: int,
+    log_file_path: str = Depends(_queue_log_path_or_404),
+    _slot: None = Depends(_sse_slot)
+):
+    """Stream queue logs in real-time using Server-Sent Events.
+
+    A generator endpoint: the routing layer frames each ServerSentEvent
+    (splitting payloads into data: lines) and injects keepalive comments
+    while idle, so nothing here hand-rolls the wire format.
+    """
+    last_position = 0
+    idle_timeout = 300  # close after 5 min without new data
+    idle_deadline = time.monotonic() + idle_timeout
+    err_sleep = 1.0  # error backoff, reset after each clean read
+
+    async def read_new_content():
+        # aiofiles keeps a large tail read off the event loop -
+        # async generators are never threadpooled by Starlette,
+        # so a sync read here would stall every other request
+        nonlocal last_position
+        # Rotation/truncation - start over from the top
+        if os.path.getsize(log_file_path) < last_position:
             last_position = 0
-            no_new_data_count = 0
-            
-            # Send initial connection message
-            yield f"event: connected\ndata: Queue logs stream connected\n\n"
-            
-            while True:
-                try:
-                    # Read new content from log file
-                    with open(log_file_path, 'r', encoding='utf-8', errors='replace') as f:
-                        f.seek(last_position)
-                        new_content = f.read()
-                        current_position = f.tell()
-                    
-                    if new_content:
-                        # Send new log content
-                        for line in new_content.splitlines():
-                            if line.strip():  # Only send non-empty lines
-                                yield f"data: {line}\n\n"
-                        last_position = current_position
-                        no_new_data_count = 0
-                    else:
-                        no_new_data_count += 1
-                        
-                        # Send heartbeat every 30 seconds
-                        if no_new_data_count % 60 == 0:  # 60 * 0.5s = 30s
-                            yield f"event: heartbeat\ndata: Queue logs monitoring active\n\n"
-                        
-                        # Timeout after 5 minutes of no new data
-                        if no_new_data_count > 600:  # 600 * 0.5s = 5 minutes
-                            yield "event: timeout\ndata: No new log data for 5 minutes, closing stream\n\n"
-                            break
-                    
-                    await asyncio.sleep(0.5)  # Check every 500ms
-                    
-                except FileNotFoundError:
-                    yield "event: error\ndata: Log file no longer exists\n\n"
+        async with aiofiles.open(log_file_path, 'r', encoding='utf-8', errors='replace') as f:
+            await f.seek(last_position)
+            new_content = await f.read()
+            last_position = await f.tell()
+        return new_content
+
+    def batch_event(content):
+        # One SSE event for the whole read - the response class splits
+        # the payload into one data: line per log line, and EventSource
+        # rejoins them with newlines on the client
+        lines = [line for line in content.splitlines() if line.strip()]
+        if not lines:
+            return None
+        return ServerSentEvent(raw_data="\n".join(lines))
+
+    # Send initial connection message
+    yield ServerSentEvent(event="connected", raw_data="Queue logs stream connected")
+
+    try:
+        # Send what's already in the file, then block on kernel
+        # file events instead of waking every 500ms to stat/read;
+        # yield_on_timeout gives a 30s tick for heartbeats and
+        # the idle check while nothing is written
+        event = batch_event(await read_new_content())
+        if event:
+            yield event
+
+        async for changes in awatch(log_file_path, debounce=200,
+                                    rust_timeout=30_000, yield_on_timeout=True):
+            if not changes:
+                # Timeout tick - no file activity
+                yield ServerSentEvent(event="heartbeat", raw_data="Queue logs monitoring active")
+                if time.monotonic() >= idle_deadline:
+                    yield ServerSentEvent(event="timeout", raw_data="No new log data for 5 minutes, closing stream")
                     break
-                except Exception as e:
-                    output.error(f"Error streaming queue logs: {e}")
-                    yield f"event: error\ndata: {str(e)}\n\n"
-                    await asyncio.sleep(5)  # Wait longer on error
-        
-        return StreamingResponse(
-            log_stream_generator(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Headers": "Cache-Control"
-            }
-        )
-        
-    except HTTPException:
-        raise
+                continue
+
+            if (any(change is Change.deleted for change, _ in changes)
+                    and not os.path.exists(log_file_path)):
+                yield ServerSentEvent(event="error", raw_data="Log file no longer exists")
+                break
+
+            try:
+                new_content = await read_new_content()
+            except FileNotFoundError:
+                yield ServerSentEvent(event="error", raw_data="Log file no longer exists")
+                break
+            except Exception as e:
+                output.error(f"Error streaming queue logs: {e}")
+                yield ServerSentEvent(event="error", raw_data=str(e))
+                # Back off exponentially with jitter so a failing
+                # read isn't retried on every file event
+                await asyncio.sleep(err_sleep + random.uniform(0, err_sleep / 2))
+                err_sleep = min(err_sleep * 2, 30)
+                continue
+            err_sleep = 1.0
+
+            if new_content:
+                # Send new log content as a single coalesced event
+                event = batch_event(new_content)
+                if event:
+                    yield event
+                idle_deadline = time.monotonic() + idle_timeout
+
+    except FileNotFoundError:
+        yield ServerSentEvent(event="error", raw_data="Log file no longer exists")
     except Exception as e:
-        output.error(f"Error setting up queue log stream for {queue_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        output.error(f"Error streaming queue logs: {e}")
+        yield ServerSentEvent(event="error", raw_data=str(e))
 
 
 @app.post("/api/workers", tags=["workers"])
-async def create_worker(request: WorkerCreateRequest):
+def create_worker(request: WorkerCreateRequest):
     """Create a new worker."""
     try:
         output.info(f"Creating worker: provision={request.provision}, create_user={request.create_user}")
@@ -1763,7 +1996,7 @@ async def create_worker(request: WorkerCreateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/workers/deployment-status/{deployment_id}", tags=["workers"])
-async def get_deployment_status(deployment_id: str):
+def get_deployment_status(deployment_id: str):
     """Get real-time deployment status for a worker."""
     try:
         from worker import deployment_status
@@ -1791,7 +2024,7 @@ async def get_deployment_status(deployment_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/workers", tags=["workers"])
-async def get_workers(
+def get_workers(
     page: int = 1,
     per_page: int = 20,
     name_filter: Optional[str] = None,
@@ -1812,17 +2045,13 @@ async def get_workers(
         
         total_pages = (total + per_page - 1) // per_page
         
-        # Enhance each worker's data with running jobs count
+        # Enhance each worker's data with running jobs count - one
+        # grouped query for the whole page instead of one per worker
+        counts = queue.get_running_jobs_counts([w.name for w in workers_list])
         enhanced_workers = []
         for w in workers_list:
             worker_dict = w.to_dict()
-            # Get current running jobs count for this worker
-            try:
-                running_jobs_count = queue._get_worker_running_jobs_count(w.name)
-                worker_dict['current_jobs'] = running_jobs_count
-            except Exception as e:
-                output.warning(f"Could not get running jobs count for worker {w.name}: {e}")
-                worker_dict['current_jobs'] = 0
+            worker_dict['current_jobs'] = counts.get(w.name, 0)
             enhanced_workers.append(worker_dict)
         
         return {
@@ -1838,7 +2067,7 @@ async def get_workers(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/workers/statistics", tags=["workers"])
-async def get_worker_statistics():
+def get_worker_statistics():
     """Get worker statistics."""
     try:
         stats = worker.get_worker_statistics()
@@ -1849,7 +2078,7 @@ async def get_worker_statistics():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/workers/available", tags=["workers"])
-async def get_available_workers():
+def get_available_workers():
     """Get all available (online) workers."""
     try:
         workers_list = worker.get_available_workers()
@@ -1864,7 +2093,7 @@ async def get_available_workers():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/workers/monitoring", tags=["workers"])
-async def get_worker_monitoring_settings():
+def get_worker_monitoring_settings():
     """Get worker monitoring settings."""
     try:
         # Get current monitoring interval from worker instance
@@ -1881,7 +2110,7 @@ class MonitoringUpdateRequest(BaseModel):
     interval: int = Field(..., ge=5, le=300, description="Monitoring interval in seconds (5-300)")
 
 @app.put("/api/workers/monitoring", tags=["workers"])
-async def update_worker_monitoring_settings(request: MonitoringUpdateRequest):
+def update_worker_monitoring_settings(request: MonitoringUpdateRequest):
     """Update worker monitoring settings."""
     try:
         # Update monitoring interval on worker instance
@@ -1896,46 +2125,51 @@ async def update_worker_monitoring_settings(request: MonitoringUpdateRequest):
         output.error(f"Error updating monitoring settings: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/workers/realtime", tags=["workers"])
-async def stream_workers_realtime(
-    page: int = Query(1, ge=1, description="Page number"),
-    per_page: int = Query(20, ge=1, le=100, description="Items per page")
-):
-    """Stream worker list updates in real-time using Server-Sent Events with 0.5s polling."""
-    import asyncio
-    import json
-    from fastapi.responses import StreamingResponse
-    
-    try:
-        async def workers_stream_generator():
-            last_workers_hash = ""
-            update_count = 0
-            no_change_count = 0
-            first_run = True
-            
+# One poller per (page, per_page) - every SSE client on the same page
+# shares its frames instead of running an identical 0.5s query loop
+_worker_broadcasters: Dict[tuple, Broadcaster] = {}
+
+
+def _get_worker_broadcaster(page: int, per_page: int) -> Broadcaster:
+    """Get (or start) the shared worker stream producer for a page"""
+    key = (page, per_page)
+    broadcaster = _worker_broadcasters.get(key)
+    if broadcaster is not None:
+        return broadcaster
+
+    async def run(bcast):
+        last_workers_hash = None
+        update_count = 0
+        no_change_count = 0
+        idle_timeout = 600  # close after 10 min without a data change
+        idle_deadline = time.monotonic() + idle_timeout
+        first_run = True
+        err_sleep = 1.0  # error backoff, reset after each clean iteration
+        loop = asyncio.get_running_loop()
+        offset = (page - 1) * per_page
+
+        try:
             while True:
                 try:
-                    # Get current workers using the same logic as the regular workers endpoint
-                    offset = (page - 1) * per_page
-                    
-                    workers_list, total = worker.list_with_count(
-                        limit=per_page,
-                        offset=offset
-                    )
-                    
-                    # Enhance each worker's data with running jobs count
-                    enhanced_workers = []
-                    for w in workers_list:
-                        worker_dict = w.to_dict()
-                        # Get current running jobs count for this worker
-                        try:
-                            running_jobs_count = queue._get_worker_running_jobs_count(w.name)
-                            worker_dict['current_jobs'] = running_jobs_count
-                        except Exception as e:
-                            output.debug(f"Could not get running jobs for worker {w.name}: {e}")
-                            worker_dict['current_jobs'] = 0
-                        enhanced_workers.append(worker_dict)
-                    
+                    def fetch_workers():
+                        """Query + batched running counts, off the event loop"""
+                        workers_list, total = worker.list_with_count(
+                            limit=per_page,
+                            offset=offset
+                        )
+
+                        # Enhance each worker's data with running jobs
+                        # count - one grouped query for the whole page
+                        counts = queue.get_running_jobs_counts([w.name for w in workers_list])
+                        enhanced_workers = []
+                        for w in workers_list:
+                            worker_dict = w.to_dict()
+                            worker_dict['current_jobs'] = counts.get(w.name, 0)
+                            enhanced_workers.append(worker_dict)
+                        return workers_list, total, enhanced_workers
+
+                    workers_list, total, enhanced_workers = await loop.run_in_executor(None, fetch_workers)
+
                     # Convert workers to response format
                     workers_data = {
                         "workers": enhanced_workers,
@@ -1945,18 +2179,24 @@ async def stream_workers_realtime(
                         "total_pages": (total + per_page - 1) // per_page,
                         "update_count": update_count
                     }
-                    
-                    # Create hash of essential worker data to detect changes
-                    workers_hash = json.dumps([
-                        {
-                            "id": worker_data["id"],
-                            "name": worker_data["name"],
-                            "status": worker_data["status"],
-                            "state": worker_data["state"],
-                            "current_jobs": worker_data.get("current_jobs", 0)
-                        } for worker_data in workers_data["workers"]
-                    ], sort_keys=True)
-                    
+
+                    # Digest of the change-relevant fields - an 8-byte
+                    # xxh3 over packed rows, no JSON encode/sort pass
+                    # just to compare for equality (same scheme as
+                    # job.list_page_digest). Skipped on the first tick:
+                    # that frame goes out unconditionally, so there is
+                    # nothing to compare against yet. The second tick
+                    # then sees no baseline and republishes once - a
+                    # redundant frame beats silently eating a change
+                    # that lands between the first two polls.
+                    if first_run:
+                        workers_hash = None
+                    else:
+                        h = xxhash.xxh3_64()
+                        for worker_data in enhanced_workers:
+                            h.update(f"{worker_data['id']}|{worker_data['name']}|{worker_data['status']}|{worker_data['state']}|{worker_data.get('current_jobs', 0)};".encode())
+                        workers_hash = h.intdigest()
+
                     # Send initial data on first run or when data changed
                     if first_run or workers_hash != last_workers_hash:
                         if first_run:
@@ -1964,37 +2204,61 @@ async def stream_workers_realtime(
                             first_run = False
                         else:
                             output.info(f"📡 Real-time: Worker data changed, sending SSE update")
-                        yield f"event: workers_update\ndata: {json.dumps(workers_data)}\n\n"
+                        bcast.publish(b"event: workers_update\ndata: " + orjson.dumps(workers_data) + b"\n\n")
                         last_workers_hash = workers_hash
                         update_count += 1
                         no_change_count = 0
+                        idle_deadline = time.monotonic() + idle_timeout
                     else:
                         no_change_count += 1
                         if no_change_count % 10 == 0:  # Log every 5 seconds
                             output.debug(f"📡 Real-time workers: No changes detected ({no_change_count} cycles)")
-                        
-                        # Send connected message only once after initial update  
-                        if no_change_count == 1 and update_count == 1:
-                            yield f"data: Connected to worker list stream\n\n"
+
                         # Send heartbeat every 30 seconds
-                        elif no_change_count % 60 == 0:  # Every 30 seconds
-                            yield f"event: heartbeat\ndata: {json.dumps({'timestamp': update_count, 'workers_count': len(workers_list)})}\n\n"
-                        
+                        if no_change_count % 60 == 0:
+                            now = int(time.time())
+                            bcast.publish(b"event: heartbeat\ndata: " + orjson.dumps({'timestamp': now, 'workers_count': len(workers_list)}) + b"\n\n")
+
                         # Close stream if no changes for 10 minutes
-                        if no_change_count > 1200:  # 10 minutes
+                        if time.monotonic() >= idle_deadline:
                             output.info("📡 Real-time: Closing inactive worker stream")
-                            yield f"event: close\ndata: Stream closed due to inactivity\n\n"
+                            bcast.publish("event: close\ndata: Stream closed due to inactivity\n\n")
                             break
-                    
+
+                    err_sleep = 1.0
                     await asyncio.sleep(0.5)  # Poll every 500ms
-                    
+
                 except Exception as e:
                     output.error(f"Error in worker stream: {e}")
-                    yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
-                    await asyncio.sleep(5)  # Wait longer on error
-        
+                    bcast.publish(b"event: error\ndata: " + orjson.dumps({'error': str(e)}) + b"\n\n")
+                    # Back off exponentially with jitter so a failing
+                    # database isn't hammered in lockstep on every tick
+                    await asyncio.sleep(err_sleep + random.uniform(0, err_sleep / 2))
+                    err_sleep = min(err_sleep * 2, 30)
+        finally:
+            bcast.close()
+
+    broadcaster = Broadcaster(run, on_stop=lambda: _worker_broadcasters.pop(key, None))
+    _worker_broadcasters[key] = broadcaster
+    return broadcaster
+
+
+@app.get("/api/workers/realtime", tags=["workers"])
+async def stream_workers_realtime(
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    _slot: None = Depends(_sse_slot)
+):
+    """Stream worker list updates in real-time using Server-Sent Events.
+
+    All clients on the same page share one 0.5s poller via a Broadcaster;
+    database load stays constant no matter how many dashboards connect.
+    """
+    try:
+        broadcaster = _get_worker_broadcaster(page, per_page)
+
         return StreamingResponse(
-            workers_stream_generator(),
+            broadcaster.subscribe(),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -2008,7 +2272,7 @@ async def stream_workers_realtime(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/workers/{worker_id}", tags=["workers"])
-async def get_worker(worker_id: int):
+def get_worker(worker_id: int):
     """Get a specific worker by ID."""
     try:
         w = worker.get_by_id(worker_id)
@@ -2025,7 +2289,7 @@ async def get_worker(worker_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/workers/{worker_id}", tags=["workers"])
-async def update_worker(worker_id: int, request: WorkerUpdateRequest):
+def update_worker(worker_id: int, request: WorkerUpdateRequest):
     """Update a specific worker."""
     try:
         updated_worker = worker.update(
@@ -2057,7 +2321,7 @@ async def update_worker(worker_id: int, request: WorkerUpdateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/workers/{worker_id}", tags=["workers"])
-async def delete_worker(worker_id: int):
+def delete_worker(worker_id: int):
     """Delete a specific worker."""
     try:
         success = worker.delete(worker_id)
@@ -2092,12 +2356,9 @@ async def get_worker_logs(worker_id: int):
         if log_generator is None:
             return PlainTextResponse(content="", media_type="text/plain")
         
-        # Read all content
-        log_content = ""
-        async for chunk in log_generator:
-            log_content += chunk
-        
-        return PlainTextResponse(content=log_content, media_type="text/plain")
+        # Stream chunks straight to the client instead of buffering the
+        # whole file in memory first
+        return StreamingResponse(log_generator, media_type="text/plain")
     
     except HTTPException:
         raise
@@ -2105,67 +2366,61 @@ async def get_worker_logs(worker_id: int):
         output.error(f"Error getting logs for worker {worker_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/workers/{worker_id}/logs/stream", tags=["workers"])
-async def stream_worker_logs(worker_id: int):
-    """Stream logs for a specific worker using Server-Sent Events."""
+def _worker_name_or_404(worker_id: int) -> str:
+    """Resolve a worker id to its name.
+
+    Runs as a dependency so the 404 goes out before the SSE response
+    starts - an HTTPException raised inside a streaming generator can't
+    become a status code anymore.
+    """
+    worker_record = worker.get_by_id(worker_id)
+    if not worker_record:
+        raise HTTPException(status_code=404, detail=f"Worker with ID {worker_id} not found")
+    return worker_record.name
+
+
+@app.get("/api/workers/{worker_id}/logs/stream", tags=["workers"], response_class=EventSourceResponse)
+async def stream_worker_logs(
+    worker_id: int,
+    worker_name: str = Depends(_worker_name_or_404),
+    _slot: None = Depends(_sse_slot)
+):
+    """Stream logs for a specific worker using Server-Sent Events.
+
+    A generator endpoint: the routing layer frames each ServerSentEvent -
+    multi-line chunks become one data: line per log line, replacing the
+    old per-chunk str.replace escaping - and injects keepalive comments
+    while idle.
+    """
     try:
-        # Get worker name from database
-        worker_record = worker.get_by_id(worker_id)
-        if not worker_record:
-            raise HTTPException(status_code=404, detail=f"Worker with ID {worker_id} not found")
-        
-        worker_name = worker_record.name
-        
-        async def generate():
-            try:
-                # Get log generator with follow=True for streaming
+        # Get log generator with follow=True for streaming
+        log_generator = await logger.get_worker_log_content(worker_name, follow=True)
+
+        if log_generator is None:
+            # No log file yet, but keep connection open
+            yield ServerSentEvent(raw_data="")
+            # Keep checking for log file creation
+            while True:
+                await asyncio.sleep(1)
                 log_generator = await logger.get_worker_log_content(worker_name, follow=True)
-                
-                if log_generator is None:
-                    # No log file yet, but keep connection open
-                    yield f"data: \n\n"
-                    # Keep checking for log file creation
-                    while True:
-                        await asyncio.sleep(1)
-                        log_generator = await logger.get_worker_log_content(worker_name, follow=True)
-                        if log_generator is not None:
-                            break
-                        yield f"data: \n\n"  # Send keepalive
-                
-                # Stream the log content
-                async for log_chunk in log_generator:
-                    if log_chunk:
-                        # Escape the data properly for SSE
-                        escaped = log_chunk.replace('\n', '\ndata: ')
-                        yield f"data: {escaped}\n\n"
-                    else:
-                        # Send a keepalive comment
-                        yield f": keepalive\n\n"
-                    
-                    await asyncio.sleep(0.1)  # Small delay between chunks
-                    
-            except asyncio.CancelledError:
-                output.info(f"Worker log stream cancelled for worker {worker_id}")
-                raise
-            except Exception as e:
-                output.error(f"Error in worker log stream: {e}")
-                yield f"data: Error: {str(e)}\n\n"
-        
-        return StreamingResponse(
-            generate(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no"  # Disable nginx buffering
-            }
-        )
-    
-    except HTTPException:
+                if log_generator is not None:
+                    break
+                yield ServerSentEvent(raw_data="")  # Send keepalive
+
+        # Stream the log content - no artificial delay between chunks;
+        # the follower only yields when the file grew, idle keepalives
+        # come from the response layer, and the ASGI writer provides
+        # natural backpressure
+        async for log_chunk in log_generator:
+            if log_chunk:
+                yield ServerSentEvent(raw_data=log_chunk)
+
+    except asyncio.CancelledError:
+        output.info(f"Worker log stream cancelled for worker {worker_id}")
         raise
     except Exception as e:
-        output.error(f"Error streaming logs for worker {worker_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        output.error(f"Error in worker log stream: {e}")
+        yield ServerSentEvent(raw_data=f"Error: {str(e)}")
 
 @app.post("/api/workers/{worker_id}/logs/clear", tags=["workers"])
 async def clear_worker_logs(worker_id: int):
@@ -2193,7 +2448,7 @@ async def clear_worker_logs(worker_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/workers/name/{worker_name}", tags=["workers"])
-async def get_worker_by_name(worker_name: str):
+def get_worker_by_name(worker_name: str):
     """Get a specific worker by name."""
     try:
         w = worker.get_by_name(worker_name)
@@ -2210,7 +2465,7 @@ async def get_worker_by_name(worker_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/workers/{worker_id}/provision", tags=["workers"])
-async def provision_worker_endpoint(worker_id: int):
+def provision_worker_endpoint(worker_id: int):
     """Provision a worker."""
     try:
         success = worker.provision_worker(worker_id)
@@ -2227,7 +2482,7 @@ async def provision_worker_endpoint(worker_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/workers/{worker_id}/start", tags=["workers"])
-async def start_worker(worker_id: int):
+def start_worker(worker_id: int):
     """Start a worker (set state to 'started')."""
     try:
         success = worker.start_worker(worker_id)
@@ -2244,7 +2499,7 @@ async def start_worker(worker_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/workers/{worker_id}/stop", tags=["workers"])
-async def stop_worker(worker_id: int):
+def stop_worker(worker_id: int):
     """Stop a worker (set state to 'stopped')."""
     try:
         w = worker.stop_worker(worker_id)
@@ -2261,7 +2516,7 @@ async def stop_worker(worker_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/workers/{worker_id}/pause", tags=["workers"])
-async def pause_worker(worker_id: int):
+def pause_worker(worker_id: int):
     """Pause a worker (set state to 'paused')."""
     try:
         w = worker.pause_worker(worker_id)
@@ -2277,18 +2532,36 @@ async def pause_worker(worker_id: int):
         output.error(f"Error pausing worker {worker_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Per-queue worker lists are polled by the UI; a short TTL collapses
+# the poll load to at most one query per queue every 2s regardless of
+# how many clients watch. Assignments change rarely, so 2s staleness
+# is invisible next to the poll interval itself.
+_queue_workers_cache = TTLCache(maxsize=256, ttl=2)
+_queue_workers_cache_lock = threading.Lock()
+
 @app.get("/api/workers/queue/{queue_name}", tags=["workers"])
-async def get_workers_by_queue(queue_name: str):
+def get_workers_by_queue(queue_name: str):
     """Get all workers assigned to a specific queue."""
     try:
-        workers_list = queue.get_queue_workers_by_name(queue_name)
-        
-        return {
-            "workers": [w.to_dict() for w in workers_list],
-            "queue_name": queue_name,
-            "count": len(workers_list)
-        }
-        
+        # Sync endpoint runs on the threadpool - TTLCache isn't
+        # thread-safe, so guard it like the other shared caches
+        with _queue_workers_cache_lock:
+            payload = _queue_workers_cache.get(queue_name)
+        if payload is None:
+            workers_list = queue.get_queue_workers_by_name(queue_name)
+            payload = {
+                "workers": [w.to_dict() for w in workers_list],
+                "queue_name": queue_name,
+                "count": len(workers_list)
+            }
+            with _queue_workers_cache_lock:
+                _queue_workers_cache[queue_name] = payload
+
+        # to_dict output is already JSON-safe primitives - returning the
+        # response directly skips FastAPI's jsonable_encoder walk over
+        # every row before orjson sees it
+        return ORJSONResponse(payload)
+
     except Exception as e:
         output.error(f"Error getting workers for queue '{queue_name}': {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2300,28 +2573,28 @@ class LogAppendRequest(BaseModel):
     log_data: str = Field(..., description="Log data to append (can be base64 encoded)")
     is_base64: bool = Field(default=False, description="Whether log_data is base64 encoded")
 
-@app.post("/api/node/status", tags=["nodes"])
-async def update_job_status(request: JobStatusRequest):
-    """Update job status from worker node callback."""
-    try:
-        # Parse execution_id to extract queue_name and job_id
-        try:
-            queue_name, job_id_str = request.execution_id.split(':', 1)
-            job_id = int(job_id_str)
-        except (ValueError, IndexError):
-            raise HTTPException(status_code=400, detail=f"Invalid execution_id format: {request.execution_id}. Expected: queue_name:job_id")
-        
-        # Update job status based on worker callback
-        with db.get_session() as session:
+def _apply_status_updates(events):
+    """Apply a batch of worker status events on one database session.
+
+    Each event is (queue_name, job_id, execution_id, status, exit_code,
+    error). Shared by the HTTP callback endpoint (batch of one) and the
+    Redis status stream consumer (up to 100 per read). Returns
+    (missing_job_ids, execution_ids_to_close).
+    """
+    missing = []
+    close_ids = []
+    with db.get_session() as session:
+        for queue_name, job_id, execution_id, status, exit_code, error in events:
             job_record = job.get_by_id(session, job_id)
             if not job_record:
-                raise HTTPException(status_code=404, detail="Job not found")
-            
+                missing.append(job_id)
+                continue
+
             # Update job status based on worker callback
-            if request.status == "started":
+            if status == "started":
                 job.update_status(session, job_id, "Running")
-            elif request.status == "completed":
-                if request.exit_code == 0:
+            elif status == "completed":
+                if exit_code == 0:
                     # Only set to Completed if job is not already Failed (e.g., from ERROR= in logs)
                     if job_record.status != "Failed":
                         # Set progress to 100% when job completes successfully
@@ -2330,39 +2603,87 @@ async def update_job_status(request: JobStatusRequest):
                         output.info(f"Job {job_id} already marked as Failed, preserving Failed status")
                     # Remove completed job from queue
                     queue.remove_job(queue_name, job_id)
-                    # Close log file handle for completed job
-                    await logger.close_log(request.execution_id)
+                    close_ids.append(execution_id)
                 else:
                     # Also preserve progress for failed jobs
                     current_progress = job_record.progress
-                    job.update_status(session, job_id, "Failed", 
+                    job.update_status(session, job_id, "Failed",
                                     progress=current_progress,
-                                    error_message=f"Process exited with code {request.exit_code}")
+                                    error_message=f"Process exited with code {exit_code}")
                     # Remove failed job from queue
                     queue.remove_job(queue_name, job_id)
-                    # Close log file handle for failed job
-                    await logger.close_log(request.execution_id)
-            elif request.status == "failed":
+                    close_ids.append(execution_id)
+            elif status == "failed":
                 # Check if job already has an error message (from log parsing with ERROR=)
                 if job_record.error_message:
                     # Job log ERROR= takes precedence - don't overwrite existing error message
-                    output.debug(f"Job {job_id} already has error message from log: {job_record.error_message}")
+                    output.debug("Job %s already has error message from log: %s", job_id, job_record.error_message)
                     job.update_status(session, job_id, "Failed")
                 else:
                     # No existing error, use worker error or default
-                    error_msg = request.error or "Worker reported job failure"
+                    error_msg = error or "Worker reported job failure"
                     job.update_status(session, job_id, "Failed", error_message=error_msg)
                 # Remove failed job from queue
                 queue.remove_job(queue_name, job_id)
-                # Close log file handle for failed job
-                await logger.close_log(request.execution_id)
-            
-            return {"success": True, "message": f"Job {job_id} status updated to {request.status}"}
-        
+                close_ids.append(execution_id)
+
+    return missing, close_ids
+
+
+def _handle_status_events(loop, raw_events):
+    """Apply a batch of Redis status stream events (consumer thread)."""
+    events = []
+    for ev in raw_events:
+        exec_id = ev['execution_id']
+        try:
+            queue_name, job_id_str = exec_id.split(':', 1)
+            events.append((queue_name, int(job_id_str), exec_id,
+                           ev['status'], ev.get('exit_code'), ev.get('error')))
+        except (ValueError, IndexError):
+            output.warning(f"Invalid execution_id in status event: {exec_id}")
+
+    if not events:
+        return
+
+    missing, close_ids = _apply_status_updates(events)
+    for job_id in missing:
+        output.warning(f"Status event for unknown job {job_id}")
+    for exec_id in close_ids:
+        # close_log uses loop-bound locks - marshal it onto the loop
+        asyncio.run_coroutine_threadsafe(logger.close_log(exec_id), loop)
+
+
+@app.post("/api/node/status", tags=["nodes"])
+async def update_job_status(request: JobStatusRequest):
+    """Update job status from worker node callback."""
+    try:
+        # Parse execution_id to extract queue_name and job_id
+        try:
+            queue_name, job_id_str = request.execution_id.split(':', 1)
+            job_id = int(job_id_str)
+        except (ValueError, IndexError):
+            raise HTTPException(status_code=400, detail=f"Invalid execution_id format: {request.execution_id}. Expected: queue_name:job_id")
+
+        event = (queue_name, job_id, request.execution_id,
+                 request.status, request.exit_code, request.error)
+        loop = asyncio.get_running_loop()
+        missing, close_ids = await loop.run_in_executor(
+            None, _apply_status_updates, [event])
+
+        if missing:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        for exec_id in close_ids:
+            # Close log file handle for the finished job
+            await logger.close_log(exec_id)
+
+        return {"success": True, "message": f"Job {job_id} status updated to {request.status}"}
+
     except HTTPException:
         raise
     except Exception as e:
-        output.error(f"Error updating job status for execution {execution_id}: {e}")
+        output.error(f"Error updating job status for execution {request.execution_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
 # WebSocket endpoint removed - replaced by Redis-based logging architecture
 # Workers now push logs to Redis queues, backend logger consumes via Redis
@@ -2384,4 +2705,7 @@ if __name__ == "__main__":
 	root_path = os.environ.get("UVICORN_ROOT_PATH", "")
 
 	output.debug(f"port: {port} root_path: {root_path!r}")
-	uvicorn.run(app, host="0.0.0.0", port=port, root_path=root_path, log_config=log_config)
+	# uvloop + httptools move the event loop and HTTP parsing into C;
+	# uvicorn falls back to asyncio/h11 where they aren't installed
+	uvicorn.run(app, host="0.0.0.0", port=port, root_path=root_path, log_config=log_config,
+	            loop="auto", http="auto")
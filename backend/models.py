@@ -1,6 +1,9 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, func, ForeignKey, Boolean, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, func, ForeignKey, Boolean, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.dialects.postgresql import JSONB
+from datetime import timezone
+from functools import lru_cache
 from output import output
 from typing import Optional, Dict, Any
 import os
@@ -8,6 +11,26 @@ import os
 # Create a base class for declarative models
 Base = declarative_base()
 
+# JSON payload columns: jsonb on PostgreSQL (binary storage, no reparse
+# on read, GIN-indexable), generic JSON on SQLite/MySQL where jsonb
+# doesn't exist.
+JSONColumn = JSON().with_variant(JSONB(), 'postgresql')
+
+@lru_cache(maxsize=8192)
+def _format_datetime(dt):
+    """Convert naive datetime to UTC ISO format with Z suffix.
+
+    Memoized: rows get re-serialized far more often than their
+    timestamps change (the realtime pollers call to_dict every tick),
+    and datetimes are immutable and hash cheaply. Naive datetimes from
+    PostgreSQL func.now() are assumed to be UTC.
+    """
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.isoformat()
+
 # Dynamically set schema based on environment variables
 def get_table_args():
     """
@@ -27,52 +50,56 @@ def get_table_args():
         # Fallback to no schema if there's any error
         return {}
 
+# The schema comes from the environment and is constant for the life of
+# the process - resolve it once instead of per class definition
+_TABLE_ARGS = get_table_args()
+
 class Job(Base):
     __tablename__ = 'jobs'
-    __table_args__ = get_table_args()
-    
+    # Composite index serves the queue-draining lookups (pending jobs in
+    # a queue); the single-column indexes below cover status filters and
+    # per-worker running counts. create_all builds these on fresh
+    # databases; existing deployments need a one-off CREATE INDEX.
+    __table_args__ = (
+        Index('ix_jobs_queue_status', 'queue_name', 'status'),
+        _TABLE_ARGS,
+    )
+
     id = Column(Integer, primary_key=True, autoincrement=True)  # Auto-incrementing PK - This is the master job ID
     name = Column(String(255), nullable=False)
-    status = Column(String(50), nullable=False, default='PENDING')  # PENDING, RUNNING, SUCCESS, FAILURE, REVOKED
+    status = Column(String(50), nullable=False, default='PENDING', index=True)  # PENDING, RUNNING, SUCCESS, FAILURE, REVOKED
     progress = Column(Integer, default=0)  # 0-100
     created_by = Column(String(50))
     created_at = Column(DateTime, default=func.now())
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
-    parameters = Column(JSON)  # Input parameters
-    result = Column(JSON)  # Task result
+    parameters = Column(JSONColumn)  # Input parameters
+    result = Column(JSONColumn)  # Task result
     error_message = Column(Text)  # Error details if failed
     log_file_path = Column(String(500))  # Path to individual job log file
  
     worker_name = Column(String(255))  # Worker that processed the task
-    queue_name = Column(String(255))  # Queue the job was/is assigned to
-    assigned_worker_name = Column(String(255))  # Worker assigned to process this job
+    queue_name = Column(String(255), index=True)  # Queue the job was/is assigned to
+    assigned_worker_name = Column(String(255), index=True)  # Worker assigned to process this job
     retries = Column(Integer, default=0)
     max_retries = Column(Integer, default=3)
     eta = Column(DateTime)  # Estimated time of arrival (for scheduled tasks)
     expires = Column(DateTime)  # Task expiration time
     
-    def to_dict(self):
-        from datetime import timezone
-        
-        def format_datetime(dt):
-            """Convert naive datetime to UTC ISO format with Z suffix."""
-            if dt is None:
-                return None
-            # Assume naive datetimes from PostgreSQL func.now() are UTC
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.isoformat()
-        
-        return {
+    def to_dict(self, include_duration: bool = False):
+        # duration is derivable from started_at/completed_at (and the UI
+        # derives it itself, so it can tick for running jobs); computing
+        # it per row on list serialization was pure overhead, so it's
+        # opt-in for callers that actually want it.
+        result = {
             'id': self.id,
             'name': self.name,
             'status': self.status,
             'progress': self.progress,
             'created_by': self.created_by,
-            'created_at': format_datetime(self.created_at),
-            'started_at': format_datetime(self.started_at),
-            'completed_at': format_datetime(self.completed_at),
+            'created_at': _format_datetime(self.created_at),
+            'started_at': _format_datetime(self.started_at),
+            'completed_at': _format_datetime(self.completed_at),
             'parameters': self.parameters,
             'result': self.result,
             'error_message': self.error_message,
@@ -82,11 +109,13 @@ class Job(Base):
             'assigned_worker_name': self.assigned_worker_name,
             'retries': self.retries,
             'max_retries': self.max_retries,
-            'eta': format_datetime(self.eta),
-            'expires': format_datetime(self.expires),
-            'duration': self._calculate_duration()
+            'eta': _format_datetime(self.eta),
+            'expires': _format_datetime(self.expires),
         }
-    
+        if include_duration:
+            result['duration'] = self._calculate_duration()
+        return result
+
     def _calculate_duration(self):
         """Calculate task duration in seconds if completed."""
         if self.started_at and self.completed_at:
@@ -97,7 +126,7 @@ class Job(Base):
 
 class JobSpec(Base):
     __tablename__ = 'specs'
-    __table_args__ = get_table_args()
+    __table_args__ = _TABLE_ARGS
     
     id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False, unique=True)  # Unique job specification name
@@ -109,25 +138,14 @@ class JobSpec(Base):
     is_active = Column(Boolean, default=True)  # Can be disabled without deletion
     
     def to_dict(self):
-        from datetime import timezone
-        
-        def format_datetime(dt):
-            """Convert naive datetime to UTC ISO format with Z suffix."""
-            if dt is None:
-                return None
-            # Assume naive datetimes from PostgreSQL func.now() are UTC
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.isoformat()
-        
         return {
             'id': str(self.id),
             'name': self.name,
             'description': self.description,
             'command': self.command,
             'created_by': self.created_by,
-            'created_at': format_datetime(self.created_at),
-            'updated_at': format_datetime(self.updated_at),
+            'created_at': _format_datetime(self.created_at),
+            'updated_at': _format_datetime(self.updated_at),
             'is_active': self.is_active
         }
 
@@ -138,7 +156,7 @@ class Worker(Base):
     Stores configuration for both local and remote worker nodes.
     """
     __tablename__ = "workers"
-    __table_args__ = get_table_args()
+    __table_args__ = _TABLE_ARGS
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False, unique=True, index=True)  # Worker name (e.g., "System", "Node-01")
@@ -162,16 +180,6 @@ class Worker(Base):
 
     def to_dict(self, include_backend_status: bool = True) -> Dict[str, Any]:
         """Convert to dictionary, masking sensitive values"""
-        from datetime import timezone
-        
-        def format_datetime(dt):
-            """Convert naive datetime to UTC ISO format with Z suffix."""
-            if dt is None:
-                return None
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.isoformat()
-        
         # Use the worker's actual status
         computed_status = self.status
         last_seen_display = 'backend-managed'
@@ -194,8 +202,8 @@ class Worker(Base):
             'state': self.state,
             'last_seen': last_seen_display,
             'error_message': self.error_message,
-            'created_at': format_datetime(self.created_at),
-            'updated_at': format_datetime(self.updated_at)
+            'created_at': _format_datetime(self.created_at),
+            'updated_at': _format_datetime(self.updated_at)
         }
 
     @classmethod
@@ -223,7 +231,7 @@ class Queue(Base):
     Provides database-backed queue management.
     """
     __tablename__ = "queues"
-    __table_args__ = get_table_args()
+    __table_args__ = _TABLE_ARGS
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False, unique=True, index=True)  # Queue name (e.g., "system", "Serv")
@@ -239,16 +247,6 @@ class Queue(Base):
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        from datetime import timezone
-        
-        def format_datetime(dt):
-            """Convert naive datetime to UTC ISO format with Z suffix."""
-            if dt is None:
-                return None
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.isoformat()
-        
         return {
             'id': self.id,
             'name': self.name,
@@ -259,8 +257,8 @@ class Queue(Base):
             'description': self.description,
             'log_file_path': self.log_file_path,
             'is_default': self.is_default,
-            'created_at': format_datetime(self.created_at),
-            'updated_at': format_datetime(self.updated_at)
+            'created_at': _format_datetime(self.created_at),
+            'updated_at': _format_datetime(self.updated_at)
         }
 
 
@@ -270,7 +268,6 @@ class QWorker(Base):
     Many-to-many relationship between queues and workers.
     """
     __tablename__ = "queue_workers"
-    __table_args__ = get_table_args()
 
     id = Column(Integer, primary_key=True, index=True)
     queue_id = Column(Integer, ForeignKey('queues.id', ondelete='CASCADE'), nullable=False, index=True)
@@ -278,31 +275,19 @@ class QWorker(Base):
     created_at = Column(DateTime, server_default=func.now())
     
     # Ensure unique queue-worker combinations
-    __table_args__ = (UniqueConstraint('queue_id', 'worker_id', name='_queue_worker_uc'), get_table_args())
+    __table_args__ = (UniqueConstraint('queue_id', 'worker_id', name='_queue_worker_uc'), _TABLE_ARGS)
 
-
-    
     # Relationships
     queue = relationship("Queue", backref="queue_workers")
     worker = relationship("Worker", backref="worker_queues")
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        from datetime import timezone
-        
-        def format_datetime(dt):
-            """Convert naive datetime to UTC ISO format with Z suffix."""
-            if dt is None:
-                return None
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.isoformat()
-        
         return {
             'id': self.id,
             'queue_id': self.queue_id,
             'worker_id': self.worker_id,
-            'created_at': format_datetime(self.created_at)
+            'created_at': _format_datetime(self.created_at)
         }
 
 
@@ -312,7 +297,7 @@ class User(Base):
     Supports multiple authentication sources (local, OS, LDAP).
     """
     __tablename__ = "users"
-    __table_args__ = get_table_args()
+    __table_args__ = _TABLE_ARGS
 
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(100), nullable=False, unique=True, index=True)
@@ -328,16 +313,6 @@ class User(Base):
     
     def to_dict(self, include_sensitive: bool = False) -> Dict[str, Any]:
         """Convert to dictionary, optionally including sensitive data"""
-        from datetime import timezone
-        
-        def format_datetime(dt):
-            """Convert naive datetime to UTC ISO format with Z suffix."""
-            if dt is None:
-                return None
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.isoformat()
-        
         result = {
             'id': self.id,
             'username': self.username,
@@ -346,9 +321,9 @@ class User(Base):
             'role': self.role,
             'auth_source': self.auth_source,
             'is_active': self.is_active,
-            'last_login': format_datetime(self.last_login),
-            'created_at': format_datetime(self.created_at),
-            'updated_at': format_datetime(self.updated_at)
+            'last_login': _format_datetime(self.last_login),
+            'created_at': _format_datetime(self.created_at),
+            'updated_at': _format_datetime(self.updated_at)
         }
         
         if include_sensitive:
@@ -362,34 +337,24 @@ class UserRole(Base):
     Role definitions for user permissions.
     """
     __tablename__ = "user_roles"
-    __table_args__ = get_table_args()
+    __table_args__ = _TABLE_ARGS
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(50), nullable=False, unique=True, index=True)
     description = Column(Text, nullable=True)
-    permissions = Column(JSON, nullable=True)  # JSON array of permission strings
+    permissions = Column(JSONColumn, nullable=True)  # JSON array of permission strings
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        from datetime import timezone
-        
-        def format_datetime(dt):
-            """Convert naive datetime to UTC ISO format with Z suffix."""
-            if dt is None:
-                return None
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.isoformat()
-        
         return {
             'id': self.id,
             'name': self.name,
             'description': self.description,
             'permissions': self.permissions or [],
-            'created_at': format_datetime(self.created_at),
-            'updated_at': format_datetime(self.updated_at)
+            'created_at': _format_datetime(self.created_at),
+            'updated_at': _format_datetime(self.updated_at)
         }
 
 
@@ -398,7 +363,7 @@ class UserSession(Base):
     User session tracking for JWT tokens.
     """
     __tablename__ = "user_sessions"
-    __table_args__ = get_table_args()
+    __table_args__ = _TABLE_ARGS
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
@@ -411,20 +376,10 @@ class UserSession(Base):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        from datetime import timezone
-        
-        def format_datetime(dt):
-            """Convert naive datetime to UTC ISO format with Z suffix."""
-            if dt is None:
-                return None
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.isoformat()
-        
         return {
             'id': self.id,
             'user_id': self.user_id,
             'token': self.token,
-            'expires_at': format_datetime(self.expires_at),
-            'created_at': format_datetime(self.created_at)
+            'expires_at': _format_datetime(self.expires_at),
+            'created_at': _format_datetime(self.created_at)
         }
\ No newline at end of file
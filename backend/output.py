@@ -1,5 +1,7 @@
 import logging
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 # Logging configuration dict for uvicorn
 log_config = {
@@ -51,26 +53,65 @@ class Output:
     def _format_message(self, message):
         """Just return the message - timestamp formatting is handled by logging config"""
         return message
-    
-    def debug(self, message):
-        """Log debug level message"""
-        self.logger.debug(self._format_message(message))
-        
-    def info(self, message):
+
+    def debug(self, message, *args):
+        """Log debug level message.
+
+        Extra args are forwarded for lazy %-style formatting - the
+        string is only built if the level is enabled, which keeps
+        disabled debug() calls on hot paths essentially free.
+        """
+        self.logger.debug(self._format_message(message), *args)
+
+    def info(self, message, *args):
         """Log info level message"""
-        self.logger.info(self._format_message(message))
-        
-    def warning(self, message):
+        self.logger.info(self._format_message(message), *args)
+
+    def warning(self, message, *args):
         """Log warning level message"""
-        self.logger.warning(self._format_message(message))
-        
-    def error(self, message):
+        self.logger.warning(self._format_message(message), *args)
+
+    def error(self, message, *args):
         """Log error level message"""
-        self.logger.error(self._format_message(message))
-        
-    def critical(self, message):
+        self.logger.error(self._format_message(message), *args)
+
+    def critical(self, message, *args):
         """Log critical level message"""
-        self.logger.critical(self._format_message(message))
+        self.logger.critical(self._format_message(message), *args)
+
+# Queue-based log draining. StreamHandler writes to stdout with a
+# blocking syscall under the logging lock; on the event loop that
+# stalls whichever coroutine happened to log. Swapping the uvicorn
+# loggers' handlers for a QueueHandler makes emission a queue put and
+# moves the I/O onto a listener thread. No call sites change.
+_queue_listeners = []
+
+def start_queue_logging():
+    """Route log records through a queue drained off-thread.
+
+    Called once uvicorn has applied log_config (app startup); the
+    original stream handlers keep doing the actual writing, just on
+    the listener thread instead of the caller's. One queue/listener
+    pair per logger - a listener dispatches every record to all of its
+    handlers, so pooling them would duplicate output.
+    """
+    if _queue_listeners:
+        return
+
+    for name in ("uvicorn", "uvicorn.access"):
+        lg = logging.getLogger(name)
+        if not lg.handlers:
+            continue
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, *lg.handlers, respect_handler_level=True)
+        lg.handlers = [QueueHandler(log_queue)]
+        listener.start()
+        _queue_listeners.append(listener)
+
+def stop_queue_logging():
+    """Flush pending records and stop the listener threads"""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
 
 # Standard output for application logging
 output = Output("uvicorn")
@@ -1,18 +1,22 @@
-from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple, NamedTuple
+from datetime import datetime, timezone
 from threading import Lock, Thread
 from contextlib import contextmanager
+from collections import deque
+from queue import SimpleQueue
 import json
 import time
 import asyncio
 import os
 from pathlib import Path
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, update, insert, and_
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+from cachetools import TTLCache
 from info import info
 from output import output
 from db import db
+from events import bus
 from models import Queue as QueueModel, Worker as WorkerModel, QWorker as QWorkerModel
 from strategies import strategies
 
@@ -34,14 +38,75 @@ class QueueUpdateRequest(BaseModel):
     strategy: Optional[str] = Field(None, description="Dispatch strategy")
     is_default: Optional[bool] = Field(None, description="Whether this is the default queue")
 
+# Response models - validated straight off the ORM rows (from_attributes)
+# so list endpoints skip the per-row to_dict() loop and serialize on
+# pydantic-core's rust path. Serialization matches Queue.to_dict:
+# time_limit goes out as camelCase timeLimit, naive timestamps are
+# treated as UTC; job_count is filled in by the endpoint from the
+# in-memory queue map.
+class QueueOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    state: Optional[str] = None
+    time_limit: Optional[int] = Field(None, serialization_alias='timeLimit')
+    priority: Optional[str] = None
+    strategy: Optional[str] = None
+    description: Optional[str] = None
+    log_file_path: Optional[str] = None
+    is_default: Optional[bool] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    job_count: int = 0
+
+    @field_serializer('created_at', 'updated_at')
+    def _serialize_datetime(self, dt: Optional[datetime]) -> Optional[str]:
+        if dt is None:
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.isoformat()
+
+class QueuesPage(BaseModel):
+    queues: List[QueueOut]
+    total: int
+    page: int
+    per_page: int
+    total_pages: int
+
+class QueueMeta(NamedTuple):
+    """The queue columns hot paths need, cached in-process (see Queue._queue_meta)"""
+    id: int
+    name: str
+    state: str
+    log_file_path: Optional[str]
+
 class Queue:
     def __init__(self):
         self._lock = Lock()
         self._initialized = False
-        self._queues = {}  # Dictionary of queue_name -> list of job_ids
+        self._queues = {}  # Dictionary of queue_name -> deque of job_ids (FIFO order)
+        self._queue_sets = {}  # queue_name -> set of job_ids, mirrors _queues for O(1) membership
         self._dispatcher_running = False
         self._dispatcher_thread = None
-    
+        # Hot-path lookups (default queue, queue states) change only on
+        # admin action; cache them briefly and clear on any queue change
+        self._state_cache = TTLCache(maxsize=64, ttl=5)
+        self._state_cache_lock = Lock()
+        # Authoritative queue metadata keyed by lower-cased name.
+        # Queues change only on admin action and all mutations go
+        # through this class, so the cache is reloaded on every change
+        # and hot paths (add_job, check_queue_state, queue log writes)
+        # never touch the database for it.
+        self._queue_meta = {}
+        # Queue log lines are written by a background thread so callers
+        # (which hold self._lock and often a DB session) never block on
+        # disk I/O - see _log_writer_loop
+        self._log_queue = SimpleQueue()
+        self._log_writer_thread = None
+        self._log_dirs_created = set()
+
     def initialize(self):
         """Initialize queue - called at startup"""
         with self._lock:
@@ -49,10 +114,16 @@ class Queue:
                 try:
                     # Initialize strategies
                     strategies.initialize()
-                    
+
+                    # Load queue metadata for hot-path lookups
+                    self._reload_queue_meta()
+
                     # Restore pending jobs from database to queue lists
                     self._restore_pending_jobs()
-                    
+
+                    # Start queue log writer thread
+                    self._start_log_writer()
+
                     # Start dispatcher thread
                     self._start_dispatcher()
                     
@@ -62,29 +133,115 @@ class Queue:
                     output.error(f"Failed to initialize queue: {e}")
                     raise
     
-    def _log_to_queue_file(self, queue_name: str, message: str):
-        """Log a message to the specific queue's log file"""
+    def _reload_queue_meta(self):
+        """Rebuild the queue metadata cache from the database.
+
+        Called at startup and after any queue mutation. The table is
+        tiny, so a full reload is simpler than per-entry invalidation;
+        readers just grab the dict reference - the swap is atomic, so
+        no lock is needed on the read side.
+        """
         try:
-            # Get the queue to find its log file path
             with db.get_session() as session:
-                queue_model = session.query(QueueModel).filter_by(name=queue_name).first()
-                if not queue_model or not queue_model.log_file_path:
-                    return
-                
-                log_file_path = queue_model.log_file_path
-                
-                # Create log directory if it doesn't exist
-                os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
-                
-                # Append message with timestamp
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                log_entry = f"[{timestamp}] {message}\n"
-                
-                with open(log_file_path, 'a', encoding='utf-8') as f:
-                    f.write(log_entry)
-                    
+                rows = session.query(
+                    QueueModel.id, QueueModel.name,
+                    QueueModel.state, QueueModel.log_file_path
+                ).all()
+            self._queue_meta = {
+                name.lower(): QueueMeta(queue_id, name, state, log_file_path)
+                for queue_id, name, state, log_file_path in rows
+            }
+        except Exception as e:
+            output.error(f"Error reloading queue metadata: {e}")
+
+    def _get_queue_meta(self, queue_name: str) -> Optional[QueueMeta]:
+        """Look up cached queue metadata by name (case-insensitive).
+
+        A miss triggers one reload before giving up, so a queue created
+        since the last refresh is still found - only genuinely missing
+        queues pay for the extra query.
+        """
+        meta = self._queue_meta.get(queue_name.lower())
+        if meta is None:
+            self._reload_queue_meta()
+            meta = self._queue_meta.get(queue_name.lower())
+        return meta
+
+    def _enqueue_job(self, queue_name: str, job_id: int) -> bool:
+        """Append a job to a queue's FIFO if not already present.
+
+        Caller must hold self._lock. Membership is tested against the
+        mirrored set, so enqueueing stays O(1) no matter how deep the
+        backlog is (the old `job_id not in list` scan made a 10k-job
+        restore quadratic).
+        """
+        members = self._queue_sets.setdefault(queue_name, set())
+        if job_id in members:
+            return False
+        members.add(job_id)
+        self._queues.setdefault(queue_name, deque()).append(job_id)
+        return True
+
+    def _log_to_queue_file(self, queue_name: str, message: str):
+        """Queue a message for the queue's log file.
+
+        The actual open/write happens on the writer thread; this is
+        just a path lookup and an O(1) enqueue, so callers holding
+        self._lock never stall the dispatcher on a slow disk.
+        """
+        try:
+            # Resolve the log file path from the metadata cache
+            meta = self._get_queue_meta(queue_name)
+            if meta is None or not meta.log_file_path:
+                return
+
+            # Append message with timestamp
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self._log_queue.put((meta.log_file_path, f"[{timestamp}] {message}\n"))
+
         except Exception as e:
-            output.error(f"Error writing to queue log file: {e}")
+            output.error(f"Error queueing queue log message: {e}")
+
+    def _start_log_writer(self):
+        """Start the background queue-log writer thread"""
+        if not self._log_writer_thread or not self._log_writer_thread.is_alive():
+            self._log_writer_thread = Thread(target=self._log_writer_loop, daemon=True)
+            self._log_writer_thread.start()
+
+    def _log_writer_loop(self):
+        """Drain queued (path, line) entries to disk - background thread.
+
+        File handles are kept open per path (append mode, flushed each
+        write so tails stay live) and directory creation is memoized,
+        so steady-state writes cost one write+flush instead of
+        makedirs+open+write+close per message. A None sentinel from
+        shutdown() flushes and exits.
+        """
+        handles = {}
+        while True:
+            item = self._log_queue.get()
+            if item is None:
+                break
+            path, line = item
+            try:
+                f = handles.get(path)
+                if f is None:
+                    directory = os.path.dirname(path)
+                    if directory not in self._log_dirs_created:
+                        os.makedirs(directory, exist_ok=True)
+                        self._log_dirs_created.add(directory)
+                    f = open(path, 'a', encoding='utf-8')
+                    handles[path] = f
+                f.write(line)
+                f.flush()
+            except Exception as e:
+                output.error(f"Error writing to queue log file: {e}")
+
+        for f in handles.values():
+            try:
+                f.close()
+            except Exception:
+                pass
     
     def _restore_pending_jobs(self):
         """Restore pending jobs from database to queue lists on startup"""
@@ -104,58 +261,83 @@ class Queue:
                 terminal_states = states.get_terminal_states()
                 output.info(f"Terminal states: {terminal_states}")
                 
-                # Debug: Check all job statuses
-                all_jobs = session.query(JobModel).all()
-                status_counts = {}
-                for job in all_jobs:
-                    status_counts[job.status] = status_counts.get(job.status, 0) + 1
+                # Debug: status histogram via GROUP BY instead of
+                # hydrating every job row just to count it
+                status_counts = dict(
+                    session.query(JobModel.status, func.count())
+                    .group_by(JobModel.status)
+                    .all()
+                )
                 output.info(f"Job status counts: {status_counts}")
-                
-                incomplete_jobs = session.query(JobModel).filter(
+
+                incomplete_count = sum(
+                    count for status, count in status_counts.items()
+                    if status not in terminal_states
+                )
+                output.info(f"Found {incomplete_count} incomplete jobs")
+
+                # Stream just the three columns the loop needs in 1000-row
+                # batches - full ORM objects for every incomplete job made
+                # restore memory scale with the backlog
+                incomplete_jobs = session.query(
+                    JobModel.id, JobModel.queue_name, JobModel.status
+                ).filter(
                     ~JobModel.status.in_(terminal_states)
-                ).order_by(JobModel.created_at.asc()).all()
-                
-                output.info(f"Found {len(incomplete_jobs)} incomplete jobs")
+                ).order_by(JobModel.created_at.asc()).yield_per(1000)
                 
                 jobs_restored = 0
-                jobs_reset = 0
                 queues_used = set()
-                
-                jobs_assigned_queue = 0
-                
-                for job in incomplete_jobs:
-                    queue_name = job.queue_name
-                    
+
+                # Collect ids and fix them up with two bulk UPDATEs after
+                # the loop - mutating each ORM row still flushes one
+                # UPDATE per job at commit, which dominates a restore of
+                # thousands of interrupted jobs
+                legacy_ids = []
+                reset_ids = []
+
+                for job_id, queue_name, status in incomplete_jobs:
                     # Assign missing queue names to default queue (legacy jobs)
                     if not queue_name or queue_name.strip() == '':
                         if default_queue_name:
                             queue_name = default_queue_name
-                            job.queue_name = queue_name
-                            jobs_assigned_queue += 1
+                            legacy_ids.append(job_id)
                         else:
                             # Skip jobs without queue assignment if no default queue
-                            output.warning(f"Skipping job {job.id} - no queue assigned and no default queue")
+                            output.warning(f"Skipping job {job_id} - no queue assigned and no default queue")
                             continue
-                        output.info(f"Assigned legacy job {job.id} to default '{queue_name}' queue")
-                    
+                        output.info(f"Assigned legacy job {job_id} to default '{queue_name}' queue")
+
                     # Reset running jobs back to pending (they were interrupted)
-                    if job.status == states.RUNNING:
-                        job.status = states.PENDING
-                        job.started_at = None  # Clear start time
-                        job.assigned_worker_name = None  # Clear worker assignment
-                        jobs_reset += 1
-                        output.info(f"Reset interrupted job {job.id} from {states.RUNNING} to {states.PENDING}")
-                    
-                    if queue_name not in self._queues:
-                        self._queues[queue_name] = []
-                    
+                    if status == states.RUNNING:
+                        reset_ids.append(job_id)
+                        output.info(f"Reset interrupted job {job_id} from {states.RUNNING} to {states.PENDING}")
+
                     # Add job to the appropriate queue if not already there
-                    if job.id not in self._queues[queue_name]:
-                        self._queues[queue_name].append(job.id)
+                    if self._enqueue_job(queue_name, job_id):
                         jobs_restored += 1
                         queues_used.add(queue_name)
-                
-                # Commit any status changes
+
+                jobs_assigned_queue = len(legacy_ids)
+                jobs_reset = len(reset_ids)
+
+                if legacy_ids:
+                    session.execute(
+                        update(JobModel)
+                        .where(JobModel.id.in_(legacy_ids))
+                        .values(queue_name=default_queue_name),
+                        execution_options={"synchronize_session": False},
+                    )
+                if reset_ids:
+                    session.execute(
+                        update(JobModel)
+                        .where(JobModel.id.in_(reset_ids))
+                        .values(
+                            status=states.PENDING,
+                            started_at=None,
+                            assigned_worker_name=None,
+                        ),
+                        execution_options={"synchronize_session": False},
+                    )
                 session.commit()
                 
                 if jobs_restored > 0:
@@ -180,7 +362,12 @@ class Queue:
                         output.warning("Queue dispatcher thread did not stop gracefully")
                     else:
                         output.info("Queue dispatcher thread stopped")
-                    
+
+            # Flush remaining queue log lines and stop the writer
+            if self._log_writer_thread and self._log_writer_thread.is_alive():
+                self._log_queue.put(None)
+                self._log_writer_thread.join(timeout=5)
+
             self._initialized = False
     
     def create(
@@ -241,6 +428,8 @@ class Queue:
                 session.commit()
                 session.refresh(queue)
                 
+                self._invalidate_state_cache()
+                bus.notify(bus.QUEUES)
                 output.info(f"Queue created: {name} (priority: {priority})")
                 return queue
     
@@ -254,10 +443,26 @@ class Queue:
         with db.get_session() as session:
             return session.query(QueueModel).filter_by(name=name).first()
     
+    def _invalidate_state_cache(self):
+        """Refresh cached lookups after a queue change"""
+        with self._state_cache_lock:
+            self._state_cache.clear()
+        self._reload_queue_meta()
+
     def get_default_queue(self) -> Optional[QueueModel]:
-        """Get the default queue"""
+        """Get the default queue (cached briefly - hit on every job submit)"""
+        with self._state_cache_lock:
+            cached = self._state_cache.get('default_queue')
+        if cached is not None:
+            return cached
+
         with db.get_session() as session:
-            return session.query(QueueModel).filter_by(is_default=True).first()
+            queue = session.query(QueueModel).filter_by(is_default=True).first()
+
+        if queue is not None:
+            with self._state_cache_lock:
+                self._state_cache['default_queue'] = queue
+        return queue
     
     def list_with_count(
         self,
@@ -346,6 +551,8 @@ class Queue:
                 session.commit()
                 session.refresh(queue)
                 
+                self._invalidate_state_cache()
+                bus.notify(bus.QUEUES)
                 output.info(f"Queue updated: {queue.name}")
                 return queue
     
@@ -369,6 +576,8 @@ class Queue:
                 session.delete(queue)
                 session.commit()
                 
+                self._invalidate_state_cache()
+                bus.notify(bus.QUEUES)
                 output.info(f"Queue deleted: {queue.name} (removed {len(worker_assignments)} worker assignments)")
                 return True
     
@@ -393,15 +602,16 @@ class Queue:
     
     def get_queue_workers_by_name(self, queue_name: str) -> List[WorkerModel]:
         """Get all workers assigned to a queue by name"""
+        # Resolve the queue id from the metadata cache - skips the
+        # per-call queue SELECT on the dispatcher and UI poll paths
+        meta = self._get_queue_meta(queue_name)
+        if meta is None:
+            return []
+
         with db.get_session() as session:
-            # Get queue first, then get workers
-            queue = session.query(QueueModel).filter_by(name=queue_name).first()
-            if not queue:
-                return []
-            
             return session.query(WorkerModel)\
                 .join(QWorkerModel, WorkerModel.id == QWorkerModel.worker_id)\
-                .filter(QWorkerModel.queue_id == queue.id)\
+                .filter(QWorkerModel.queue_id == meta.id)\
                 .all()
     
     def assign_worker_to_queue(self, worker_id: int, queue_id: int) -> bool:
@@ -462,17 +672,15 @@ class Queue:
     def get_available_workers_for_queue(self, queue_id: int) -> List[WorkerModel]:
         """Get all workers not currently assigned to a specific queue"""
         with db.get_session() as session:
-            # Get all workers
-            all_workers = session.query(WorkerModel).all()
-            
-            # Get workers already assigned to this queue
-            assigned_worker_ids = session.query(QWorkerModel.worker_id)\
-                .filter_by(queue_id=queue_id)\
+            # Anti-join: one round trip, filtered in the database instead
+            # of loading every worker and subtracting in Python
+            return session.query(WorkerModel)\
+                .outerjoin(QWorkerModel, and_(
+                    QWorkerModel.worker_id == WorkerModel.id,
+                    QWorkerModel.queue_id == queue_id
+                ))\
+                .filter(QWorkerModel.worker_id.is_(None))\
                 .all()
-            assigned_ids = [w[0] for w in assigned_worker_ids]
-            
-            # Return workers not in assigned list
-            return [w for w in all_workers if w.id not in assigned_ids]
     
     def assign_multiple_workers_to_queue(self, worker_ids: List[int], queue_id: int) -> bool:
         """Assign multiple workers to a queue at once"""
@@ -483,33 +691,35 @@ class Queue:
                 if not queue:
                     return False
                 
-                success_count = 0
-                for worker_id in worker_ids:
-                    # Verify worker exists
-                    worker = session.query(WorkerModel).filter_by(id=worker_id).first()
-                    if not worker:
-                        continue
-                    
-                    # Check if assignment already exists
-                    existing = session.query(QWorkerModel)\
-                        .filter_by(queue_id=queue_id, worker_id=worker_id)\
-                        .first()
-                    
-                    if not existing:
-                        # Create new assignment
-                        assignment = QWorkerModel(
-                            queue_id=queue_id,
-                            worker_id=worker_id
-                        )
-                        session.add(assignment)
-                        success_count += 1
-                
-                session.commit()
-                
-                if success_count > 0:
-                    output.info(f"{success_count} workers assigned to queue {queue.name}")
-                
-                return success_count > 0
+                # Preload existence and current assignments in one query
+                # each - the old loop ran two SELECTs per worker, so a
+                # 50-worker assignment cost ~100 round trips
+                existing_worker_ids = {
+                    row[0] for row in session.query(WorkerModel.id)
+                    .filter(WorkerModel.id.in_(worker_ids)).all()
+                }
+                already_assigned = {
+                    row[0] for row in session.query(QWorkerModel.worker_id)
+                    .filter(
+                        QWorkerModel.queue_id == queue_id,
+                        QWorkerModel.worker_id.in_(worker_ids)
+                    ).all()
+                }
+
+                # dict.fromkeys dedupes repeated ids while keeping order
+                new_assignments = [
+                    {"queue_id": queue_id, "worker_id": worker_id}
+                    for worker_id in dict.fromkeys(worker_ids)
+                    if worker_id in existing_worker_ids
+                    and worker_id not in already_assigned
+                ]
+
+                if new_assignments:
+                    session.execute(insert(QWorkerModel), new_assignments)
+                    session.commit()
+                    output.info(f"{len(new_assignments)} workers assigned to queue {queue.name}")
+
+                return len(new_assignments) > 0
 
     def start_queue(self, queue_id: int) -> Optional[QueueModel]:
         """Start a queue (set state to 'started')"""
@@ -523,6 +733,8 @@ class Queue:
                 session.commit()
                 session.refresh(queue)
                 
+                self._invalidate_state_cache()
+                bus.notify(bus.QUEUES)
                 message = f"Queue started: {queue.name}"
                 output.info(message)
                 self._log_to_queue_file(queue.name, message)
@@ -540,6 +752,8 @@ class Queue:
                 session.commit()
                 session.refresh(queue)
                 
+                self._invalidate_state_cache()
+                bus.notify(bus.QUEUES)
                 message = f"Queue stopped: {queue.name}"
                 output.info(message)
                 self._log_to_queue_file(queue.name, message)
@@ -557,6 +771,8 @@ class Queue:
                 session.commit()
                 session.refresh(queue)
                 
+                self._invalidate_state_cache()
+                bus.notify(bus.QUEUES)
                 message = f"Queue paused: {queue.name}"
                 output.info(message)
                 self._log_to_queue_file(queue.name, message)
@@ -564,73 +780,80 @@ class Queue:
     
     def check_queue_state(self, queue_name: str) -> str:
         """Check if a queue can accept new jobs based on its state"""
-        with db.get_session() as session:
-            # Case-insensitive queue lookup
-            queue = session.query(QueueModel).filter(
-                QueueModel.name.ilike(queue_name)
-            ).first()
-            if not queue:
-                raise ValueError(f"Queue '{queue_name}' not found")
-            
-            if queue.state == 'stopped':
-                raise ValueError(f"Queue '{queue_name}' is stopped and cannot accept new jobs")
-            
-            if queue.state == 'paused':
-                raise ValueError(f"Queue '{queue_name}' is paused and cannot accept new jobs")
-            
-            return queue.state
+        meta = self._get_queue_meta(queue_name)
+        if meta is None:
+            raise ValueError(f"Queue '{queue_name}' not found")
+
+        if meta.state == 'stopped':
+            raise ValueError(f"Queue '{queue_name}' is stopped and cannot accept new jobs")
+
+        if meta.state == 'paused':
+            raise ValueError(f"Queue '{queue_name}' is paused and cannot accept new jobs")
+
+        return meta.state
     
-    def add_job(self, queue_name: str, job_id: int) -> bool:
-        """Add a job to a queue (in-memory list)"""
+    def add_job(self, queue_name: str, job_id: int, verify_job: bool = True) -> bool:
+        """Add a job to a queue (in-memory list).
+
+        verify_job=False skips the job existence query for callers that
+        just created the job themselves (e.g. run_job).
+        """
         with self._lock:
-            with db.get_session() as session:
-                # Verify queue exists - case-insensitive lookup
-                queue_model = session.query(QueueModel).filter(
-                    QueueModel.name.ilike(queue_name)
-                ).first()
-                if not queue_model:
-                    raise ValueError(f"Queue '{queue_name}' not found")
-                
-                # Use the actual queue name from the database
-                actual_queue_name = queue_model.name
-                
-                # Block job submission if queue is not started
-                if queue_model.state != 'started':
-                    raise ValueError(f"Queue '{actual_queue_name}' is {queue_model.state} and cannot accept new jobs")
-                
-                # Verify job exists
+            # Verify queue exists - case-insensitive cache lookup, so the
+            # submission hot path (verify_job=False) never opens a session
+            meta = self._get_queue_meta(queue_name)
+            if meta is None:
+                raise ValueError(f"Queue '{queue_name}' not found")
+
+            # Use the actual queue name from the database
+            actual_queue_name = meta.name
+
+            # Block job submission if queue is not started
+            if meta.state != 'started':
+                raise ValueError(f"Queue '{actual_queue_name}' is {meta.state} and cannot accept new jobs")
+
+            # Verify job exists
+            if verify_job:
                 from models import Job as JobModel
-                job = session.query(JobModel).filter_by(id=job_id).first()
-                if not job:
-                    raise ValueError(f"Job {job_id} not found")
-                
-                # Initialize queue list if it doesn't exist
-                if actual_queue_name not in self._queues:
-                    self._queues[actual_queue_name] = []
-                
-                # Add job to queue if not already there
-                if job_id not in self._queues[actual_queue_name]:
-                    self._queues[actual_queue_name].append(job_id)
-                    message = f"Job {job_id} added"
-                    output.info(message)
-                    self._log_to_queue_file(actual_queue_name, message)
-                else:
-                    message = f"Job {job_id} already in queue {actual_queue_name}"
-                    output.info(message)
-                    self._log_to_queue_file(actual_queue_name, message)
-                
-                return True
+                with db.get_session() as session:
+                    job = session.query(JobModel.id).filter_by(id=job_id).first()
+                    if not job:
+                        raise ValueError(f"Job {job_id} not found")
+
+            # Add job to queue if not already there
+            if self._enqueue_job(actual_queue_name, job_id):
+                bus.notify(bus.QUEUES)
+                message = f"Job {job_id} added"
+                output.info(message)
+                self._log_to_queue_file(actual_queue_name, message)
+            else:
+                message = f"Job {job_id} already in queue {actual_queue_name}"
+                output.info(message)
+                self._log_to_queue_file(actual_queue_name, message)
+
+            return True
     
     def get_queue_jobs(self, queue_name: str) -> List[int]:
         """Get list of job IDs in a queue"""
         with self._lock:
-            return self._queues.get(queue_name, []).copy()
+            return list(self._queues.get(queue_name, ()))
+
+    def counts_by_name(self, names: List[str]) -> Dict[str, int]:
+        """Job counts for several queues in one pass under the lock.
+
+        For list endpoints that only need len() per queue - avoids
+        taking the lock and copying the job list once per row.
+        """
+        with self._lock:
+            return {name: len(self._queues.get(name, [])) for name in names}
     
     def remove_job(self, queue_name: str, job_id: int) -> bool:
         """Remove a job from a queue"""
         with self._lock:
-            if queue_name in self._queues and job_id in self._queues[queue_name]:
+            if job_id in self._queue_sets.get(queue_name, ()):
+                self._queue_sets[queue_name].discard(job_id)
                 self._queues[queue_name].remove(job_id)
+                bus.notify(bus.QUEUES)
                 message = f"Job {job_id} removed from queue {queue_name}"
                 output.info(message)
                 self._log_to_queue_file(queue_name, message)
@@ -641,8 +864,12 @@ class Queue:
         """Get the next job from a queue (FIFO)"""
         with self._lock:
             if queue_name in self._queues and self._queues[queue_name]:
-                job_id = self._queues[queue_name].pop(0)
+                # deque.popleft() is O(1); list.pop(0) shifted the whole
+                # backlog on every dequeue
+                job_id = self._queues[queue_name].popleft()
+                self._queue_sets[queue_name].discard(job_id)
                 # Don't log popped messages - too verbose
+                bus.notify(bus.QUEUES)
                 return job_id
             return None
     
@@ -659,7 +886,7 @@ class Queue:
                 # Return a copy of the current queue state
                 for queue_name, job_ids in self._queues.items():
                     if job_ids:  # Only include queues that have jobs
-                        all_jobs[queue_name] = job_ids.copy()
+                        all_jobs[queue_name] = list(job_ids)
             
             return all_jobs
         except Exception as e:
@@ -672,6 +899,9 @@ class Queue:
             if queue_name in self._queues:
                 count = len(self._queues[queue_name])
                 self._queues[queue_name].clear()
+                self._queue_sets[queue_name].clear()
+                if count:
+                    bus.notify(bus.QUEUES)
                 output.info(f"Cleared {count} jobs from queue {queue_name}")
                 return count
             return 0
@@ -764,9 +994,7 @@ class Queue:
                                 if should_retry:
                                     # Temporary failures - put job back in queue for retry
                                     with self._lock:
-                                        if queue_model.name not in self._queues:
-                                            self._queues[queue_model.name] = []
-                                        self._queues[queue_model.name].append(job_id)
+                                        self._enqueue_job(queue_model.name, job_id)
                                     message = f"Failed to dispatch job {job_id} ({reason}) - will retry"
                                     output.warning(message)
                                     self._log_to_queue_file(queue_model.name, message)
@@ -794,6 +1022,31 @@ class Queue:
         
         output.info("Queue dispatcher stopped")
 
+    def get_running_jobs_counts(self, worker_names: List[str]) -> Dict[str, int]:
+        """Get running-job counts for many workers in one grouped query.
+
+        Workers with no running jobs are simply absent from the result -
+        callers should default missing names to 0.
+        """
+        if not worker_names:
+            return {}
+        try:
+            from models import Job as JobModel
+            from states import states
+
+            with db.get_session() as session:
+                rows = session.query(
+                    JobModel.assigned_worker_name, func.count()
+                ).filter(
+                    JobModel.assigned_worker_name.in_(worker_names),
+                    JobModel.status.in_([states.RUNNING, 'RUNNING', 'Running', 'DISPATCHED'])
+                ).group_by(JobModel.assigned_worker_name).all()
+
+                return dict(rows)
+        except Exception as e:
+            output.error(f"Error counting running jobs for workers: {e}")
+            return {}
+
     def _get_worker_running_jobs_count(self, worker_name: str) -> int:
         """Get count of running jobs for a specific worker"""
         try:
@@ -941,12 +1194,17 @@ class Queue:
             return False, f"Exception during dispatch: {str(e)}"
 
     def get_log_file_path(self, queue_id: int) -> Optional[str]:
-        """Get the log file path for a queue from database"""
+        """Get the log file path for a queue from database.
+
+        Fetches just the one column instead of hydrating the full queue
+        row - this runs on every log read/clear and per SSE connection.
+        """
         try:
-            queue_record = self.get_by_id(queue_id)
-            if not queue_record:
-                return None
-            return queue_record.log_file_path
+            with db.get_session() as session:
+                row = session.query(QueueModel.log_file_path).filter(
+                    QueueModel.id == queue_id
+                ).first()
+                return row[0] if row else None
         except Exception as e:
             output.error(f"Error getting log file path for queue {queue_id}: {e}")
             return None
@@ -1,7 +1,7 @@
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 from models import JobSpec as SpecModel
 from db import db
 from output import output
@@ -17,6 +17,41 @@ class SpecUpdateRequest(BaseModel):
     description: Optional[str] = Field(None, description="Spec description")
     command: Optional[str] = Field(None, description="Command to execute")
 
+# Response models - validated straight off the ORM rows (from_attributes)
+# so list endpoints skip the per-row to_dict() loop and serialize on
+# pydantic-core's rust path. Serialization matches JobSpec.to_dict:
+# id as a string, naive timestamps treated as UTC.
+class SpecOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    description: Optional[str] = None
+    command: str
+    created_by: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    is_active: Optional[bool] = None
+
+    @field_serializer('id')
+    def _serialize_id(self, value: int) -> str:
+        return str(value)
+
+    @field_serializer('created_at', 'updated_at')
+    def _serialize_datetime(self, dt: Optional[datetime]) -> Optional[str]:
+        if dt is None:
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.isoformat()
+
+class SpecsPage(BaseModel):
+    specs: List[SpecOut]
+    total: int
+    page: int
+    per_page: int
+    total_pages: int
+
 class Specs:
     """Core specification management class with proper OOP design."""
     
@@ -18,7 +18,7 @@ from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives import serialization
 import paramiko
 from sqlalchemy import desc, func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from pydantic import BaseModel, Field
 from info import info
 from output import output
@@ -1175,8 +1175,11 @@ class Worker:
                 if worker.name == 'System':
                     raise ValueError("Cannot delete System worker")
 
-                # Check if worker is assigned to any queues
-                queue_assignments = session.query(QWorker).filter_by(worker_id=worker_id).all()
+                # Check if worker is assigned to any queues - eager-load the
+                # queue rows so the name loop below doesn't lazy-load each one
+                queue_assignments = session.query(QWorker)\
+                    .options(selectinload(QWorker.queue))\
+                    .filter_by(worker_id=worker_id).all()
                 if queue_assignments:
                     queue_names = []
                     for qa in queue_assignments:
@@ -82,8 +82,9 @@ class WorkerLogger:
             # Encode message as base64
             encoded_message = base64.b64encode(json.dumps(message).encode('utf-8'))
             
-            # Push to shared logs queue
-            self._client.lpush('logs', encoded_message)
+            # Append to shared logs stream (capped so a stalled backend
+            # consumer cannot grow it without bound)
+            self._client.xadd('logs', {'message': encoded_message}, maxlen=100000, approximate=True)
             return True
             
         except redis.ConnectionError:
@@ -97,7 +98,7 @@ class WorkerLogger:
                         "message": log_data
                     }
                     encoded_message = base64.b64encode(json.dumps(message).encode('utf-8'))
-                    self._client.lpush('logs', encoded_message)
+                    self._client.xadd('logs', {'message': encoded_message}, maxlen=100000, approximate=True)
                     return True
                 except:
                     return False
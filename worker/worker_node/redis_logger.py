@@ -1,6 +1,6 @@
 """
 Redis-based logger for worker nodes
-Replaces WebSocket connection with simple Redis LPUSH
+Replaces WebSocket connection with appends to a shared Redis stream
 """
 
 import redis
@@ -14,7 +14,7 @@ from .output import output
 class RedisLogger:
     """
     Simple Redis logger for worker nodes.
-    Pushes log messages to Redis queue for backend consumption.
+    Appends log messages to the shared logs stream for backend consumption.
     """
     
     def __init__(self, backend_url: str):
@@ -125,11 +125,14 @@ class RedisLogger:
             if debug:
                 print(f"[REDIS-LOG] Encoded message (base64): {encoded_message[:100]}...", flush=True)
             
-            # Push to single shared logs queue
-            result = self._client.lpush('logs', encoded_message)
+            # Append to the single shared logs stream; the approximate maxlen
+            # cap bounds growth if the backend consumer falls behind
+            result = self._client.xadd(
+                'logs', {'message': encoded_message}, maxlen=100000, approximate=True
+            )
             if debug:
-                print(f"[REDIS-LOG] ✅ Redis lpush successful! Result: {result}, Queue: 'logs'", flush=True)
-            output.info(f"DEBUG: Redis lpush result: {result} for execution_id {execution_id}")
+                print(f"[REDIS-LOG] ✅ Redis xadd successful! Entry: {result}, Stream: 'logs'", flush=True)
+            output.info(f"DEBUG: Redis xadd entry: {result} for execution_id {execution_id}")
             return True
             
         except redis.ConnectionError as e:
@@ -146,9 +149,11 @@ class RedisLogger:
                         "message": log_data
                     }
                     encoded_message = base64.b64encode(json.dumps(message).encode('utf-8'))
-                    result = self._client.lpush('logs', encoded_message)
+                    result = self._client.xadd(
+                        'logs', {'message': encoded_message}, maxlen=100000, approximate=True
+                    )
                     if debug:
-                        print(f"[REDIS-LOG] ✅ Redis lpush successful after reconnect! Result: {result}", flush=True)
+                        print(f"[REDIS-LOG] ✅ Redis xadd successful after reconnect! Entry: {result}", flush=True)
                     return True
                 except Exception as e2:
                     if debug:
@@ -164,6 +169,50 @@ class RedisLogger:
             output.error(f"Failed to send log to Redis: {e}")
             return False
     
+    def send_status(self, execution_id: str, status: str,
+                    exit_code: Optional[int] = None,
+                    error: Optional[str] = None) -> bool:
+        """
+        Publish a job status event to the 'jobstatus' stream.
+
+        Flat string fields, no json/base64 envelope - the backend reads
+        them in batches through a consumer group and applies many
+        callbacks per database session.
+
+        Returns:
+            True if published, False so the caller can fall back to the
+            HTTP status callback when Redis is unreachable
+        """
+        if not self._connected:
+            if not self.connect():
+                return False
+
+        fields = {'execution_id': execution_id, 'status': status}
+        if exit_code is not None:
+            fields['exit_code'] = str(exit_code)
+        if error:
+            fields['error'] = error
+
+        try:
+            self._client.xadd('jobstatus', fields, maxlen=10000, approximate=True)
+            return True
+
+        except redis.ConnectionError:
+            # Try reconnect once
+            output.warning("Redis connection lost, attempting reconnect...")
+            self._connected = False
+            if self.connect():
+                try:
+                    self._client.xadd('jobstatus', fields, maxlen=10000, approximate=True)
+                    return True
+                except Exception:
+                    return False
+            return False
+
+        except Exception as e:
+            output.error(f"Failed to send status to Redis: {e}")
+            return False
+
     def flush(self):
         """Flush any pending operations (no-op for Redis, kept for compatibility)"""
         pass
\ No newline at end of file
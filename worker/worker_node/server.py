@@ -299,6 +299,13 @@ class WorkerNode:
                             error: Optional[str] = None):
         """Notify backend of job status change"""
         try:
+            # Prefer the Redis jobstatus stream - the backend batch-applies
+            # events from it instead of handling one HTTP round-trip per
+            # state change. Fall back to HTTP when Redis is unreachable.
+            if self._redis_connected and self._redis_logger.send_status(
+                    execution_id, status, exit_code=exit_code, error=error):
+                return
+
             payload = {
                 "execution_id": execution_id,
                 "status": status